@@ -1,3 +1,31 @@
-from .positioner.positioner import Positioner
-from .amptek_mca.amptek_mca import AmptekMCA
-from .amptek_mca.multi_amptek_mca import MultiAmptekMCA
\ No newline at end of file
+# Standard libraries
+import importlib
+from typing import TYPE_CHECKING
+
+# Public classes are imported on first access (PEP 562), so that e.g. using
+# MultiAmptekMCA does not import pyserial, and vice versa.
+_LAZY_EXPORTS = {
+    "Positioner": ".positioner.positioner",
+    "AmptekMCA": ".amptek_mca.amptek_mca",
+    "MultiAmptekMCA": ".amptek_mca.multi_amptek_mca",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+if TYPE_CHECKING:
+    from .positioner.positioner import Positioner
+    from .amptek_mca.amptek_mca import AmptekMCA
+    from .amptek_mca.multi_amptek_mca import MultiAmptekMCA
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
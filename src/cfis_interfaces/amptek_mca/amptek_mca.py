@@ -1,11 +1,19 @@
 # Standard libraries
 import time
 import struct
-from typing import Optional, Tuple, Union, Dict, Any, List, OrderedDict as OrderedDictType
+import array
+import sys
+from typing import Optional, Tuple, Union, Dict, Any, List, Iterator, FrozenSet, NamedTuple, OrderedDict as OrderedDictType
 import math
 from collections import OrderedDict
 from pathlib import Path
 import logging
+import os
+import queue
+import threading
+import zlib
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
 # CFIS libraries
 from cfis_utils import UsbUtils, LoggerUtils, Spectrum
 # Third-party libraries
@@ -36,6 +44,25 @@ ACK_OK_FPGA_UPLOAD_ADDR = 0x0F
 ACK_FEATURE_NOT_SUPPORTED = 0x10
 ACK_CAL_DATA_NOT_PRESENT = 0x11
 
+# ACK error descriptions (PID2 of ACK packets)
+_ACK_MAP = {
+    ACK_SYNC_ERROR: "Sync Error",
+    ACK_PID_ERROR: "PID Error",
+    ACK_LEN_ERROR: "Length Error",
+    ACK_CHECKSUM_ERROR: "Checksum Error",
+    ACK_BAD_PARAMETER: "Bad Parameter",
+    ACK_BAD_HEX_RECORD: "Bad Hex Record",
+    ACK_UNRECOGNIZED_CMD: "Unrecognized Command",
+    ACK_FPGA_ERROR: "FPGA Error",
+    ACK_CP2201_NOT_FOUND: "Ethernet Controller Not Found",
+    ACK_SCOPE_DATA_NA: "Scope Data Not Available",
+    ACK_PC5_NOT_PRESENT: "PC5 Not Present",
+    ACK_BUSY: "Device Busy",
+    ACK_I2C_ERROR: "I2C Error",
+    ACK_FEATURE_NOT_SUPPORTED: "Feature Not Supported by FPGA",
+    ACK_CAL_DATA_NOT_PRESENT: "Calibration Data Not Present",
+}
+
 # Request Packet PIDs
 REQ_STATUS = (0x01, 0x01)
 REQ_SPECTRUM = (0x02, 0x01)
@@ -74,14 +101,530 @@ REQ_WRITE_IO = (0xF0, 0x08)
 REQ_WRITE_MISC_DATA = (0xF0, 0x09)
 REQ_COMM_TEST_ECHO = (0xF1, 0x7F)
 
+# All request PID pairs, used to precompute packet prefixes
+_REQUEST_PIDS = (
+    REQ_STATUS, REQ_SPECTRUM, REQ_SPECTRUM_CLEAR, REQ_SPECTRUM_STATUS, REQ_SPECTRUM_STATUS_CLEAR,
+    REQ_BUFFER_SPECTRUM, REQ_BUFFER_CLEAR_SPECTRUM, REQ_REQUEST_BUFFER, REQ_SCOPE_DATA,
+    REQ_MISC_DATA, REQ_SCOPE_DATA_REARM, REQ_ETHERNET_SETTINGS, REQ_DIAGNOSTIC_DATA,
+    REQ_NETFINDER_PACKET, REQ_I2C_TRANSFER, REQ_LIST_MODE_DATA, REQ_OPTION_PA_CAL,
+    REQ_MINIX_TUBE_INTERLOCK, REQ_MINIX_WARMUP_TABLE, REQ_MINIX_TIMESTAMP, REQ_MINIX_FAULT,
+    REQ_SCA_32BIT, REQ_SCA_32BIT_LATCH, REQ_SCA_32BIT_LATCH_CLEAR, REQ_TEXT_CONFIG,
+    REQ_TEXT_CONFIG_READBACK, REQ_TEXT_CONFIG_NO_SAVE, REQ_CLEAR_SPECTRUM, REQ_ENABLE_MCA,
+    REQ_DISABLE_MCA, REQ_ARM_SCOPE, REQ_AUTOSET_OFFSET, REQ_AUTOSET_FAST_THRESH, REQ_WRITE_IO,
+    REQ_WRITE_MISC_DATA, REQ_COMM_TEST_ECHO,
+)
+
 # Response Packet PIDs (PID1 indicates category)
 RESP_STATUS = (0x80, 0x01)
 RESP_MINIX_STATUS = (0x80, 0x02) # Mini-X2
 # PID1 = 0x81 -> Spectrum Data (PID2 varies by channel count/status)
+# Spectrum-only PID2 values: 1=256, 3=512, 5=1024, 7=2048, 9=4096, 0x0B(11)=8192 channels
+RESP_SPECTRUM_PID2_VALUES = frozenset((1, 3, 5, 7, 9, 11))
 # PID1 = 0x82 -> Other Data (Scope, Misc, Ethernet, Diag, Config, Netfinder, I2C, List, Cal, MiniX tables)
 # PID1 = 0x83 -> SCA Data
 RESP_COMM_TEST_ECHO = (0x8F, 0x7F)
 
+# Seconds a cached USB device list stays valid before the bus is scanned again
+DEVICE_LIST_TTL_SEC = 2.0
+
+_device_list_lock = threading.Lock()
+_device_list_cache: Optional[Tuple[float, Tuple[usb.core.Device, ...]]] = None
+
+
+# Environment variable enabling libusb debug output (any non-empty value)
+DEBUG_ENV_VAR = "CFIS_AMPTEK_DEBUG"
+# libusb log levels (enum libusb_log_level)
+_LIBUSB_LOG_LEVEL_NONE = 0
+_LIBUSB_LOG_LEVEL_DEBUG = 4
+
+
+def _configure_libusb_logging(backend) -> None:
+    """
+    Set the libusb log level of the backend context explicitly, once.
+
+    Logging is disabled (LIBUSB_LOG_LEVEL_NONE) unless CFIS_AMPTEK_DEBUG is set,
+    in which case full debug output is enabled. Backends that do not expose a
+    libusb context (e.g. libusb0, openusb) are left untouched.
+    """
+    lib = getattr(backend, 'lib', None)
+    ctx = getattr(backend, 'ctx', None)
+    set_debug = getattr(lib, 'libusb_set_debug', None) if lib is not None else None
+    if set_debug is None or ctx is None:
+        return
+    level = _LIBUSB_LOG_LEVEL_DEBUG if os.environ.get(DEBUG_ENV_VAR) else _LIBUSB_LOG_LEVEL_NONE
+    try:
+        # libusb_set_debug is used instead of the variadic libusb_set_option, which ctypes
+        # cannot call portably (e.g. on arm64 macOS)
+        set_debug(ctx, level)
+    except Exception:
+        pass
+
+
+@lru_cache(maxsize=1)
+def _get_usb_backend():
+    """
+    Return the process-wide libusb backend.
+
+    The backend (and its libusb context) is created once and shared by every
+    AmptekMCA / MultiAmptekMCA instance. Its libusb log level is configured on creation.
+    """
+    backend = UsbUtils.get_libusb_backend()
+    _configure_libusb_logging(backend)
+    return backend
+
+
+def _find_amptek_devices(max_age_sec: float = DEVICE_LIST_TTL_SEC) -> Tuple[usb.core.Device, ...]:
+    """
+    Return all connected devices matching the Amptek VID/PID.
+
+    The result of the bus scan is cached for max_age_sec seconds so that
+    back-to-back constructions/connections do not re-enumerate the bus.
+
+    Args:
+        max_age_sec: Maximum age of the cached list in seconds. Use 0 to force a rescan.
+
+    Returns:
+        Tuple of matching usb.core.Device objects, in enumeration order.
+    """
+    global _device_list_cache
+    with _device_list_lock:
+        now = time.monotonic()
+        if _device_list_cache is not None and now - _device_list_cache[0] < max_age_sec:
+            return _device_list_cache[1]
+        devices = tuple(usb.core.find(
+            find_all=True,
+            idVendor=AmptekMCA.VENDOR_ID,
+            idProduct=AmptekMCA.PRODUCT_ID,
+            backend=_get_usb_backend()
+        ))
+        _device_list_cache = (now, devices)
+        return devices
+
+
+# Parsed default configurations, shared by all instances: (files signature, configs)
+_default_config_lock = threading.Lock()
+_default_config_cache: Optional[Tuple[tuple, Dict[str, Dict[str, OrderedDictType[str, str]]]]] = None
+
+
+def _default_config_signature(config_files: List[Path]) -> tuple:
+    """
+    Build a cheap signature of the default configuration files (path, size and mtime of each).
+    Any added, removed or modified file changes the signature; the size also catches edits
+    within the mtime resolution of coarse filesystems.
+    """
+    signature = []
+    for config_file in config_files:
+        stat = config_file.stat()
+        signature.append((str(config_file), stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+def _copy_configs(configs: Dict[str, Dict[str, OrderedDictType[str, str]]]) -> Dict[str, Dict[str, OrderedDictType[str, str]]]:
+    """Return a copy of a nested configuration mapping so callers cannot alter the cache."""
+    return {device_type: {name: config.copy() for name, config in device_configs.items()}
+            for device_type, device_configs in configs.items()}
+
+
+def _cached_buffer(cache: Dict[int, array.array], size: int, max_entries: int) -> array.array:
+    """
+    Return the array.array('B') of length `size` stored in `cache`, creating it if needed.
+    The cache is emptied when it would grow beyond max_entries distinct sizes.
+    """
+    buf = cache.get(size)
+    if buf is None:
+        if len(cache) >= max_entries:
+            cache.clear()
+        buf = array.array('B', bytes(size))
+        cache[size] = buf
+    return buf
+
+
+# Precompiled packet/status field layouts
+_U16BE = struct.Struct('>H')     # Length and checksum fields
+# Whole 64-byte status packet, one field per item:
+#   0-11 fast/slow/GP counters, 12-15 acq time (byte 12: 1 ms, bytes 13-15: 100 ms/count),
+#   16-19 unused, 20-23 real time, 24 FW, 25 FPGA, 26-29 serial, 30-31 HV (MSB, LSB),
+#   32-33 detector temp, 34 board temp (signed), 35/36/38 flags, 37 FW build,
+#   39 device ID, 40-47 unused, 48 bootloader, 49-63 unused
+_STATUS = struct.Struct('<IIII4xIBBIBBBBbBBBBB8xB15x')
+
+# Bootloader version from status byte 48
+_BOOTLOADER_VERSIONS = {0xFF: "Original", 0x80: "7.00.00", 0x7F: "7.00.01"}
+
+# Per-command constant packet prefix (SYNC1, SYNC2, PID1, PID2) and its byte sum
+_CMD_PREFIX: Dict[Tuple[int, int], Tuple[bytes, int]] = {
+    pids: (bytes((SYNC_BYTE_1, SYNC_BYTE_2) + pids), SYNC_BYTE_1 + SYNC_BYTE_2 + pids[0] + pids[1])
+    for pids in _REQUEST_PIDS
+}
+
+# Complete request packets for commands sent without data (LEN=0); these never change.
+# Stored as array.array so they can be passed to the endpoint as-is (pyusb does not copy
+# array.array arguments); they are only ever read.
+_CANNED_PACKETS: Dict[Tuple[int, int], array.array] = {
+    pids: array.array('B', prefix + b'\x00\x00' + _U16BE.pack((-prefix_sum) & 0xFFFF))
+    for pids, (prefix, prefix_sum) in _CMD_PREFIX.items()
+}
+
+
+# Status flag bits as (flag name, source byte, mask, inverted).
+# Source byte index: 0 = status byte 35, 1 = byte 36, 2 = byte 38.
+_STATUS_FLAGS_COMMON = (
+    # Byte 36 Flags
+    # Bit 7: 0=locked, 1=searching. We expose a boolean 'locked'.
+    ('auto_input_offset_locked', 1, 0x80, True),
+    ('mcs_finished', 1, 0x40, False),
+    ('is_first_packet_since_reboot', 1, 0x20, False),
+    ('fpga_clock_80mhz', 1, 0x02, False),
+    ('fpga_clock_auto_selected', 1, 0x01, False),
+    # Byte 35 Common Flags (bit 6 depends on the device type)
+    ('preset_real_time_reached', 0, 0x80, False),
+    ('mca_enabled', 0, 0x20, False),
+    ('preset_counts_reached', 0, 0x10, False),
+    ('gate_active', 0, 0x08, False), # Note: Active low means stopping events
+    ('scope_data_ready', 0, 0x04, False),
+    ('unit_configured', 0, 0x02, False),
+    # D0 TBD (Byte 35)
+)
+
+
+@lru_cache(maxsize=32)
+def _status_flag_layout(device_id: str) -> Tuple[Tuple[str, int, int, bool], ...]:
+    """
+    Return the status flag table for a device type: the common flags followed by
+    the device-specific bits of bytes 38 and 35.
+    """
+    layout = list(_STATUS_FLAGS_COMMON)
+    # Byte 38, Bit 7: PC5/Jumper Status/Device OK
+    if device_id in ("DP5", "DP5G", "TB5"):
+        layout.append(('pc5_detected', 2, 0x80, False))
+    elif device_id == "PX5":
+        layout.append(('hv_jumper_ok', 2, 0x80, False)) # 0=Error, 1=Normal
+    # Byte 38, Bit 6: HV Polarity (Not applicable for DP5G/TB5/MCA8000D)
+    if device_id in ("DP5", "PX5", "DP5-X"):
+        layout.append(('hv_polarity_positive', 2, 0x40, False)) # False=Negative
+    # Byte 38, Bit 5: Preamp Supply Voltage (Not applicable for DP5G/TB5/DP5X/MCA8000D)
+    if device_id in ("DP5", "PX5"):
+        layout.append(('preamp_supply_8_5v', 2, 0x20, False)) # False means 5V
+    # Byte 35, Bit 6: preset live time reached on the MCA8000D, fast threshold locked otherwise
+    if device_id == "MCA8000D":
+        layout.append(('preset_livetime_reached', 0, 0x40, False))
+    else:
+        layout.append(('auto_fast_thresh_locked', 0, 0x40, False))
+    return tuple(layout)
+
+
+# ASCII lower- to upper-case translation table for command mnemonics
+_UPPER_TABLE = bytes.maketrans(b'abcdefghijklmnopqrstuvwxyz', b'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+
+def _ascii_upper(text: str) -> bytes:
+    """
+    Encode a command mnemonic to ASCII and convert it to upper case.
+
+    bytes.translate() is cheaper than str.upper() for ASCII text; str.upper() is
+    only used for non-ASCII input (which may still upper-case to ASCII).
+
+    Raises:
+        UnicodeEncodeError: If the upper-cased text is not ASCII.
+    """
+    try:
+        return text.encode('ascii').translate(_UPPER_TABLE)
+    except UnicodeEncodeError:
+        return text.upper().encode('ascii')
+
+
+# Chunk size for _byte_sum: 1 + 256 * 255 < 65521, so the Adler-32 "A" sum never wraps
+_ADLER_CHUNK = 256
+# Below this size the built-in sum() is faster than the zlib path (call overhead dominates)
+_SMALL_SUM_THRESHOLD = 128
+
+
+def _byte_sum(data: bytes) -> int:
+    """
+    Sum of all bytes of a buffer, computed in C.
+
+    The low 16 bits of zlib.adler32 hold 1 + sum(bytes) modulo 65521. For chunks of
+    at most 256 bytes the modulo never applies, so each chunk sum is exact.
+    Small buffers (headers, ACKs, short commands) use the built-in sum() instead.
+
+    Args:
+        data: Any bytes-like object.
+
+    Returns:
+        The plain (unbounded) sum of the bytes.
+    """
+    if len(data) < _SMALL_SUM_THRESHOLD:
+        return sum(data)
+    view = memoryview(data).cast('B')
+    total = 0
+    for start in range(0, len(view), _ADLER_CHUNK):
+        total += (zlib.adler32(view[start:start + _ADLER_CHUNK]) & 0xFFFF) - 1
+    return total
+
+
+# array typecode for unsigned 32-bit integers ('I' on all common platforms)
+_U32_TYPECODE = 'I' if array.array('I').itemsize == 4 else 'L'
+# Buffer formats holding native-order unsigned integers (the 4-byte itemsize is checked separately)
+_NATIVE_UINT_FORMATS = frozenset(prefix + code
+                                 for prefix in ('', '@', '=') + (('<',) if sys.byteorder == 'little' else ())
+                                 for code in ('I', 'L'))
+# Byte positions (low, mid, high, pad) of a 24-bit count inside a native 32-bit word
+_U24_OFFSETS = (0, 1, 2, 3) if sys.byteorder == 'little' else (3, 2, 1, 0)
+
+
+def _pad_spectrum(buf: bytes, n_channels: int, bytes_per_channel: int = 3) -> bytearray:
+    """
+    Widen little-endian channel counts of 2 or 3 bytes each to native 32-bit words.
+
+    Each byte lane is moved with one extended-slice copy between bytes/bytearray
+    objects (a tight C loop, several times faster than strided memoryview assignment),
+    so the cost does not depend on a per-channel Python loop. The unused high bytes
+    stay zero, so the result can be reinterpreted directly as uint32 values.
+
+    Args:
+        buf: Raw spectrum payload (exactly n_channels * bytes_per_channel bytes).
+        n_channels: Number of channels.
+        bytes_per_channel: Width of each count in bytes (2 or 3).
+
+    Returns:
+        bytearray of 4 * n_channels bytes in native uint32 layout.
+    """
+    src = buf if isinstance(buf, bytes) else bytes(buf)
+    padded = bytearray(4 * n_channels)
+    for lane in range(bytes_per_channel):
+        padded[_U24_OFFSETS[lane]::4] = src[lane::bytes_per_channel]
+    return padded
+
+
+def _decode_spectrum_into(data: bytes, out: memoryview) -> None:
+    """
+    Decode 24-bit little-endian channel counts into an existing 32-bit buffer.
+
+    Args:
+        data: Raw spectrum payload, 3 bytes per channel (length multiple of 3).
+        out: Writable byte view ('B' format) of exactly 4 bytes per channel.
+    """
+    out[:] = _pad_spectrum(data, len(data) // 3)
+
+
+def _decode_spectrum(buf: bytes, n_channels: int, bytes_per_channel: int = 3) -> array.array:
+    """
+    Decode little-endian channel counts of 2, 3 or 4 bytes each into a uint32 array.
+
+    Byte lanes are widened with _pad_spectrum, so the cost does not depend on a
+    per-channel Python loop. The result supports the buffer protocol, so e.g.
+    numpy.frombuffer() can wrap it without copying.
+
+    Args:
+        buf: Raw spectrum payload (at least n_channels * bytes_per_channel bytes).
+        n_channels: Number of channels to decode.
+        bytes_per_channel: Width of each count in bytes (2, 3 or 4).
+
+    Returns:
+        array.array of unsigned 32-bit channel counts.
+
+    Raises:
+        ValueError: If bytes_per_channel is not supported or buf is too short.
+    """
+    if bytes_per_channel not in (2, 3, 4):
+        raise ValueError(f"Unsupported bytes per channel: {bytes_per_channel}. Expected 2, 3 or 4.")
+    expected_len = n_channels * bytes_per_channel
+    src = memoryview(buf).cast('B')
+    if len(src) < expected_len:
+        raise ValueError(f"Spectrum buffer too short: expected {expected_len} bytes, got {len(src)}.")
+    src = src[:expected_len]
+    if bytes_per_channel == 4:
+        counts = array.array(_U32_TYPECODE, src.tobytes())
+        if sys.byteorder != 'little':
+            counts.byteswap()
+        return counts
+    counts = array.array(_U32_TYPECODE)
+    counts.frombytes(_pad_spectrum(src, n_channels, bytes_per_channel))
+    return counts
+
+
+def _invalidate_device_list_cache() -> None:
+    """Drop the cached USB device list so the next lookup rescans the bus."""
+    global _device_list_cache
+    with _device_list_lock:
+        _device_list_cache = None
+
+
+# Parameters and the devices that do not support them; parameters not listed are supported by all devices
+_UNSUPPORTED_DEVICES: Dict[str, Tuple[str, ...]] = {
+    'AINP': ('MCA8000D',),
+    'AU34': ('DP5', 'DP5X', 'MCA8000D', 'Mini-X2'),
+    'BLRD': ('MCA8000D',),
+    'BLRM': ('MCA8000D',),
+    'BLRU': ('MCA8000D',),
+    'BOOT': ('PX5', 'DP5G', 'MCA8000D', 'Mini-X2', 'TB-5', 'Gamma-Rad5'),
+    'CON1': ('DP5', 'DP5X', 'MCA8000D', 'Mini-X2'),
+    'CON2': ('DP5', 'DP5X', 'MCA8000D', 'Mini-X2'),
+    'CLCK': ('MCA8000D', 'Mini-X2'),
+    'CLKL': ('MCA8000D', 'Mini-X2'),
+    'CUSP': ('MCA8000D', 'Mini-X2'),
+    'DACF': ('MCA8000D', 'Mini-X2'),
+    'DACO': ('MCA8000D', 'Mini-X2'),
+    'GAIF': ('MCA8000D', 'Mini-X2'),
+    'GATE': ('PX5', 'DP5G', 'Mini-X2', 'TB-5', 'Gamma-Rad5'),
+    'HVSE': ('MCA8000D',),
+    'INOF': ('DP5G', 'MCA8000D', 'Mini-X2', 'TB-5', 'Gamma-Rad5'),
+    'INOG': ('DP5', 'DP5X', 'DP5G', 'MCA8000D', 'Mini-X2', 'TB-5', 'Gamma-Rad5'),
+    'PAPZ': ('DP5G', 'MCA8000D', 'DP5X', 'Mini-X2', 'TB-5', 'Gamma-Rad5'),
+    'PDMD': ('DP5X', 'Mini-X2'),
+    'PREL': ('DP5', 'PX5', 'DP5X', 'DP5G', 'Mini-X2', 'TB-5', 'Gamma-Rad5'),
+    'PURE': ('Mini-X2',),
+    'PURS': ('PX5', 'DP5G', 'MCA8000D', 'Mini-X2', 'TB-5', 'Gamma-Rad5'),
+    'RESL': ('MCA8000D', 'Mini-X2'),
+    'RTDD': ('MCA8000D', 'Mini-X2'),
+    'RTDE': ('MCA8000D', 'Mini-X2'),
+    'RTDS': ('MCA8000D', 'Mini-X2'),
+    'RTDT': ('MCA8000D', 'Mini-X2'),
+    'RTDW': ('MCA8000D', 'Mini-X2'),
+    'SCTC': ('DP5', 'PX5', 'DP5X', 'MCA8000D', 'Mini-X2'),
+    'SYNC': ('MCA8000D', 'Mini-X2'),
+    'TECS': ('DP5G', 'MCA8000D', 'DP5X', 'Mini-X2', 'TB-5', 'Gamma-Rad5'),
+    'TFLA': ('MCA8000D', 'Mini-X2'),
+    'THFA': ('MCA8000D', 'Mini-X2'),
+    'TPFA': ('MCA8000D', 'Mini-X2'),
+    'TPMO': ('MCA8000D', 'DP5X', 'Mini-X2'),
+    'VOLU': ('DP5', 'DP5G', 'MCA8000D', 'DP5X', 'Mini-X2', 'TB-5', 'Gamma-Rad5'),
+    'AUO2=STREAM': ('DP5X',),
+}
+
+
+@lru_cache(maxsize=32)
+def _unsupported_parameters(device_id: str) -> FrozenSet[str]:
+    """
+    Return the set of parameters not supported by a device type, derived once per
+    device from _UNSUPPORTED_DEVICES.
+    """
+    return frozenset(parameter for parameter, devices in _UNSUPPORTED_DEVICES.items() if device_id in devices)
+
+# Time presets and the status timer compared against them (used to predict when the MCA closes)
+_TIME_PRESET_STATUS_KEYS = {'PRET': 'acquisition_time_sec', 'PRER': 'real_time_sec'}
+
+# Metadata of the parameters whose info does not depend on the device:
+# name -> (type, doc, range, allowed values)
+_STATIC_PARAM_INFO: Dict[str, Tuple[str, str, Optional[tuple], Optional[tuple]]] = {
+    "MCAC": ("int", "Select Number of MCA Channels.", None, (256, 512, 1024, 2048, 4096, 8192)),
+    "MCST": ("float", "Sets the MCS Timebase in seconds (10ms precision).", (0.01, 655.35), None),
+    "PREC": ("(int, str)", "Preset Counts (0 to 2^32-1 or OFF).", (0, 4294967295), ("OFF",)),
+    "PRER": ("(float, str)", "Preset Real Time in seconds (precision 0.01s or 0.001s).", (0.0, 4294967.29), ("OFF",)),
+    "PRET": ("(float, str)", "Preset Acquisition Time in seconds (precision 0.1s).", (0.0, 99999999.9), ("OFF",)),
+    "TECS": ("(int, str)", "Sets Thermoelectric Cooler temperature setpoint in Kelvin.", (0, 299), ("OFF",)),
+    "VOLU": ("str", "Controls the speaker volume (PX5 only).", None, ("ON", "OFF")),
+}
+
+# GAIN range per device (the MCA8000D only allows two values)
+_GAIN_RANGES: Dict[str, Tuple[float, float]] = {
+    "DP5": (0.75, 150.0),
+    "PX5": (0.75, 500.0),
+    "DP5G": (1.0, 10.0),
+    "TB5": (1.0, 10.0),
+    "DP5-X": (2.67, 150.0),
+}
+
+# HVSE maximum magnitude (Volts) per (device, HPGe detector option)
+_HVSE_MAX_VOLTAGES: Dict[Tuple[str, bool], float] = {
+    ("DP5", False): 1500.0,
+    ("TB5", False): 1500.0,
+    ("PX5", False): 1500.0,
+    ("PX5", True): 5000.0,
+    ("DP5-X", False): 300.0,
+}
+# HVSE range per (device, positive polarity, HPGe detector option)
+_HVSE_RANGES: Dict[Tuple[str, bool, bool], Tuple[float, float]] = {
+    (device, is_positive, is_hpge): (0.0, max_v) if is_positive else (-max_v, 0.0)
+    for (device, is_hpge), max_v in _HVSE_MAX_VOLTAGES.items()
+    for is_positive in (True, False)
+}
+# Error reported when the HV polarity of a device with a known range cannot be determined
+_HVSE_POLARITY_ERRORS: Dict[str, str] = {
+    "DP5": "Could not determine PC5 polarity from status.",
+    "TB5": "Could not determine PC5 polarity from status.",
+    "PX5": "Could not determine PX5 HV polarity from status.",
+    "DP5-X": "Could not determine DP5-X HV polarity from status.",
+}
+
+# PAPS allowed values per device
+_PAPS_ALLOWED_VALUES: Dict[str, Tuple[str, ...]] = {
+    "DP5": ("8.5", "5", "OFF", "ON"),
+    "PX5": ("8.5", "5", "OFF"),
+}
+
+
+class _WaitStop:
+    """
+    Stop request for the cancellable waits (wait_until_mca_is_closed).
+
+    A request reaches the waits running when it is made and is cleared when the last
+    of them returns. With no wait running it is discarded, so it cannot cancel a wait
+    started later.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._active_waits = 0
+
+    def begin(self) -> None:
+        """Registers a starting wait."""
+        with self._lock:
+            self._active_waits += 1
+
+    def end(self) -> None:
+        """Unregisters a returning wait, clearing the request after the last one."""
+        with self._lock:
+            self._active_waits -= 1
+            if not self._active_waits:
+                self._event.clear()
+
+    def request(self) -> bool:
+        """Asks the running waits to stop. Returns False (and does nothing) if none is running."""
+        with self._lock:
+            if not self._active_waits:
+                return False
+            self._event.set()
+            return True
+
+    def wait(self, timeout: float) -> bool:
+        """Sleeps up to timeout seconds. Returns True if a stop was requested."""
+        return self._event.wait(timeout)
+
+    def is_set(self) -> bool:
+        """Returns True if a stop request is pending."""
+        return self._event.is_set()
+
+
+class AmptekStatus(NamedTuple):
+    """
+    Parsed contents of the 64-byte status packet.
+
+    A fixed-layout record (one tuple allocation, attribute access) returned by
+    AmptekMCA.get_status_record(). asdict() gives the dictionary returned by get_status().
+    """
+    fast_count: int
+    slow_count: int
+    gp_counter: int
+    acquisition_time_sec: float
+    real_time_sec: float
+    firmware_version: str
+    fpga_version: str
+    serial_number: int
+    hv: float
+    detector_temp_k: float
+    board_temp_c: int
+    device_id: str
+    status_flags: Dict[str, bool]
+    bootloader_version: str
+
+    def asdict(self) -> Dict[str, Any]:
+        """Returns the status as a dictionary, with its own copy of the flags dictionary."""
+        status_dict = self._asdict()
+        status_dict['status_flags'] = dict(self.status_flags)
+        return status_dict
+
 class AmptekMCAError(Exception):
     """Custom exception for Amptek PX5 errors."""
     pass
@@ -92,24 +635,8 @@ class AmptekMCAAckError(AmptekMCAError):
         self.pid1 = pid1
         self.pid2 = pid2
         self.data = data
-        ack_map = {
-            ACK_SYNC_ERROR: "Sync Error",
-            ACK_PID_ERROR: "PID Error",
-            ACK_LEN_ERROR: "Length Error",
-            ACK_CHECKSUM_ERROR: "Checksum Error",
-            ACK_BAD_PARAMETER: "Bad Parameter",
-            ACK_BAD_HEX_RECORD: "Bad Hex Record",
-            ACK_UNRECOGNIZED_CMD: "Unrecognized Command",
-            ACK_FPGA_ERROR: "FPGA Error",
-            ACK_CP2201_NOT_FOUND: "Ethernet Controller Not Found",
-            ACK_SCOPE_DATA_NA: "Scope Data Not Available",
-            ACK_PC5_NOT_PRESENT: "PC5 Not Present",
-            ACK_BUSY: "Device Busy",
-            ACK_I2C_ERROR: "I2C Error",
-            ACK_FEATURE_NOT_SUPPORTED: "Feature Not Supported by FPGA",
-            ACK_CAL_DATA_NOT_PRESENT: "Calibration Data Not Present",
-        }
-        error_message = ack_map.get(pid2, f"Unknown ACK Error (PID2={pid2})")
+        self.log_prefix = log_prefix
+        error_message = _ACK_MAP.get(pid2, f"Unknown ACK Error (PID2={pid2})")
         if data:
             try:
                 # Attempt to decode ASCII command echo for specific errors
@@ -120,7 +647,6 @@ class AmptekMCAAckError(AmptekMCAError):
 
         super().__init__(f"{log_prefix} ACK Error received: {error_message} (PID1={pid1}, PID2={pid2})")
 
-
 class AmptekMCA():
     """
     Class to control various Amptek MCA and related devices via USB using pyusb.
@@ -144,6 +670,13 @@ class AmptekMCA():
     DEFAULT_TIMEOUT = 2000
     # Longer timeout for potentially slow operations like diagnostics or spectrum reads
     LONG_TIMEOUT = 10000
+    # Largest response packet: 6-byte header + 32767 data bytes + 2-byte checksum
+    MAX_RESPONSE_SIZE = 32775
+    # Maximum number of distinct receive/transmit buffer sizes kept per instance
+    RX_BUFFER_CACHE_SIZE = 16
+    TX_BUFFER_CACHE_SIZE = 16
+    # Seconds that closing iter_spectrum_counts waits for its reader thread (see iter_spectrum_counts)
+    READER_STOP_TIMEOUT_SEC = 1.0
     # Device ID mapping from status byte 39
     DEVICE_ID_MAP = {
         0: "DP5",
@@ -158,7 +691,8 @@ class AmptekMCA():
                 logger: Optional[logging.Logger] = None,
                 logger_name: str = "AmptekMCA",
                 logger_level: int = logging.INFO,
-                device_index: Optional[int] = None
+                device_index: Optional[int] = None,
+                usb_device: Optional[usb.core.Device] = None
             ) -> None:
         """
         Initialize the Amptek MCA communication class.
@@ -169,6 +703,8 @@ class AmptekMCA():
             logger_name (str): The name of the new logger. Defaults to "AmptekMCA".
             logger_level (int): The logging level for the new logger. Defaults to logging.INFO.
             device_index (Optional[int]): Device index for multi-device setups. Used in log messages.
+            usb_device (Optional[usb.core.Device]): An already enumerated USB device to bind to.
+                                       If provided, connect() uses it directly instead of scanning the bus.
         """
         self.logger = logger if logger else LoggerUtils.get_logger(logger_name, level=logger_level)
         self.device_index = device_index
@@ -178,12 +714,30 @@ class AmptekMCA():
         self.ep_in: Optional[usb.core.Endpoint] = None
         self.last_status: Dict[str, Any] = {}
         self.model: str = None
+        self._usb_device: Optional[usb.core.Device] = usb_device
+        # Reusable USB receive/transmit buffers, keyed by transfer size
+        self._rx_buffers: Dict[int, array.array] = {}
+        self._tx_buffers: Dict[int, array.array] = {}
+        # Receive buffer large enough for any response, holding header and data contiguously
+        # (with a persistent view used for parsing, so no view is created per response)
+        self._rx_packet = array.array('B', bytes(self.MAX_RESPONSE_SIZE))
+        self._rx_packet_view = memoryview(self._rx_packet)
+        # Serializes request/response exchanges (see _transaction)
+        self._io_lock = threading.RLock()
+        # Single-worker executor for submit(), created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._executor_thread_id: Optional[int] = None
+        # Set by stop_wait() to cancel a running wait_until_mca_is_closed()
+        self._wait_stop = _WaitStop()
         self.logger.info(f"{self.log_prefix} Amptek MCA class initialized.")
 
     def connect(self, device_index: int = 0) -> None:
         """
         Find the Amptek MCA device and establish a USB connection.
         If multiple devices match VID/PID, connect to the one at device_index.
+        If the instance was created with a usb_device, that device is used directly
+        and the bus is not scanned again (device_index is ignored).
         Claims the interface and finds the IN and OUT endpoints.
         Calls get_status() to save the status for later use.
 
@@ -199,29 +753,31 @@ class AmptekMCA():
             self.logger.warning(f"{self.log_prefix} Already connected.")
             return
 
-        self.logger.info(f"{self.log_prefix} Searching for devices (VID={self.VENDOR_ID:#06x}, PID={self.PRODUCT_ID:#06x})...")
-
-        # Get the backend first
-        backend = UsbUtils.get_libusb_backend()
+        if self._usb_device is not None:
+            # Device already enumerated by the caller (e.g. MultiAmptekMCA), skip the bus scan
+            self.dev = self._usb_device
+            self.logger.info(f"{self.log_prefix} Using pre-enumerated device (Bus: {self.dev.bus}, Address: {self.dev.address}).")
+        else:
+            self.logger.info(f"{self.log_prefix} Searching for devices (VID={self.VENDOR_ID:#06x}, PID={self.PRODUCT_ID:#06x})...")
 
-        # Find *all* devices matching VID and PID
-        devices = list(usb.core.find(find_all=True, idVendor=self.VENDOR_ID,  idProduct=self.PRODUCT_ID, backend=backend))
+            # Find *all* devices matching VID and PID (shared backend, short-lived cache)
+            devices = _find_amptek_devices()
 
-        # Check if devices were found
-        if not devices:
-            self.logger.error(f"{self.log_prefix} No matching devices found.")
-            raise RuntimeError("No matching Amptek MCA devices found.")
+            # Check if devices were found
+            if not devices:
+                self.logger.error(f"{self.log_prefix} No matching devices found.")
+                raise RuntimeError("No matching Amptek MCA devices found.")
 
-        self.logger.info(f"{self.log_prefix} Found {len(devices)} matching device(s).")
+            self.logger.info(f"{self.log_prefix} Found {len(devices)} matching device(s).")
 
-        # Validate the index
-        if not (0 <= device_index < len(devices)):
-            self.logger.error(f"{self.log_prefix} Device index {device_index} is out of range (found {len(devices)} devices).")
-            raise ValueError(f"Device index {device_index} is out of range. Valid indices: 0 to {len(devices) - 1}.")
+            # Validate the index
+            if not (0 <= device_index < len(devices)):
+                self.logger.error(f"{self.log_prefix} Device index {device_index} is out of range (found {len(devices)} devices).")
+                raise ValueError(f"Device index {device_index} is out of range. Valid indices: 0 to {len(devices) - 1}.")
 
-        # Select the device using the index
-        self.dev = devices[device_index]
-        self.logger.info(f"{self.log_prefix} Selected device at index {device_index} (Bus: {self.dev.bus}, Address: {self.dev.address}).")
+            # Select the device using the index
+            self.dev = devices[device_index]
+            self.logger.info(f"{self.log_prefix} Selected device at index {device_index} (Bus: {self.dev.bus}, Address: {self.dev.address}).")
 
         if self.dev is None:
             self.logger.error(f"{self.log_prefix} Device not found.")
@@ -258,21 +814,10 @@ class AmptekMCA():
         # Find IN and OUT endpoints (based on Programmer's Guide EP1 IN, EP2 OUT)
         # EP1 IN -> Address 0x81
         # EP2 OUT -> Address 0x02
-        self.ep_in = usb.util.find_descriptor(
-            intf,
-            # Match the first IN endpoint
-            custom_match = \
-            lambda e: usb.util.endpoint_direction(e.bEndpointAddress) == \
-            usb.util.ENDPOINT_IN and e.bEndpointAddress == 0x81
-        )
-
-        self.ep_out = usb.util.find_descriptor(
-            intf,
-            # Match the first OUT endpoint
-            custom_match = \
-            lambda e: usb.util.endpoint_direction(e.bEndpointAddress) == \
-            usb.util.ENDPOINT_OUT and e.bEndpointAddress == 0x02
-        )
+        # The addresses are fixed, so look them up directly instead of matching each descriptor
+        endpoints = {ep.bEndpointAddress: ep for ep in intf.endpoints()}
+        self.ep_in = endpoints.get(0x81)
+        self.ep_out = endpoints.get(0x02)
 
         if self.ep_out is None or self.ep_in is None:
             self.logger.error(f"{self.log_prefix} Could not find IN or OUT endpoint.")
@@ -283,7 +828,9 @@ class AmptekMCA():
         self.logger.debug(f"{self.log_prefix} Found EP OUT address: {self.ep_out.bEndpointAddress:#04x}")
         self.logger.info(f"{self.log_prefix} Connection established.")
 
-        # Get the status after connecting
+        # Get the status after connecting (the model is cached from it; reset it in case
+        # this instance was previously connected to another device)
+        self.model = None
         self.logger.info(f"{self.log_prefix} Requesting initial status...")
         self.get_status()  # Error handling is done in get_status()
         self.logger.info(f"{self.log_prefix} Initial status received.")
@@ -292,35 +839,84 @@ class AmptekMCA():
     def disconnect(self) -> None:
         """
         Release the USB interface and close the device connection.
+        Commands queued with submit() are run to completion first.
         """
+        # Drain submit() before releasing the device, so queued commands still find it open
+        self._shutdown_executor()
         if self.dev is not None:
             self.logger.info(f"{self.log_prefix} Disconnecting...")
-            try:
-                usb.util.dispose_resources(self.dev)
-                self.logger.debug(f"{self.log_prefix} Disposed USB resources.")
-            except usb.core.USBError as e:
-                 self.logger.warning(f"{self.log_prefix} Error during disconnect/resource disposal: {e}")
-            except Exception as e:
-                 self.logger.error(f"{self.log_prefix} Unexpected error during disconnect: {e}")
-            finally:
-                self.dev = None
-                self.ep_in = None
-                self.ep_out = None
-                self.logger.info(f"{self.log_prefix} Disconnected.")
+            # Hold the I/O lock so no exchange (e.g. a streaming reader) runs while the device is released
+            with self._io_lock:
+                try:
+                    usb.util.dispose_resources(self.dev)
+                    self.logger.debug(f"{self.log_prefix} Disposed USB resources.")
+                except usb.core.USBError as e:
+                     self.logger.warning(f"{self.log_prefix} Error during disconnect/resource disposal: {e}")
+                except Exception as e:
+                     self.logger.error(f"{self.log_prefix} Unexpected error during disconnect: {e}")
+                finally:
+                    self.dev = None
+                    self.ep_in = None
+                    self.ep_out = None
+            self.logger.info(f"{self.log_prefix} Disconnected.")
         else:
             self.logger.info(f"{self.log_prefix} Already disconnected.")
 
-    def _calculate_checksum(self, packet_bytes: bytes) -> int:
+    def submit(self, method_name: str, *args, **kwargs) -> Future:
+        """
+        Runs a method of this instance on a per-device worker thread and returns immediately.
+
+        Commands submitted back-to-back are executed in order, one at a time, so the
+        caller can prepare the next command or process a previous result (e.g. parse a
+        spectrum) while the current USB exchange is in flight.
+
+        Example:
+            status_future = amptek.submit("get_status", silent=True)
+            spectrum_future = amptek.submit("get_spectrum")
+            status, spectrum = status_future.result(), spectrum_future.result()
+
+        Args:
+            method_name: Name of the AmptekMCA method to call (e.g. "get_status").
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            A concurrent.futures.Future with the method's return value (or exception).
+
+        Raises:
+            AttributeError: If the method does not exist.
+        """
+        method = getattr(self, method_name)
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"AmptekMCA-{self.device_index}")
+            return self._executor.submit(self._run_submitted, method, args, kwargs)
+
+    def _run_submitted(self, method, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        """Runs a submitted call on the submit() worker thread, recording the thread id."""
+        self._executor_thread_id = threading.get_ident()
+        return method(*args, **kwargs)
+
+    def _shutdown_executor(self) -> None:
+        """Waits for submitted commands to finish and stops the submit() worker thread."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            # Do not wait when called from the worker itself (e.g. a submitted disconnect)
+            executor.shutdown(wait=threading.get_ident() != self._executor_thread_id)
+
+    def _calculate_checksum(self, packet_bytes: Union[bytes, bytearray, memoryview]) -> int:
         """
         Calculates the 16-bit checksum for a given packet (excluding checksum bytes).
         Checksum is the two's complement of the 16-bit sum of all bytes prior
         to the checksum itself.
         Args:
-            packet_bytes: The bytes of the packet header and data (if any).
+            packet_bytes: The bytes of the packet header and data (if any). Any buffer
+                          object is accepted, e.g. a memoryview into a receive buffer.
         Returns:
             The 16-bit checksum value.
         """
-        current_sum = sum(packet_bytes)
+        current_sum = _byte_sum(packet_bytes)
         # Calculate two's complement for 16 bits
         checksum = (~current_sum + 1) & 0xFFFF
         return checksum
@@ -335,24 +931,49 @@ class AmptekMCA():
         Returns:
             The complete packet as bytes, including header and checksum.
         """
+        return self._build_request_packet_into(pid1, pid2, data).tobytes()
+
+    def _build_request_packet_into(self, pid1: int, pid2: int, data: Optional[Union[bytes, bytearray, memoryview]] = None) -> array.array:
+        """
+        Builds a request packet directly into the reusable transmit buffer of its size.
+        Header, data and checksum are written in place, so no intermediate bytes objects
+        are created and the buffer can be passed to the endpoint as-is.
+        Args:
+            pid1: Packet ID byte 1.
+            pid2: Packet ID byte 2.
+            data: Optional data payload for the packet.
+        Returns:
+            The transmit buffer holding the complete packet. It is reused by later requests.
+        """
         data_len = len(data) if data else 0
         if data_len > 512: # Max data size for request packets
              raise ValueError("Request data field cannot exceed 512 bytes.")
 
-        # Header: SYNC1, SYNC2, PID1, PID2, LEN_MSB, LEN_LSB
-        header = struct.pack('>BBBBH', SYNC_BYTE_1, SYNC_BYTE_2, pid1, pid2, data_len)
-
-        # Combine header and data for checksum calculation
-        packet_base = header + (data if data else b'')
-
-        # Calculate checksum
-        checksum = self._calculate_checksum(packet_base)
-
-        # Append checksum (MSB, LSB)
-        full_packet = packet_base + struct.pack('>H', checksum)
-        return full_packet
-
-    def _send_request(self, pid1: int, pid2: int, data: Optional[bytes] = None, timeout: Optional[int] = None) -> None:
+        # Constant part of the header (SYNC1, SYNC2, PID1, PID2) and its byte sum are precomputed per command
+        prefix_entry = _CMD_PREFIX.get((pid1, pid2))
+        if prefix_entry is None:
+            prefix = bytes((SYNC_BYTE_1, SYNC_BYTE_2, pid1, pid2))
+            prefix_sum = SYNC_BYTE_1 + SYNC_BYTE_2 + pid1 + pid2
+        else:
+            prefix, prefix_sum = prefix_entry
+
+        # Checksum: two's complement of the 16-bit sum of header (incl. LEN_MSB, LEN_LSB) and data
+        current_sum = prefix_sum + (data_len >> 8) + (data_len & 0xFF)
+        if data_len:
+            current_sum += _byte_sum(data)
+        checksum = (-current_sum) & 0xFFFF
+
+        # Header, data and checksum (MSB, LSB)
+        tx_buf = self._tx_buffer(data_len + 8)
+        tx_view = memoryview(tx_buf)
+        tx_view[:4] = prefix
+        _U16BE.pack_into(tx_buf, 4, data_len)
+        if data_len:
+            tx_view[6:6 + data_len] = data
+        _U16BE.pack_into(tx_buf, 6 + data_len, checksum)
+        return tx_buf
+
+    def _send_request(self, pid1: int, pid2: int, data: Optional[Union[bytes, bytearray, memoryview]] = None, timeout: Optional[int] = None) -> None:
         """
         Builds and sends a request packet to the device's OUT endpoint.
         Args:
@@ -367,16 +988,24 @@ class AmptekMCA():
         if not self.dev or not self.ep_out:
             raise AmptekMCAError("Not connected to the device.")
 
-        packet = self._build_request_packet(pid1, pid2, data)
+        # Packets are written from a reusable array.array: pyusb writes it as-is instead of allocating a converted copy
+        tx_buf = None if data else _CANNED_PACKETS.get((pid1, pid2))
+        if tx_buf is None:
+            tx_buf = self._build_request_packet_into(pid1, pid2, data)
+        packet_len = len(tx_buf)
         write_timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
+        # Per-packet debug messages (hex dumps) are only formatted when DEBUG is enabled
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
 
-        self.logger.debug(f"{self.log_prefix} Sending packet (PID1={pid1}, PID2={pid2}, LEN={len(data) if data else 0}): {packet.hex()}")
+        if log_debug:
+            self.logger.debug(f"{self.log_prefix} Sending packet (PID1={pid1}, PID2={pid2}, LEN={packet_len - 8}): {memoryview(tx_buf).hex()}")
 
         try:
-            bytes_written = self.ep_out.write(packet, timeout=write_timeout)
-            if bytes_written != len(packet):
-                 raise AmptekMCAError(f"USB write error: Tried to write {len(packet)} bytes, but wrote {bytes_written}.")
-            self.logger.debug(f"{self.log_prefix} Wrote {bytes_written} bytes.")
+            bytes_written = self.ep_out.write(tx_buf, timeout=write_timeout)
+            if bytes_written != packet_len:
+                 raise AmptekMCAError(f"USB write error: Tried to write {packet_len} bytes, but wrote {bytes_written}.")
+            if log_debug:
+                self.logger.debug(f"{self.log_prefix} Wrote {bytes_written} bytes.")
         except usb.core.USBTimeoutError:
             self.logger.error(f"{self.log_prefix} USB write timed out after {write_timeout}ms.")
             raise AmptekMCAError("USB write timed out.")
@@ -384,12 +1013,61 @@ class AmptekMCA():
             self.logger.error(f"{self.log_prefix} USB write error: {e}")
             raise AmptekMCAError(f"USB write failed: {e}")
 
-    def _read_response(self, timeout: Optional[int] = None) -> Tuple[int, int, Optional[bytes]]:
+    def _transaction(self, pid1: int, pid2: int, data: Optional[Union[bytes, bytearray, memoryview]] = None, read_timeout: Optional[int] = None, copy: bool = True) -> Tuple[int, int, Optional[Union[bytes, memoryview]]]:
+        """
+        Sends a request and reads its response as one atomic exchange.
+        The instance I/O lock is held for the whole exchange, so a request/response pair
+        issued from another thread (e.g. the iter_spectrum_counts reader) cannot interleave.
+        Args:
+            pid1: Packet ID byte 1.
+            pid2: Packet ID byte 2.
+            data: Optional data payload for the request.
+            read_timeout: Optional USB read timeout in milliseconds. Uses DEFAULT_TIMEOUT if None.
+            copy: Passed to _read_response. With copy=False the caller must hold _io_lock
+                  until it is done with the returned payload view.
+        Returns:
+            The (PID1, PID2, data_payload) tuple returned by _read_response.
+        Raises:
+            AmptekMCAError: If not connected or if the USB exchange fails.
+            AmptekMCAAckError: If the device returns an error ACK.
+        """
+        with self._io_lock:
+            self._send_request(pid1, pid2, data)
+            return self._read_response(timeout=read_timeout, copy=copy)
+
+    def _rx_buffer(self, size: int) -> array.array:
+        """
+        Returns a reusable receive buffer of exactly `size` bytes.
+        pyusb reads directly into an array.array, so reusing it avoids allocating
+        a new transfer buffer for every response (e.g. each spectrum read).
+        Args:
+            size: Buffer length in bytes (the number of bytes requested from the device).
+        Returns:
+            An array.array('B') of length `size`, owned by this instance.
+        """
+        return _cached_buffer(self._rx_buffers, size, self.RX_BUFFER_CACHE_SIZE)
+
+    def _tx_buffer(self, size: int) -> array.array:
+        """
+        Returns a reusable transmit buffer of exactly `size` bytes.
+        pyusb converts any non-array.array write argument into a new array, so writing
+        from a reused array.array avoids that allocation for every request.
+        Args:
+            size: Buffer length in bytes (the full request packet length).
+        Returns:
+            An array.array('B') of length `size`, owned by this instance.
+        """
+        return _cached_buffer(self._tx_buffers, size, self.TX_BUFFER_CACHE_SIZE)
+
+    def _read_response(self, timeout: Optional[int] = None, copy: bool = True) -> Tuple[int, int, Optional[Union[bytes, memoryview]]]:
         """
         Reads a response packet from the device's IN endpoint.
         Parses the header, reads data and checksum, validates the packet.
         Args:
             timeout: Optional USB read timeout in milliseconds. Uses DEFAULT_TIMEOUT if None.
+            copy: If True (default), data_payload is returned as bytes. If False, it is a
+                  read-only memoryview into the receive buffer, valid only until the next
+                  response is read; the caller must hold the I/O lock while using it.
         Returns:
             A tuple containing (PID1, PID2, data_payload). data_payload is None
             if the packet has no data field (LEN=0).
@@ -402,66 +1080,80 @@ class AmptekMCA():
             raise AmptekMCAError("Not connected to the device.")
 
         read_timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
-        header = b''
         data_payload = None
+        # Per-packet debug messages (hex dumps) are only formatted when DEBUG is enabled
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
 
         try:
-            # Read the 6-byte header first
-            # Max response size is 32775 bytes (header + data + checksum).
-            self.logger.debug(f"{self.log_prefix} Reading header (expecting 6 bytes...")
-
-            header = bytes(self.ep_in.read(6, timeout=read_timeout))
-            if len(header) < 6:
-                 raise AmptekMCAError(f"USB read error: Expected 6 header bytes, got {len(header)}.")
-
-            self.logger.debug(f"{self.log_prefix} Read header: {header.hex()}")
-
-            # Parse header
-            sync1, sync2, pid1, pid2, data_len = struct.unpack('>BBBBH', header)
-
-            # Validate sync bytes
-            if sync1 != SYNC_BYTE_1 or sync2 != SYNC_BYTE_2:
+            # Read the 6-byte header first, then exactly LEN + 2 bytes. Requesting more than the
+            # packet holds would block until the timeout whenever the response is a multiple of
+            # the endpoint packet size and the device sends no zero-length packet after it.
+            # Both parts are copied into the receive buffer, so header and data stay contiguous.
+            if log_debug:
+                self.logger.debug(f"{self.log_prefix} Reading header (expecting 6 bytes)...")
+
+            rx_buf = self._rx_packet
+            rx_view = self._rx_packet_view
+            header_buf = self._rx_buffer(6)
+            bytes_read = self.ep_in.read(header_buf, timeout=read_timeout)
+            if bytes_read < 6:
+                 raise AmptekMCAError(f"USB read error: Expected 6 header bytes, got {bytes_read}.")
+            rx_view[:6] = header_buf
+
+            if log_debug:
+                self.logger.debug(f"{self.log_prefix} Read header: {rx_view[:6].hex()}")
+
+            # Validate sync bytes, then parse the header by indexing the receive buffer
+            if rx_buf[0] != SYNC_BYTE_1 or rx_buf[1] != SYNC_BYTE_2:
+                sync1, sync2 = rx_buf[0], rx_buf[1]
                 self.logger.error(f"{self.log_prefix} Invalid sync bytes received: {sync1:#04x} {sync2:#04x}")
                 raise AmptekMCAError(f"Invalid sync bytes: Expected {SYNC_BYTE_1:#04x} {SYNC_BYTE_2:#04x}, got {sync1:#04x} {sync2:#04x}")
 
-            self.logger.debug(f"{self.log_prefix} Received packet header: PID1={pid1}, PID2={pid2}, LEN={data_len}")
+            pid1 = rx_buf[2]
+            pid2 = rx_buf[3]
+            data_len = (rx_buf[4] << 8) | rx_buf[5]
+
+            if log_debug:
+                self.logger.debug(f"{self.log_prefix} Received packet header: PID1={pid1}, PID2={pid2}, LEN={data_len}")
 
+            packet_len = 6 + data_len + 2
+            if packet_len > self.MAX_RESPONSE_SIZE:
+                # LEN comes from the device: a corrupt header must not index past the receive buffer
+                self.logger.error(f"{self.log_prefix} Invalid packet length in header: LEN={data_len}")
+                raise AmptekMCAError(f"Invalid packet length: LEN={data_len} exceeds the maximum response size ({self.MAX_RESPONSE_SIZE} bytes).")
             # Read data payload (if any) and checksum (2 bytes)
-            bytes_to_read = data_len + 2
-            full_response_data = b''
-            if bytes_to_read > 0:
+            remaining = data_len + 2
+            if log_debug:
                 self.logger.debug(f"{self.log_prefix} Reading data ({data_len} bytes) and checksum (2 bytes)...")
-                full_response_data = bytes(self.ep_in.read(bytes_to_read, timeout=read_timeout))
-
-                if len(full_response_data) < bytes_to_read:
-                    raise AmptekMCAError(f"USB read error: Expected {bytes_to_read} data+checksum bytes, got {len(full_response_data)}.")
-
-                self.logger.debug(f"{self.log_prefix} Read {len(full_response_data)} data+checksum bytes.")
-                if data_len > 0:
-                    data_payload = full_response_data[:data_len]
-                received_checksum = struct.unpack('>H', full_response_data[data_len:])[0]
-            else:
-                 # Read the checksum
-                 self.logger.debug(f"{self.log_prefix} Reading checksum (2 bytes) for LEN=0 packet...")
-                 checksum_bytes = bytes(self.ep_in.read(2, timeout=read_timeout))
-                 if len(checksum_bytes) < 2:
-                     raise AmptekMCAError(f"USB read error: Expected 2 checksum bytes, got {len(checksum_bytes)}.")
-                 received_checksum = struct.unpack('>H', checksum_bytes)[0]
-
-            # Validate checksum
-            packet_base = header + (data_payload if data_payload else b'')
-            calculated_checksum = self._calculate_checksum(packet_base)
+            body_buf = self._rx_buffer(remaining)
+            body_read = self.ep_in.read(body_buf, timeout=read_timeout)
+            if body_read < remaining:
+                raise AmptekMCAError(f"USB read error: Expected {remaining} data+checksum bytes, got {body_read}.")
+            rx_view[6:packet_len] = body_buf
+
+            if log_debug:
+                self.logger.debug(f"{self.log_prefix} Read {data_len + 2} data+checksum bytes.")
+            if data_len > 0:
+                data_payload = rx_view[6:6 + data_len].toreadonly()
+                if copy:
+                    data_payload = data_payload.tobytes()
+            received_checksum = _U16BE.unpack_from(rx_buf, 6 + data_len)[0]
+
+            # Validate checksum. Header and data are contiguous in the receive buffer,
+            # so they are summed in place without building a combined bytes object.
+            calculated_checksum = self._calculate_checksum(rx_view[:6 + data_len])
 
             if received_checksum != calculated_checksum:
                 self.logger.error(f"{self.log_prefix} Checksum error! Received={received_checksum:#06x}, Calculated={calculated_checksum:#06x}")
                 raise AmptekMCAError(f"Checksum mismatch: Received={received_checksum:#06x}, Calculated={calculated_checksum:#06x}")
 
-            self.logger.debug(f"{self.log_prefix} Checksum OK ({received_checksum:#06x}).")
+            if log_debug:
+                self.logger.debug(f"{self.log_prefix} Checksum OK ({received_checksum:#06x}).")
 
             # Check if it's an ACK Error packet (PID1 = 0xFF, PID2 != 0x00, 0x0C, 0x0F)
             if pid1 == 0xFF and pid2 not in [ACK_OK, ACK_OK_SHARING_REQ, ACK_OK_FPGA_UPLOAD_ADDR]:
                 self.logger.warning(f"{self.log_prefix} Received ACK Error: PID2={pid2}")
-                raise AmptekMCAAckError(pid1, pid2, data_payload, self.log_prefix)
+                raise AmptekMCAAckError(pid1, pid2, bytes(data_payload) if data_payload is not None else None, self.log_prefix)
 
             # Return PID1, PID2, and the data payload
             return pid1, pid2, data_payload
@@ -507,8 +1199,7 @@ class AmptekMCA():
         """
         silent_log = self.logger.debug if silent else self.logger.info
         silent_log(f"{self.log_prefix} Requesting status...")
-        self._send_request(REQ_STATUS[0], REQ_STATUS[1])
-        pid1, pid2, data = self._read_response()
+        pid1, pid2, data = self._transaction(*REQ_STATUS)
 
         if (pid1, pid2) != RESP_STATUS:
             # Could be Mini-X status or an unexpected response
@@ -528,7 +1219,7 @@ class AmptekMCA():
         """
         Requests the standard status packet and parses it into a dictionary.
 
-        It calls get_status_bytes internally and then interprets the fields.
+        It calls get_status_record internally and converts the result.
 
         Args:
             silent (bool): If True, all the .info messages are replaced with .debug.
@@ -541,99 +1232,108 @@ class AmptekMCA():
                             received data cannot be parsed correctly.
             AmptekMCAAckError: If the device returns an error ACK and warn_on_ack_errors is False.
         """
-        status_bytes = self._get_status_bytes(silent=silent)
-        self.logger.debug(f"{self.log_prefix} Parsing status bytes...")
-        status_dict: Dict[str, Any] = {}
+        status_dict = self.get_status_record(silent=silent).asdict()
+        self.last_status = status_dict # Save the status for later use
+        return status_dict
+
+    def get_status_record(self, silent: bool = False) -> AmptekStatus:
+        """
+        Requests the standard status packet and parses it into an AmptekStatus record.
+
+        Cheaper than get_status() for frequent polling, as no dictionary is built.
+        Note that it does not update last_status.
+
+        Args:
+            silent (bool): If True, all the .info messages are replaced with .debug.
+
+        Returns:
+            An AmptekStatus record with the parsed status information.
+
+        Raises:
+            AmptekMCAError: If connection or communication fails, or if the
+                            received data cannot be parsed correctly.
+            AmptekMCAAckError: If the device returns an error ACK and warn_on_ack_errors is False.
+        """
+        status = self._parse_status(self._get_status_bytes(silent=silent))
+        if self.model is None:
+            self.model = status.device_id  # Set model if not already set
+        return status
+
+    def _parse_status(self, status_bytes: bytes) -> AmptekStatus:
+        """
+        Parses the 64-byte status data payload.
+
+        Args:
+            status_bytes: The status data payload returned by _get_status_bytes.
+
+        Returns:
+            An AmptekStatus record.
+
+        Raises:
+            AmptekMCAError: If the data cannot be parsed correctly.
+        """
+        # Called on every status poll: skip building debug messages that would be dropped
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+        if log_debug:
+            self.logger.debug(f"{self.log_prefix} Parsing status bytes...")
 
         try:
-            # Parse counters and timers (assuming little-endian based on SN example)
-            status_dict['fast_count'] = struct.unpack('<I', status_bytes[0:4])[0]
-            status_dict['slow_count'] = struct.unpack('<I', status_bytes[4:8])[0]
-            status_dict['gp_counter'] = struct.unpack('<I', status_bytes[8:12])[0]
-            # Parse Acq Time: byte 12 (1ms/count) + bytes 13-15 (100ms/count)
-            status_dict['acquisition_time_sec'] = (struct.unpack('<I', bytes([status_bytes[13], status_bytes[14], status_bytes[15], 0]))[0] * 0.1) + (status_bytes[12] * 0.001)
-            # Real Time (1ms/count)
-            status_dict['real_time_sec'] = struct.unpack('<I', status_bytes[20:24])[0] * 0.001
-
-            # Parse versions and serial number
-            fw_major = (status_bytes[24] >> 4) & 0x0F
-            fw_minor = status_bytes[24] & 0x0F
-            fw_build = status_bytes[37] & 0x0F
-            status_dict['firmware_version'] = f"{fw_major}.{fw_minor:02d}.{fw_build:02d}"
-            fpga_major = (status_bytes[25] >> 4) & 0x0F
-            fpga_minor = status_bytes[25] & 0x0F
-            status_dict['fpga_version'] = f"{fpga_major}.{fpga_minor:02d}"
-            status_dict['serial_number'] = struct.unpack('<I', status_bytes[26:30])[0]
-
-            # HV (signed short, 0.5V/count, byte 30=MSB, byte 31=LSB -> Big Endian)
-            status_dict['hv'] = struct.unpack('>h', status_bytes[30:32])[0] * 0.5
-            # Parse Detector Temp (Bytes 32-33): 12-bit value = (byte32 & 0x0F) << 8 | byte33, scale 0.1K/count
-            detector_temp_value_12bit = ((status_bytes[32] & 0x0F) << 8) | status_bytes[33]
-            status_dict['detector_temp_k'] = detector_temp_value_12bit * 0.1
-            # Board Temp (signed byte, 1C/count)
-            status_dict['board_temp_c'] = struct.unpack('<b', bytes([status_bytes[34]]))[0]
+            # Unpack the whole packet at once (counters/timers are little-endian)
+            (fast_count, slow_count, gp_counter, acq_time_raw, real_time_ms,
+             fw_byte, fpga_byte, serial_number, hv_msb, hv_lsb, det_temp_hi, det_temp_lo,
+             board_temp, byte35, byte36, fw_build_byte, byte38, device_id_byte,
+             bootloader_byte) = _STATUS.unpack_from(status_bytes)
+
+            # Parse versions
+            fw_major = (fw_byte >> 4) & 0x0F
+            fw_minor = fw_byte & 0x0F
+            fw_build = fw_build_byte & 0x0F
+            fpga_major = (fpga_byte >> 4) & 0x0F
+            fpga_minor = fpga_byte & 0x0F
 
             # Parse device ID
-            status_dict['device_id'] = self.DEVICE_ID_MAP.get(status_bytes[39], f"Unknown ({status_bytes[39]})")
+            device_id = self.DEVICE_ID_MAP.get(device_id_byte)
+            if device_id is None:
+                device_id = f"Unknown ({device_id_byte})"
 
-            # Parse status flags from bytes 35, 36, and 38 into a single dictionary
-            byte35 = status_bytes[35]
-            byte36 = status_bytes[36]
-            byte38 = status_bytes[38]
-            # Get device type string determined earlier
-            device_id = status_dict.get('device_id', 'Unknown') # Default if not found
-
-            # Start with flags from byte 36 and common flags from byte 35
+            # Parse status flags from bytes 35, 36, and 38 into a single dictionary,
+            # using the flag table for this device type
+            flag_bytes = (byte35, byte36, byte38)
             flags = {
-                # Byte 36 Flags
-                # Bit 7: 0=locked, 1=searching. We expose a boolean 'locked'.
-                'auto_input_offset_locked': not bool(byte36 & 0x80),
-                'mcs_finished': bool(byte36 & 0x40),
-                'is_first_packet_since_reboot': bool(byte36 & 0x20),
-                'fpga_clock_80mhz': bool(byte36 & 0x02),
-                'fpga_clock_auto_selected': bool(byte36 & 0x01),
-                # Byte 35 Common Flags (excluding bit 6 for now)
-                'preset_real_time_reached': bool(byte35 & 0x80),
-                'mca_enabled': bool(byte35 & 0x20),
-                'preset_counts_reached': bool(byte35 & 0x10),
-                'gate_active': bool(byte35 & 0x08), # Note: Active low means stopping events
-                'scope_data_ready': bool(byte35 & 0x04),
-                'unit_configured': bool(byte35 & 0x02),
-                # D0 TBD (Byte 35)
+                name: bool(flag_bytes[source] & mask) != inverted
+                for name, source, mask, inverted in _status_flag_layout(device_id)
             }
 
-            # Add flags from byte 38 based on device type
-            # Bit 7: PC5/Jumper Status/Device OK
-            if device_id in ["DP5", "DP5G", "TB5"]:
-                flags['pc5_detected'] = bool(byte38 & 0x80)
-            elif device_id == "PX5":
-                flags['hv_jumper_ok'] = bool(byte38 & 0x80) # 0=Error, 1=Normal
-
-            # Bit 6: HV Polarity (Not applicable for DP5G/TB5/MCA8000D)
-            if device_id in ["DP5", "PX5", "DP5-X"]:
-                flags['hv_polarity_positive'] = bool(byte38 & 0x40) # False=Negative
-
-            # Bit 5: Preamp Supply Voltage (Not applicable for DP5G/TB5/DP5X/MCA8000D)
-            if device_id in ["DP5", "PX5"]:
-                flags['preamp_supply_8_5v'] = bool(byte38 & 0x20) # False means 5V
-
-            # Handle byte 35, bit 6 (0x40) based on device type
-            # Bit 6: 0=not locked, 1=locked. We expose a boolean 'locked'.
-            bit6_value = bool(byte35 & 0x40)
-            if device_id == "MCA8000D":
-                flags['preset_livetime_reached'] = bit6_value
-            else:
-                # Default interpretation for non-MCA8000D devices
-                flags['auto_fast_thresh_locked'] = bit6_value
-
-            # Assign the completed flags dictionary
-            status_dict['status_flags'] = flags
-
-            # Parse Bootloader version (Byte 48)
-            bl_ver_map = {0xFF: "Original", 0x80: "7.00.00", 0x7F: "7.00.01"}
-            status_dict['bootloader_version'] = bl_ver_map.get(status_bytes[48], f"Unknown ({status_bytes[48]:#04x})")
+            # HV (signed short, byte 30=MSB, byte 31=LSB -> Big Endian)
+            hv_raw = (hv_msb << 8) | hv_lsb
+            if hv_raw & 0x8000:
+                hv_raw -= 0x10000
+
+            status = AmptekStatus(
+                fast_count=fast_count,
+                slow_count=slow_count,
+                gp_counter=gp_counter,
+                # Parse Acq Time: byte 12 (1ms/count) + bytes 13-15 (100ms/count)
+                acquisition_time_sec=((acq_time_raw >> 8) * 0.1) + ((acq_time_raw & 0xFF) * 0.001),
+                # Real Time (1ms/count)
+                real_time_sec=real_time_ms * 0.001,
+                firmware_version=f"{fw_major}.{fw_minor:02d}.{fw_build:02d}",
+                fpga_version=f"{fpga_major}.{fpga_minor:02d}",
+                serial_number=serial_number,
+                # HV (0.5V/count)
+                hv=hv_raw * 0.5,
+                # Parse Detector Temp (Bytes 32-33): 12-bit value = (byte32 & 0x0F) << 8 | byte33, scale 0.1K/count
+                detector_temp_k=(((det_temp_hi & 0x0F) << 8) | det_temp_lo) * 0.1,
+                # Board Temp (signed byte, 1C/count)
+                board_temp_c=board_temp,
+                device_id=device_id,
+                status_flags=flags,
+                # Parse Bootloader version (Byte 48)
+                bootloader_version=_BOOTLOADER_VERSIONS.get(bootloader_byte, f"Unknown ({bootloader_byte:#04x})"),
+            )
 
-            self.logger.debug(f"{self.log_prefix} Status parsed successfully.")
+            if log_debug:
+                self.logger.debug(f"{self.log_prefix} Status parsed successfully.")
 
         except struct.error as e:
             self.logger.error(f"{self.log_prefix} Failed to unpack status bytes: {e}")
@@ -647,11 +1347,7 @@ class AmptekMCA():
             self.logger.error(f"{self.log_prefix} Unexpected error parsing status: {e}")
             raise AmptekMCAError(f"Unexpected error parsing status: {e}")
 
-        self.last_status = status_dict # Save the status for later use
-        if self.model is None:
-            self.model = status_dict.get('device_id', 'Unknown')  # Set model if not already set
-
-        return status_dict
+        return status
 
     def get_last_status(self) -> Dict[str, Any]:
         """
@@ -670,20 +1366,27 @@ class AmptekMCA():
         Returns the model of the connected device.
         If no model has been set yet, returns 'Unknown'.
 
+        The model is cached from the first status read after connect(), so no USB
+        transfer is made.
+
         Returns:
             The model string of the connected device.
         """
         return self.model if self.model else 'Unknown'
 
-    def _get_spectrum_bytes(self) -> bytes:
+    def _get_spectrum_bytes(self, copy: bool = True) -> Union[bytes, memoryview]:
         """
         Requests and returns the raw spectrum data from the MCA device.
 
         Note: The number of bytes returned depends on the number of channels configured
         on the device (e.g., 256ch * 3 bytes/ch = 768 bytes).
 
+        Args:
+            copy: If False, returns a read-only view into the receive buffer instead of
+                  bytes (no copy). The caller must hold _io_lock while using the view.
+
         Returns:
-            The raw spectrum data payload as bytes.
+            The raw spectrum data payload as bytes (or memoryview if copy is False).
 
         Raises:
             AmptekMCAError: If connection or communication fails, or if an
@@ -691,18 +1394,16 @@ class AmptekMCA():
             AmptekMCAAckError: If the device returns an error ACK and warn_on_ack_errors is False.
         """
         self.logger.info(f"{self.log_prefix} Requesting spectrum bytes...")
-        # Send the Request Spectrum command (PID1=2, PID2=1)
-        self._send_request(REQ_SPECTRUM[0], REQ_SPECTRUM[1])
-        # Read the response, which should be a spectrum packet (PID1=0x81)
+        # Send the Request Spectrum command (PID1=2, PID2=1) and read the response,
+        # which should be a spectrum packet (PID1=0x81)
         # Use a longer timeout as spectrum reads can be large/slow
-        pid1, pid2, data = self._read_response(timeout=self.LONG_TIMEOUT)
+        pid1, pid2, data = self._transaction(*REQ_SPECTRUM, read_timeout=self.LONG_TIMEOUT, copy=copy)
 
         # Check if the response is a spectrum packet (PID1=0x81)
         # PID2 indicates channel count for spectrum-only responses:
         # 1=256, 3=512, 5=1024, 7=2048, 9=4096, 0x0B(11)=8192
-        expected_pid2_values = {1, 3, 5, 7, 9, 11}
-        if pid1 != 0x81 or pid2 not in expected_pid2_values:
-             raise AmptekMCAError(f"Unexpected response packet received for Get Spectrum: PID1={pid1:#04x}, PID2={pid2:#04x}. Expected PID1=0x81, PID2 in {expected_pid2_values}.")
+        if pid1 != 0x81 or pid2 not in RESP_SPECTRUM_PID2_VALUES:
+             raise AmptekMCAError(f"Unexpected response packet received for Get Spectrum: PID1={pid1:#04x}, PID2={pid2:#04x}. Expected PID1=0x81, PID2 in {set(RESP_SPECTRUM_PID2_VALUES)}.")
 
         if data is None:
              # This shouldn't happen for a valid spectrum response, but check anyway
@@ -715,9 +1416,8 @@ class AmptekMCA():
         """
         Requests spectrum data and parses it into a Spectrum object.
 
-        Calls get_spectrum_bytes internally and processes the raw byte data.
-        Each channel count is represented by 3 bytes (24-bit unsigned integer),
-        interpreted as little-endian.
+        Calls get_spectrum_counts internally and adds the status and acquisition
+        parameters as metadata.
 
         Returns:
             A Spectrum object containing the parsed counts.
@@ -727,35 +1427,7 @@ class AmptekMCA():
                             received spectrum data is invalid.
             AmptekMCAAckError: If the device returns an error ACK.
         """
-        spectrum_bytes = self._get_spectrum_bytes()
-        self.logger.debug(f"{self.log_prefix} Parsing spectrum bytes...")
-
-        if len(spectrum_bytes) % 3 != 0:
-            self.logger.error(f"{self.log_prefix} Invalid spectrum data length ({len(spectrum_bytes)} bytes), not divisible by 3.")
-            raise AmptekMCAError("Invalid spectrum data length received.")
-
-        num_channels = len(spectrum_bytes) // 3
-        spectrum_counts = []
-
-        try:
-            # Iterate through the bytes, 3 at a time
-            for i in range(0, len(spectrum_bytes), 3):
-                # Extract 3 bytes for the channel count (LSB, Mid, MSB)
-                chunk = spectrum_bytes[i:i+3]
-                # Pad with a zero byte to unpack as a 4-byte unsigned integer (<I)
-                count_bytes = bytes([chunk[0], chunk[1], chunk[2], 0])
-                # Unpack as little-endian unsigned 32-bit int (value is 24-bit)
-                count = struct.unpack('<I', count_bytes)[0]
-                spectrum_counts.append(count)
-
-            self.logger.debug(f"{self.log_prefix} Spectrum parsed successfully ({num_channels} channels).")
-
-        except struct.error as e:
-            self.logger.error(f"{self.log_prefix} Failed to unpack spectrum bytes: {e}")
-            raise AmptekMCAError(f"Failed to parse spectrum data structure: {e}")
-        except Exception as e:
-            self.logger.error(f"{self.log_prefix} Unexpected error parsing spectrum: {e}")
-            raise AmptekMCAError(f"Unexpected error parsing spectrum: {e}")
+        spectrum_counts = self.get_spectrum_counts().tolist()
 
         # Get status
         status = self.get_status(silent=True)
@@ -780,6 +1452,170 @@ class AmptekMCA():
         # Return
         return spectrum
 
+    def get_spectrum_counts(self) -> array.array:
+        """
+        Requests spectrum data and returns only the decoded channel counts.
+
+        Each channel count is represented by 3 bytes (24-bit unsigned integer),
+        interpreted as little-endian. Unlike get_spectrum(), no status or configuration
+        is read and no Spectrum object is built, so this is the cheaper call for
+        frequent polling. The returned array supports the buffer protocol, so
+        e.g. numpy.frombuffer(counts, dtype=numpy.uint32) wraps it without copying.
+
+        Returns:
+            array.array of unsigned 32-bit channel counts.
+
+        Raises:
+            AmptekMCAError: If connection or communication fails, or if the
+                            received spectrum data is invalid.
+            AmptekMCAAckError: If the device returns an error ACK.
+        """
+        # Decode straight from the receive buffer; the lock keeps it from being overwritten meanwhile
+        with self._io_lock:
+            spectrum_bytes = self._get_spectrum_bytes(copy=False)
+            self.logger.debug(f"{self.log_prefix} Parsing spectrum bytes...")
+
+            if len(spectrum_bytes) % 3 != 0:
+                self.logger.error(f"{self.log_prefix} Invalid spectrum data length ({len(spectrum_bytes)} bytes), not divisible by 3.")
+                raise AmptekMCAError("Invalid spectrum data length received.")
+
+            num_channels = len(spectrum_bytes) // 3
+
+            try:
+                # Decode all 3-byte little-endian counts in one pass
+                spectrum_counts = _decode_spectrum(spectrum_bytes, num_channels)
+            except Exception as e:
+                self.logger.error(f"{self.log_prefix} Unexpected error parsing spectrum: {e}")
+                raise AmptekMCAError(f"Unexpected error parsing spectrum: {e}")
+
+        self.logger.debug(f"{self.log_prefix} Spectrum parsed successfully ({num_channels} channels).")
+        return spectrum_counts
+
+    def get_spectrum_into(self, out: Any) -> int:
+        """
+        Requests spectrum data and decodes the channel counts into a caller-provided buffer.
+
+        Meant for acquisition loops that poll the spectrum repeatedly: the same output
+        buffer (e.g. an array.array('I') or a numpy uint32 array) can be reused on every
+        call, so no new counts object is allocated per spectrum.
+
+        Args:
+            out: Writable, C-contiguous buffer of native unsigned 32-bit items (format 'I'
+                 or 'L') with room for at least as many items as the device has channels.
+                 Items beyond the number of channels are left untouched.
+
+        Returns:
+            The number of channels written to out.
+
+        Raises:
+            ValueError: If out is not a writable, C-contiguous buffer of unsigned 32-bit
+                        items or is too small for the spectrum.
+            AmptekMCAError: If connection or communication fails, or if the
+                            received spectrum data is invalid.
+            AmptekMCAAckError: If the device returns an error ACK.
+        """
+        out_view = memoryview(out)
+        if (out_view.readonly or not out_view.c_contiguous or out_view.itemsize != 4
+                or out_view.format not in _NATIVE_UINT_FORMATS):
+            raise ValueError(f"Output buffer must be a writable, C-contiguous buffer of unsigned 32-bit items (got format '{out_view.format}', itemsize {out_view.itemsize}).")
+        out_view = out_view.cast('B')
+
+        # Decode straight from the receive buffer; the lock keeps it from being overwritten meanwhile
+        with self._io_lock:
+            spectrum_bytes = self._get_spectrum_bytes(copy=False)
+
+            if len(spectrum_bytes) % 3 != 0:
+                self.logger.error(f"{self.log_prefix} Invalid spectrum data length ({len(spectrum_bytes)} bytes), not divisible by 3.")
+                raise AmptekMCAError("Invalid spectrum data length received.")
+
+            num_channels = len(spectrum_bytes) // 3
+            if out_view.nbytes < 4 * num_channels:
+                raise ValueError(f"Output buffer too small: {num_channels} channels received, room for {out_view.nbytes // 4}.")
+
+            _decode_spectrum_into(spectrum_bytes, out_view[:4 * num_channels])
+
+        self.logger.debug(f"{self.log_prefix} Spectrum decoded into output buffer ({num_channels} channels).")
+        return num_channels
+
+    def iter_spectrum_counts(self, max_spectra: Optional[int] = None, interval_sec: float = 0.0) -> Iterator[memoryview]:
+        """
+        Streams spectrum counts, reading the next spectrum while the caller processes the current one.
+
+        A background thread reads and decodes spectra into three rotating buffers: while the
+        caller holds one buffer, the next one may already be decoded and the third is being
+        filled by the next USB transfer. Only the raw counts are read (no status/configuration
+        metadata as in get_spectrum()).
+
+        Each yielded view is only valid until the next iteration step; copy it (e.g. with
+        .tolist()) to keep it. Closing the generator (or leaving the for loop) stops the reader.
+        Closing waits at most READER_STOP_TIMEOUT_SEC for the reader; a transfer still in
+        flight then completes in the background, and the next request to the device waits
+        for it (the reader holds the I/O lock during the transfer).
+
+        Args:
+            max_spectra: Number of spectra to read. None streams until the generator is closed.
+            interval_sec: Minimum time in seconds between successive spectrum reads (default 0).
+
+        Yields:
+            Read-only memoryview (format 'I') of the channel counts.
+
+        Raises:
+            AmptekMCAError: If connection or communication fails in the reader.
+            AmptekMCAAckError: If the device returns an error ACK.
+        """
+        buffers: List[Optional[array.array]] = [None, None, None]
+        free_slots = queue.Queue()   # slot indices the reader may fill (None = stop)
+        ready_slots = queue.Queue()  # (slot, None) when filled, (None, error/None) when done
+        stop_event = threading.Event()
+        for slot in range(len(buffers)):
+            free_slots.put(slot)
+
+        def _reader() -> None:
+            produced = 0
+            try:
+                while not stop_event.is_set() and (max_spectra is None or produced < max_spectra):
+                    slot = free_slots.get()
+                    if slot is None or stop_event.is_set():
+                        break
+                    with self._io_lock:
+                        data = self._get_spectrum_bytes(copy=False)
+                        num_channels = len(data) // 3
+                        buf = buffers[slot]
+                        if buf is None or len(buf) != num_channels:
+                            buf = buffers[slot] = array.array(_U32_TYPECODE, bytes(4 * num_channels))
+                        _decode_spectrum_into(data, memoryview(buf).cast('B'))
+                    ready_slots.put((slot, None))
+                    produced += 1
+                    if interval_sec > 0:
+                        stop_event.wait(interval_sec)
+            except BaseException as e:
+                ready_slots.put((None, e))
+                return
+            ready_slots.put((None, None))
+
+        reader = threading.Thread(target=_reader, name=f"AmptekMCA-{self.device_index}-reader", daemon=True)
+        reader.start()
+        current: Optional[int] = None
+        try:
+            while True:
+                if current is not None:
+                    free_slots.put(current)
+                    current = None
+                slot, error = ready_slots.get()
+                if slot is None:
+                    if error is not None:
+                        raise error
+                    return
+                current = slot
+                yield memoryview(buffers[slot]).toreadonly()
+        finally:
+            stop_event.set()
+            free_slots.put(None)
+            # The reader may be blocked in a spectrum read (up to LONG_TIMEOUT), so do not wait for it indefinitely
+            reader.join(timeout=self.READER_STOP_TIMEOUT_SEC)
+            if reader.is_alive():
+                self.logger.debug(f"{self.log_prefix} Spectrum reader still busy with a transfer; it will stop when the transfer ends.")
+
     def send_configuration(self, config_dict: Dict[str, Any], save_to_flash: bool = False) -> None:
         """
         Formats a configuration dictionary into ASCII command strings, splits them
@@ -809,37 +1645,79 @@ class AmptekMCA():
         """
         self.logger.info(f"{self.log_prefix} Formatting and Sending Configuration (Save={save_to_flash})...")
 
-        # 1. Format all commands into individual byte strings (CMD=VAL;)
+        # 1-2. Format the commands and split them into packet payloads
+        packet_payloads = self._build_configuration_payloads(config_dict)
+
+        # 3. Send the list of payloads
+        if not packet_payloads:
+            self.logger.info(f"{self.log_prefix} No configuration packets to send.")
+            return
+
+        self.logger.info(f"{self.log_prefix} Sending {len(packet_payloads)} configuration packet(s)...")
+        num_packets = len(packet_payloads)
+
+        for i, payload in enumerate(packet_payloads):
+            is_last_packet = (i == num_packets - 1)
+
+            # Determine PID: Use NO_SAVE for intermediate, final based on flag
+            if is_last_packet:
+                pid1, pid2 = REQ_TEXT_CONFIG if save_to_flash else REQ_TEXT_CONFIG_NO_SAVE
+                log_save_status = f"(Save={save_to_flash})"
+            else:
+                pid1, pid2 = REQ_TEXT_CONFIG_NO_SAVE
+                log_save_status = "(Save=False - Intermediate)"
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"{self.log_prefix} Sending packet #{i+1}/{num_packets} ({len(payload)} bytes) {log_save_status}...")
+            # Send and wait for ACK for each packet
+            try:
+                self._transaction(pid1, pid2, payload, read_timeout=self.LONG_TIMEOUT) # Raises error on failure
+            except AmptekMCAError:
+                # Name the packet (and thus the commands) that was rejected; earlier packets were applied
+                commands = ', '.join(part.split('=', 1)[0] for part in bytes(payload).decode('ascii', errors='replace').split(';') if part)
+                self.logger.error(f"{self.log_prefix} Configuration packet #{i+1}/{num_packets} failed (commands: {commands}).")
+                raise
+            if save_to_flash and is_last_packet:
+                # Only the final packet writes to flash; intermediate packets are no-save
+                time.sleep(0.2) # Small delay to allow device to process
+
+        self.logger.info(f"{self.log_prefix} Configuration sent successfully in {num_packets} packet(s).")
+
+    def _build_configuration_payloads(self, config_dict: Dict[str, Any]) -> Tuple[bytes, ...]:
+        """
+        Formats a configuration dictionary into ASCII command strings (CMD=VAL;) and
+        splits them into packet payloads of at most 512 bytes. A RESC=Y command, if
+        present, is placed first.
+
+        Args:
+            config_dict: Configuration dictionary as passed to send_configuration.
+
+        Returns:
+            Tuple of packet data payloads (each <= 512 bytes).
+
+        Raises:
+            ValueError: If any single formatted command exceeds 512 bytes or
+                        if dictionary values cannot be converted to string.
+        """
+        # 1. Format all commands into individual byte strings (CMD=VAL;) in a single pass.
+        # The first RESC command (case-insensitive) is separated if it requests a reset.
         encoded_parts: List[bytes] = []
         reset_command_bytes: Optional[bytes] = None
-        temp_config_dict = config_dict.copy() # Avoid modifying original dict
-
-        # Check for RESC command case-insensitively and separate it
-        resc_key = None
-        for k in temp_config_dict:
-            if str(k).upper() == 'RESC':
-                resc_key = k
-                break
-
-        if resc_key:
-            resc_val_str = str(temp_config_dict[resc_key]).upper()
-            if resc_val_str in ['Y', 'YES', 'TRUE', '1']:
-                try:
-                    reset_command_bytes = f"RESC={resc_val_str};".encode('ascii')
-                    if len(reset_command_bytes) > 512:
-                         raise ValueError("RESC=Y; command format exceeds 512 bytes (unexpected).")
-                    del temp_config_dict[resc_key] # Remove from main processing list
-                    self.logger.debug(f"{self.log_prefix} RESC=Y command identified.")
-                except UnicodeEncodeError:
-                     raise ValueError("RESC command value contains non-ASCII characters.")
-
-        # Format remaining commands
-        for key, value in temp_config_dict.items():
+        resc_checked = False
+
+        for key, value in config_dict.items():
             try:
-                part_str = f"{str(key).upper()}={str(value)};"
-                part_bytes = part_str.encode('ascii')
+                key_bytes = _ascii_upper(str(key))
+                if not resc_checked and key_bytes == b'RESC':
+                    resc_checked = True
+                    resc_val_str = str(value).upper()
+                    if resc_val_str in ['Y', 'YES', 'TRUE', '1']:
+                        reset_command_bytes = b'RESC=' + resc_val_str.encode('ascii') + b';'
+                        self.logger.debug(f"{self.log_prefix} RESC=Y command identified.")
+                        continue
+                part_bytes = key_bytes + b'=' + str(value).encode('ascii') + b';'
                 if len(part_bytes) > 512:
-                    raise ValueError(f"Single configuration command '{part_str}' is longer than 512 bytes.")
+                    raise ValueError(f"Single configuration command '{part_bytes.decode('ascii')}' is longer than 512 bytes.")
                 encoded_parts.append(part_bytes)
             except UnicodeEncodeError:
                 raise ValueError(f"Configuration key '{key}' or value '{value}' contains non-ASCII characters.")
@@ -847,8 +1725,9 @@ class AmptekMCA():
                  raise ValueError(f"Could not format configuration parameter for key '{key}': {e}")
 
         # 2. Build the list of packet data payloads (chunks <= 512 bytes)
+        # Parts are appended to a growable bytearray; bytes are only created once per packet
         packet_payloads: List[bytes] = []
-        current_payload = b''
+        current_payload = bytearray()
 
         # Add RESC first if it exists
         if reset_command_bytes:
@@ -862,43 +1741,17 @@ class AmptekMCA():
             else:
                 # Add the completed payload to the list (if it's not empty)
                 if current_payload:
-                    packet_payloads.append(current_payload)
+                    packet_payloads.append(bytes(current_payload))
                 # Start the new payload with the current part
-                current_payload = part_bytes
+                current_payload = bytearray(part_bytes)
 
         # Add the last payload if it contains any data
         if current_payload:
-            packet_payloads.append(current_payload)
+            packet_payloads.append(bytes(current_payload))
 
-        # 3. Send the list of payloads
-        if not packet_payloads:
-            self.logger.info(f"{self.log_prefix} No configuration packets to send.")
-            return
-
-        self.logger.info(f"{self.log_prefix} Sending {len(packet_payloads)} configuration packet(s)...")
-        num_packets = len(packet_payloads)
-
-        for i, payload in enumerate(packet_payloads):
-            is_last_packet = (i == num_packets - 1)
-
-            # Determine PID: Use NO_SAVE for intermediate, final based on flag
-            if is_last_packet:
-                pid1, pid2 = REQ_TEXT_CONFIG if save_to_flash else REQ_TEXT_CONFIG_NO_SAVE
-                log_save_status = f"(Save={save_to_flash})"
-            else:
-                pid1, pid2 = REQ_TEXT_CONFIG_NO_SAVE
-                log_save_status = "(Save=False - Intermediate)"
-
-            self.logger.debug(f"{self.log_prefix} Sending packet #{i+1}/{num_packets} ({len(payload)} bytes) {log_save_status}...")
-            self._send_request(pid1, pid2, payload)
-            # Wait for ACK for each packet
-            self._read_response(timeout=self.LONG_TIMEOUT) # Raises error on failure
-            if save_to_flash:
-                time.sleep(0.2) # Small delay to allow device to process
+        return tuple(packet_payloads)
 
-        self.logger.info(f"{self.log_prefix} Configuration sent successfully in {num_packets} packet(s).")
-
-    def _read_configuration_bytes(self, commands_to_read: List[str]) -> bytes:
+    def _read_configuration_bytes(self, commands_to_read: List[str], copy: bool = True) -> Union[bytes, memoryview]:
         """
         Requests a readback of specified configuration commands from the device.
 
@@ -910,9 +1763,12 @@ class AmptekMCA():
                               4-character command mnemonic (e.g., ['TPEA', 'GAIN'])
                               or includes parameters if required (e.g., ['SCAI=1', 'SCAL']).
                               Case-insensitive, will be converted to uppercase.
+            copy: If False, returns a read-only view into the receive buffer instead of
+                  bytes (no copy). The caller must hold _io_lock while using the view.
 
         Returns:
-            The raw response data payload as bytes (ASCII encoded string like "CMD1=VAL1;CMD2=VAL2;").
+            The raw response data payload as bytes (ASCII encoded string like "CMD1=VAL1;CMD2=VAL2;"),
+            or memoryview if copy is False.
 
         Raises:
             AmptekMCAError: If connection or communication fails, or if an
@@ -923,29 +1779,26 @@ class AmptekMCA():
         """
         if not commands_to_read:
             self.logger.warning(f"{self.log_prefix} No commands provided for configuration readback.")
-            return b''
+            return b'' if copy else memoryview(b'')
 
         self.logger.info(f"{self.log_prefix} Requesting text configuration readback...")
 
         # Format the list into the template string: CMD1;CMD2;SCAI=1;SCAL;
         # Commands are converted to uppercase. Add trailing semicolon.
-        template_string = ";".join([cmd.upper() for cmd in commands_to_read]) + ";"
-        self.logger.debug(f"{self.log_prefix} Readback template string: {template_string}")
-
         try:
-            template_bytes = template_string.encode('ascii')
+            template_bytes = b";".join([_ascii_upper(cmd) for cmd in commands_to_read]) + b";"
         except UnicodeEncodeError:
              raise ValueError("Command list contains non-ASCII characters.")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"{self.log_prefix} Readback template string: {template_bytes.decode('ascii')}")
 
         if len(template_bytes) > 512:
              raise ValueError(f"Formatted readback template string exceeds maximum length of 512 bytes ({len(template_bytes)} bytes).")
 
         # Send the Readback Request
         pid1_req, pid2_req = REQ_TEXT_CONFIG_READBACK
-        self._send_request(pid1_req, pid2_req, template_bytes)
-
         # Read the response (PID1=0x82, PID2=7 expected)
-        pid1_resp, pid2_resp, data = self._read_response(timeout=self.DEFAULT_TIMEOUT)
+        pid1_resp, pid2_resp, data = self._transaction(pid1_req, pid2_req, template_bytes, read_timeout=self.DEFAULT_TIMEOUT, copy=copy)
 
         # Check response PID
         if pid1_resp != 0x82 or pid2_resp != 7:
@@ -958,6 +1811,33 @@ class AmptekMCA():
         self.logger.info(f"{self.log_prefix} Raw configuration readback bytes received successfully ({len(data)} bytes).")
         return data
 
+    def read_configuration_view(self, commands_to_read: List[str]) -> memoryview:
+        """
+        Requests a readback of specified configuration commands and returns the raw
+        response as a read-only memoryview into the receive buffer (no copy).
+
+        Useful for parsers that slice or search the response themselves. The view is
+        only valid until the next request to the device, which overwrites the buffer;
+        call bytes() on it to keep the data.
+
+        Args:
+            commands_to_read: A list of strings, where each string is a
+                              4-character command mnemonic (e.g., ['TPEA', 'GAIN'])
+                              or includes parameters if required (e.g., ['SCAI=1', 'SCAL']).
+                              Case-insensitive, will be converted to uppercase.
+
+        Returns:
+            A memoryview over the ASCII response ("CMD1=VAL1;CMD2=VAL2;").
+
+        Raises:
+            AmptekMCAError: If connection or communication fails, or if an
+                            unexpected response packet is received.
+            AmptekMCAAckError: If the device returns an error ACK.
+            ValueError: If the formatted template string exceeds 512 bytes or
+                        contains non-ASCII characters.
+        """
+        return self._read_configuration_bytes(commands_to_read, copy=False)
+
     def read_configuration(self, commands_to_read: List[str]) -> Dict[str, str]:
         """
         Requests and parses the readback of specified configuration commands.
@@ -986,23 +1866,19 @@ class AmptekMCA():
 
         readback_dict: Dict[str, str] = {}
         try:
-            # Decode the response bytes (should be ASCII)
-            response_string = response_bytes.decode('ascii')
-            self.logger.debug(f"{self.log_prefix} Decoded response string: {response_string}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"{self.log_prefix} Decoded response string: {response_bytes.decode('ascii', errors='replace')}")
 
-            # Split the response string by semicolon and parse each part
-            parts = response_string.split(';')
-            for part in parts:
+            # Split the response by semicolon and parse each part at the bytes level;
+            # only the resulting commands and values are decoded (should be ASCII)
+            for part in response_bytes.split(b';'):
                 part = part.strip() # Remove leading/trailing whitespace if any
                 if not part:
                     continue # Skip empty parts resulting from split
 
                 # Split CMD=VAL, handle cases where '=' might be missing or value is empty
-                command_value = part.split('=', 1)
-                command = command_value[0] # Command is always the first part
-                value = command_value[1] if len(command_value) > 1 else "" # Value is the rest, or empty string
-
-                readback_dict[command] = value # Store value as string
+                command, _, value = part.partition(b'=')
+                readback_dict[command.decode('ascii')] = value.decode('ascii') # Store value as string
 
             self.logger.debug(f"{self.log_prefix} Configuration readback parsed successfully.")
 
@@ -1026,13 +1902,10 @@ class AmptekMCA():
             AmptekMCAAckError: If the device returns an error ACK instead of ACK OK.
         """
         self.logger.info(f"{self.log_prefix} Sending Clear Spectrum command...")
-        # Send the Clear Spectrum command (PID 0xF0, 0x01)
-        self._send_request(REQ_CLEAR_SPECTRUM[0], REQ_CLEAR_SPECTRUM[1])
-
-        # Wait for the ACK OK response
+        # Send the Clear Spectrum command (PID 0xF0, 0x01) and wait for the ACK OK response
         # _read_response will raise AmptekMCAAckError for error ACKs
         # or AmptekMCAError for communication issues.
-        pid1, pid2, _ = self._read_response(timeout=self.DEFAULT_TIMEOUT)
+        pid1, pid2, _ = self._transaction(*REQ_CLEAR_SPECTRUM, read_timeout=self.DEFAULT_TIMEOUT)
 
         # Verify it was specifically ACK_OK, although _read_response handles errors
         if not (pid1 == 0xFF and pid2 == ACK_OK):
@@ -1049,8 +1922,7 @@ class AmptekMCA():
             AmptekMCAAckError: If the device returns an error ACK.
         """
         self.logger.info(f"{self.log_prefix} Sending Enable MCA command...")
-        self._send_request(REQ_ENABLE_MCA[0], REQ_ENABLE_MCA[1])
-        pid1, pid2, _ = self._read_response() # Expecting ACK
+        pid1, pid2, _ = self._transaction(*REQ_ENABLE_MCA) # Expecting ACK
 
         if pid1 != 0xFF or pid2 != ACK_OK:
             raise AmptekMCAError(f"Unexpected response received for Enable MCA: PID1={pid1}, PID2={pid2}")
@@ -1065,8 +1937,7 @@ class AmptekMCA():
             AmptekMCAAckError: If the device returns an error ACK.
         """
         self.logger.info(f"{self.log_prefix} Sending Disable MCA command...")
-        self._send_request(REQ_DISABLE_MCA[0], REQ_DISABLE_MCA[1])
-        pid1, pid2, _ = self._read_response() # Expecting ACK
+        pid1, pid2, _ = self._transaction(*REQ_DISABLE_MCA) # Expecting ACK
 
         if pid1 != 0xFF or pid2 != ACK_OK:
             raise AmptekMCAError(f"Unexpected response received for Disable MCA: PID1={pid1}, PID2={pid2}")
@@ -1090,13 +1961,10 @@ class AmptekMCA():
             AmptekMCAAckError: If the device returns an error ACK instead of ACK OK.
         """
         self.logger.info(f"{self.log_prefix} Sending Autoset Input Offset command...")
-        # Send the Autoset Input Offset command (PID 0xF0, 0x05)
-        self._send_request(REQ_AUTOSET_OFFSET[0], REQ_AUTOSET_OFFSET[1])
-
-        # Wait for the ACK OK response
+        # Send the Autoset Input Offset command (PID 0xF0, 0x05) and wait for the ACK OK response
         # _read_response will raise AmptekMCAAckError for error ACKs
         # or AmptekMCAError for communication issues.
-        pid1, pid2, _ = self._read_response(timeout=self.DEFAULT_TIMEOUT)
+        pid1, pid2, _ = self._transaction(*REQ_AUTOSET_OFFSET, read_timeout=self.DEFAULT_TIMEOUT)
 
         # Verify it was specifically ACK_OK
         if not (pid1 == 0xFF and pid2 == ACK_OK):
@@ -1124,13 +1992,10 @@ class AmptekMCA():
             AmptekMCAAckError: If the device returns an error ACK instead of ACK OK.
         """
         self.logger.info(f"{self.log_prefix} Sending Autoset Fast Threshold command...")
-        # Send the Autoset Fast Threshold command (PID 0xF0, 0x06)
-        self._send_request(REQ_AUTOSET_FAST_THRESH[0], REQ_AUTOSET_FAST_THRESH[1])
-
-        # Wait for the ACK OK response
+        # Send the Autoset Fast Threshold command (PID 0xF0, 0x06) and wait for the ACK OK response
         # _read_response will raise AmptekMCAAckError for error ACKs
         # or AmptekMCAError for communication issues.
-        pid1, pid2, _ = self._read_response(timeout=self.DEFAULT_TIMEOUT)
+        pid1, pid2, _ = self._transaction(*REQ_AUTOSET_FAST_THRESH, read_timeout=self.DEFAULT_TIMEOUT)
 
         # Verify it was specifically ACK_OK
         if not (pid1 == 0xFF and pid2 == ACK_OK):
@@ -1232,12 +2097,14 @@ class AmptekMCA():
             # Not yet locked; wait
             time.sleep(time_between_checks)
 
-    def _echo_test_bytes(self, data_to_echo: bytes) -> bytes:
+    def _echo_test_bytes(self, data_to_echo: Union[bytes, bytearray, memoryview]) -> bytes:
         """
         Sends raw byte data to the device's echo command and returns the raw echoed bytes.
 
         Args:
-            data_to_echo: The bytes to send. Max length 512.
+            data_to_echo: The bytes to send, or any C-contiguous object supporting the
+                          buffer protocol (bytearray, memoryview, numpy array), which is
+                          sent without copying. Max length 512 bytes.
 
         Returns:
             The raw byte data echoed back by the device.
@@ -1247,22 +2114,23 @@ class AmptekMCA():
             AmptekMCAAckError: If the device returns an error ACK.
             ValueError: If data_to_echo exceeds 512 bytes.
         """
-        if len(data_to_echo) > 512:
+        # Flat byte view of the input: sizes are in bytes whatever the item type, and no copy is made
+        echo_view = memoryview(data_to_echo).cast('B')
+        if echo_view.nbytes > 512:
              raise ValueError("Echo data cannot exceed 512 bytes.")
 
-        self.logger.info(f"{self.log_prefix} Sending Echo Test with {len(data_to_echo)} bytes...")
-        # Send Echo command (PID 0xF1, 0x7F)
-        self._send_request(REQ_COMM_TEST_ECHO[0], REQ_COMM_TEST_ECHO[1], data_to_echo)
-        # Read Echo response (PID 0x8F, 0x7F)
-        pid1, pid2, data = self._read_response()
+        self.logger.info(f"{self.log_prefix} Sending Echo Test with {echo_view.nbytes} bytes...")
+        # Send Echo command (PID 0xF1, 0x7F) and read Echo response (PID 0x8F, 0x7F)
+        pid1, pid2, data = self._transaction(*REQ_COMM_TEST_ECHO, echo_view)
 
         # Validate response PID
         if (pid1, pid2) != RESP_COMM_TEST_ECHO:
              raise AmptekMCAError(f"Unexpected response packet received for Echo Test: PID1={pid1:#04x}, PID2={pid2:#04x}")
 
         # Check if received data matches sent data
-        if data != data_to_echo:
-             self.logger.error(f"{self.log_prefix} Echo mismatch! Sent: {data_to_echo.hex()}, Received: {data.hex() if data else 'None'}")
+        if echo_view != data:
+             if self.logger.isEnabledFor(logging.ERROR):
+                 self.logger.error(f"{self.log_prefix} Echo mismatch! Sent: {echo_view.hex()}, Received: {data.hex() if data else 'None'}")
              raise AmptekMCAError("Echo data mismatch.")
 
         # Ensure data is not None before returning
@@ -1306,6 +2174,87 @@ class AmptekMCA():
             self.logger.error(f"{self.log_prefix} Failed to decode echoed bytes using {encoding}: {e}")
             raise AmptekMCAError(f"Failed to decode echoed response using {encoding}: {e}")
 
+    def _fill_static_param_info(self, param_name: str, info: Dict[str, Any], context: Dict[str, Any]) -> None:
+        """Fills the metadata of a parameter whose info does not depend on the device."""
+        type_name, doc, value_range, allowed_values = _STATIC_PARAM_INFO[param_name]
+        info["type"] = type_name
+        info["doc"] = doc
+        info["range"] = value_range
+        info["allowed_values"] = list(allowed_values) if allowed_values is not None else None
+
+    def _fill_gain_info(self, param_name: str, info: Dict[str, Any], context: Dict[str, Any]) -> None:
+        """Fills the GAIN metadata, whose range depends on the device."""
+        info["type"] = "float"
+        info["doc"] = "Sets the total gain (analog * fine)."
+        device_id_str = context["device_id"]
+        if device_id_str == "MCA8000D":
+            info["allowed_values"], info["supported"] = [1.0, 10.0], True
+        elif device_id_str in _GAIN_RANGES:
+            info["range"], info["supported"] = _GAIN_RANGES[device_id_str], True
+        else:
+            info["error"] = "Range unknown for this device."
+
+    def _fill_hvse_info(self, param_name: str, info: Dict[str, Any], context: Dict[str, Any]) -> None:
+        """Fills the HVSE metadata, whose range depends on the device and the HV polarity."""
+        info["type"] = "(float, str)"
+        info["doc"] = "Sets High Voltage supply value (Volts)."
+        info["allowed_values"] = ["OFF"]
+        info["supported"] = False
+
+        # Only supported devices with a known HV range need the polarity: skip the status fetch otherwise
+        device_id_str = context["device_id"]
+        if not context["supported"] or device_id_str not in _HVSE_POLARITY_ERRORS:
+            return
+
+        internal_status = context["status"]
+        if internal_status is None: # Fetch status if not already done
+            self.logger.debug(f"{self.log_prefix} Fetching status to determine HV polarity for {param_name} range...")
+            try:
+                internal_status = self.get_last_status()
+            except (AmptekMCAError, AmptekMCAAckError) as e:
+                self.logger.warning(f"{self.log_prefix} Could not fetch status for HV polarity check: {e}")
+                internal_status = {}
+            context["status"] = internal_status
+
+        is_positive = internal_status.get('status_flags', {}).get('hv_polarity_positive')
+        is_hpge = device_id_str == "PX5" and internal_status.get('px5_options_42', {}).get('option_code') == 1
+        hv_range = _HVSE_RANGES.get((device_id_str, is_positive, is_hpge))
+        if hv_range is None:
+            info["error"] = _HVSE_POLARITY_ERRORS[device_id_str]
+
+        info["range"] = hv_range
+
+    def _fill_mcs_threshold_info(self, param_name: str, info: Dict[str, Any], context: Dict[str, Any]) -> None:
+        """Fills the MCSL/MCSH metadata, whose range depends on the number of channels."""
+        info["type"] = "int"
+        info["doc"] = f"Sets {'Low' if param_name == 'MCSL' else 'High'} Threshold for MCS."
+        max_ch = int(context["mcac"]) - 1
+        info["range"] = (0, max_ch)
+
+    def _fill_paps_info(self, param_name: str, info: Dict[str, Any], context: Dict[str, Any]) -> None:
+        """Fills the PAPS metadata, whose allowed values depend on the device."""
+        info["type"] = "(str, float)"
+        info["doc"] = "Controls Preamp Power Supplies."
+        allowed_values = _PAPS_ALLOWED_VALUES.get(context["device_id"])
+        if allowed_values is not None:
+            info["allowed_values"] = list(allowed_values)
+
+    # Parameter name -> method filling its metadata in get_parameters_info
+    _PARAM_INFO_FILLERS = {
+        "GAIN": _fill_gain_info,
+        "HVSE": _fill_hvse_info,
+        "MCSL": _fill_mcs_threshold_info,
+        "MCSH": _fill_mcs_threshold_info,
+        "PAPS": _fill_paps_info,
+        "MCAC": _fill_static_param_info,
+        "MCST": _fill_static_param_info,
+        "PREC": _fill_static_param_info,
+        "PRER": _fill_static_param_info,
+        "PRET": _fill_static_param_info,
+        "TECS": _fill_static_param_info,
+        "VOLU": _fill_static_param_info,
+    }
+
     def get_parameters_info(self,
                            param_names: Union[str, List[str]],
                            required_params: Optional[Dict[str, Any]] = None
@@ -1337,7 +2286,6 @@ class AmptekMCA():
             }
         """
         param_info_result: Dict[str, Dict[str, Any]] = {}
-        internal_status: Optional[Dict[str, Any]] = None # To store status 
         mcac_val_str: Optional[str] = None # To store MCAC value, needed for MCSL/MCSH range
 
         # 1. Determine Device ID
@@ -1364,6 +2312,9 @@ class AmptekMCA():
         if not mcac_val_str:
             mcac_val_str = "1024"
 
+        # Values shared by the per-parameter fillers; the status is fetched on first use
+        context: Dict[str, Any] = {"device_id": device_id_str, "mcac": mcac_val_str, "status": None, "supported": False}
+
         # 4. Process each requested parameter using internal logic
         for param_name in param_names_list:
             info: Dict[str, Any] = {
@@ -1375,112 +2326,20 @@ class AmptekMCA():
                 "error": None
             }
 
-            # --- Internal Logic per Parameter ---
-            if param_name == "GAIN":
-                info["type"] = "float"
-                info["doc"] = "Sets the total gain (analog * fine)."
-                if device_id_str == "DP5": info["range"], info["supported"] = (0.75, 150.0), True
-                elif device_id_str == "PX5": info["range"], info["supported"] = (0.75, 500.0), True
-                elif device_id_str in ["DP5G", "TB5"]: info["range"], info["supported"] = (1.0, 10.0), True
-                elif device_id_str == "MCA8000D": info["allowed_values"], info["type"], info["supported"] = [1.0, 10.0], "float", True
-                elif device_id_str == "DP5-X": info["range"], info["supported"] = (2.67, 150.0), True
-                else: info["error"] = "Range unknown for this device."
-
-            elif param_name == "HVSE":
-                info["type"] = "(float, str)"
-                info["doc"] = "Sets High Voltage supply value (Volts)."
-                info["allowed_values"] = ["OFF"]
-                info["supported"] = False
-                hv_range = None
-
-                if internal_status is None: # Fetch status if not already done
-                    self.logger.debug(f"{self.log_prefix} Fetching status to determine HV polarity for {param_name} range...")
-                    try:
-                        internal_status = self.get_last_status()
-                    except (AmptekMCAError, AmptekMCAAckError) as e:
-                         self.logger.warning(f"{self.log_prefix} Could not fetch status for HV polarity check: {e}")
-                         internal_status = {}
-
-                is_positive = internal_status.get('status_flags', {}).get('hv_polarity_positive')
-
-                if device_id_str in ["DP5", "TB5"]:
-                    if is_positive is True: hv_range = (0.0, 1500.0)
-                    elif is_positive is False: hv_range = (-1500.0, 0.0)
-                    else: info["error"] = "Could not determine PC5 polarity from status."
-
-                elif device_id_str == "PX5":
-                    is_hpge = internal_status.get('px5_options_42', {}).get('option_code') == 1
-                    max_v = 5000.0 if is_hpge else 1500.0
-                    if is_positive is True: hv_range = (0.0, max_v)
-                    elif is_positive is False: hv_range = (-max_v, 0.0)
-                    else: info["error"] = "Could not determine PX5 HV polarity from status."
-
-                elif device_id_str == "DP5-X":
-                    max_v = 300.0
-                    if is_positive is True: hv_range = (0.0, max_v)
-                    elif is_positive is False: hv_range = (-max_v, 0.0)
-                    else: info["error"] = "Could not determine DP5-X HV polarity from status."
-
-                info["range"] = hv_range
-
-            elif param_name == "MCAC":
-                info["type"] = "int"
-                info["doc"] = "Select Number of MCA Channels."
-                info["allowed_values"] = [256, 512, 1024, 2048, 4096, 8192]
-
-            elif param_name in ["MCSL", "MCSH"]:
-                info["type"] = "int"
-                info["doc"] = f"Sets {'Low' if param_name == 'MCSL' else 'High'} Threshold for MCS."
-                mcac_val = int(mcac_val_str)
-                max_ch = mcac_val - 1
-                info["range"] = (0, max_ch)
-
-            elif param_name == "MCST":
-                 info["type"] = "float"
-                 info["doc"] = "Sets the MCS Timebase in seconds (10ms precision)."
-                 info["range"] = (0.01, 655.35)
-
-            elif param_name == "PAPS":
-                 info["type"] = "(str, float)"
-                 info["doc"] = "Controls Preamp Power Supplies."
-                 if device_id_str == "DP5": info["allowed_values"] = ["8.5", "5", "OFF", "ON"]
-                 elif device_id_str == "PX5": info["allowed_values"] = ["8.5", "5", "OFF"]
-
-            elif param_name == "PREC":
-                 info["type"] = "(int, str)"
-                 info["doc"] = "Preset Counts (0 to 2^32-1 or OFF)."
-                 info["allowed_values"] = ["OFF"]
-                 info["range"] = (0, 4294967295)
-
-            elif param_name == "PRER":
-                 info["type"] = "(float, str)"
-                 info["doc"] = "Preset Real Time in seconds (precision 0.01s or 0.001s)."
-                 info["allowed_values"] = ["OFF"]
-                 info["range"] = (0.0, 4294967.29)
-
-            elif param_name == "PRET":
-                 info["type"] = "(float, str)"
-                 info["doc"] = "Preset Acquisition Time in seconds (precision 0.1s)."
-                 info["allowed_values"] = ["OFF"]
-                 info["range"] = (0.0, 99999999.9)
-
-            elif param_name == "TECS":
-                 info["type"] = "(int, str)"
-                 info["doc"] = "Sets Thermoelectric Cooler temperature setpoint in Kelvin."
-                 info["allowed_values"] = ["OFF"]
-                 info["range"] = (0, 299)
-
-            elif param_name == "VOLU":
-                 info["type"] = "str"
-                 info["doc"] = "Controls the speaker volume (PX5 only)."
-                 info["allowed_values"] = ["ON", "OFF"]
+            # Support is checked first so fillers can skip work whose result would be discarded
+            supported = self.parameter_is_supported(param_name, device_id_str)
+            context["supported"] = supported
 
-            else:
+            # --- Internal Logic per Parameter ---
+            fill_info = self._PARAM_INFO_FILLERS.get(param_name)
+            if fill_info is None:
                 info["error"] = "Parameter metadata logic not fully implemented in get_parameter_info."
+            else:
+                fill_info(self, param_name, info, context)
 
             # Support
-            info["supported"] = self.parameter_is_supported(param_name, device_id_str)
-            if not info["supported"]:
+            info["supported"] = supported
+            if not supported:
                 info["range"] = None
                 info["allowed_values"] = None
                 msg = "Parameter not supported by this device."
@@ -1522,7 +2381,7 @@ class AmptekMCA():
         """
         return self.get_parameters_info([param_name], required_params)[param_name]
 
-    def get_unsupported_devices_per_parameter(self) -> List[str]:
+    def get_unsupported_devices_per_parameter(self) -> Dict[str, List[str]]:
         """
         Returns a dict of parameter names and the devices that do not support them.
         If some parameter is not present in the dictionary, it is assumed to be supported by all devices.
@@ -1531,46 +2390,7 @@ class AmptekMCA():
             A dictionary where keys are parameter names and values are lists of device IDs
             that do not support the parameter.
         """
-        return {
-            'AINP': ['MCA8000D'],
-            'AU34': ['DP5', 'DP5X', 'MCA8000D', 'Mini-X2'],
-            'BLRD': ['MCA8000D'],
-            'BLRM': ['MCA8000D'],
-            'BLRU': ['MCA8000D'],
-            'BOOT': ['PX5', 'DP5G', 'MCA8000D', 'Mini-X2', 'TB-5', 'Gamma-Rad5'],
-            'CON1': ['DP5', 'DP5X', 'MCA8000D', 'Mini-X2'],
-            'CON2': ['DP5', 'DP5X', 'MCA8000D', 'Mini-X2'],
-            'CLCK': ['MCA8000D', 'Mini-X2'],
-            'CLKL': ['MCA8000D', 'Mini-X2'],
-            'CUSP': ['MCA8000D', 'Mini-X2'],
-            'DACF': ['MCA8000D', 'Mini-X2'],
-            'DACO': ['MCA8000D', 'Mini-X2'],
-            'GAIF': ['MCA8000D', 'Mini-X2'],
-            'GATE': ['PX5', 'DP5G', 'Mini-X2', 'TB-5', 'Gamma-Rad5'],
-            'HVSE': ['MCA8000D'],
-            'INOF': ['DP5G', 'MCA8000D', 'Mini-X2', 'TB-5', 'Gamma-Rad5'],
-            'INOG': ['DP5', 'DP5X', 'DP5G', 'MCA8000D', 'Mini-X2', 'TB-5', 'Gamma-Rad5'],
-            'PAPZ': ['DP5G', 'MCA8000D', 'DP5X', 'Mini-X2', 'TB-5', 'Gamma-Rad5'],
-            'PDMD': ['DP5X', 'Mini-X2'],
-            'PREL': ['DP5', 'PX5', 'DP5X', 'DP5G', 'Mini-X2', 'TB-5', 'Gamma-Rad5'],
-            'PURE': ['Mini-X2'],
-            'PURS': ['PX5', 'DP5G', 'MCA8000D', 'Mini-X2', 'TB-5', 'Gamma-Rad5'],
-            'RESL': ['MCA8000D', 'Mini-X2'],
-            'RTDD': ['MCA8000D', 'Mini-X2'],
-            'RTDE': ['MCA8000D', 'Mini-X2'],
-            'RTDS': ['MCA8000D', 'Mini-X2'],
-            'RTDT': ['MCA8000D', 'Mini-X2'],
-            'RTDW': ['MCA8000D', 'Mini-X2'],
-            'SCTC': ['DP5', 'PX5', 'DP5X', 'MCA8000D', 'Mini-X2'],
-            'SYNC': ['MCA8000D', 'Mini-X2'],
-            'TECS': ['DP5G', 'MCA8000D', 'DP5X', 'Mini-X2', 'TB-5', 'Gamma-Rad5'],
-            'TFLA': ['MCA8000D', 'Mini-X2'],
-            'THFA': ['MCA8000D', 'Mini-X2'],
-            'TPFA': ['MCA8000D', 'Mini-X2'],
-            'TPMO': ['MCA8000D', 'DP5X', 'Mini-X2'],
-            'VOLU': ['DP5', 'DP5G', 'MCA8000D', 'DP5X', 'Mini-X2', 'TB-5', 'Gamma-Rad5'],
-            'AUO2=STREAM': ['DP5X']
-        }
+        return {parameter: list(devices) for parameter, devices in _UNSUPPORTED_DEVICES.items()}
     
     def parameter_is_supported(self, parameter: str, device_id: str = None) -> bool:
         """
@@ -1590,16 +2410,46 @@ class AmptekMCA():
         if device_id == "Unknown":
             self.logger.warning(f"{self.log_prefix} Device ID is unknown, cannot check parameter support.")
             return False
-        unsupported_devices = self.get_unsupported_devices_per_parameter()
-        if parameter in unsupported_devices:
-            if device_id in unsupported_devices[parameter]:
-                # Only log if the parameter is not supported by the device
-                self.logger.debug(f"{self.log_prefix} Parameter '{parameter}' is NOT supported by device '{device_id}'.")
-                return False
-            else:
-                return True
+        if parameter in _unsupported_parameters(device_id):
+            # Only log if the parameter is not supported by the device
+            self.logger.debug(f"{self.log_prefix} Parameter '{parameter}' is NOT supported by device '{device_id}'.")
+            return False
+        return True
+
+    @staticmethod
+    def _parse_hv_target(target_voltage: Union[float, int, str]) -> float:
+        """
+        Converts an HVSE target ("OFF", a number or a numeric string) to volts.
+
+        Args:
+            target_voltage: The target voltage as accepted by set_HVSE.
+
+        Returns:
+            The target voltage as a finite float ("OFF" gives 0.0).
+
+        Raises:
+            ValueError: If the value is not a number or 'OFF', or is not finite.
+        """
+        # Normalize and validate target voltage: strings -> uppercase; OFF => 0.0; else single float() conversion
+        if isinstance(target_voltage, str):
+            tv_raw = target_voltage.strip().upper()
+            if tv_raw == 'OFF':
+                return 0.0
+            try:
+                target_v_numeric = float(tv_raw)
+            except ValueError:
+                raise ValueError("target_voltage must be a number or 'OFF'")
+        elif isinstance(target_voltage, (int, float)):
+            target_v_numeric = float(target_voltage)
         else:
-            return True
+            raise ValueError("target_voltage must be a number or 'OFF'")
+
+        # Canonicalize and validate
+        if not math.isfinite(target_v_numeric):
+            raise ValueError("target_voltage must be finite")
+        if math.isclose(target_v_numeric, 0.0, abs_tol=1e-9):
+            target_v_numeric = 0.0
+        return target_v_numeric
 
     def set_HVSE(self,
                  target_voltage: Union[float, int, str],
@@ -1642,26 +2492,7 @@ class AmptekMCA():
         """
         self.logger.info(f"{self.log_prefix} Setting HVSE to '{target_voltage}' with ramp (step={step}V, delay={delay_sec}s)...")
 
-        # Normalize and validate target voltage: strings -> uppercase; OFF => 0.0; else single float() conversion
-        if isinstance(target_voltage, str):
-            tv_raw = target_voltage.strip().upper()
-            if tv_raw == 'OFF':
-                target_v_numeric = 0.0
-            else:
-                try:
-                    target_v_numeric = float(tv_raw)
-                except ValueError:
-                    raise ValueError("target_voltage must be a number or 'OFF'")
-        elif isinstance(target_voltage, (int, float)):
-            target_v_numeric = float(target_voltage)
-        else:
-            raise ValueError("target_voltage must be a number or 'OFF'")
-
-        # Canonicalize and validate
-        if not math.isfinite(target_v_numeric):
-            raise ValueError("target_voltage must be finite")
-        if math.isclose(target_v_numeric, 0.0, abs_tol=1e-9):
-            target_v_numeric = 0.0
+        target_v_numeric = self._parse_hv_target(target_voltage)
 
         # Step and validation parameters
         if not math.isfinite(step) or step <= 0:
@@ -1724,9 +2555,8 @@ class AmptekMCA():
 
         if current_int != target_int:
             direction = 1 if target_int > current_int else -1
-            # Intermediate steps (exclusive of target -> target is not included here)
-            for val in range(current_int + direction * abs_step, target_int, direction * abs_step):
-                ramp_steps.append(val)
+            # Intermediate steps (exclusive of target -> target is not included here), built in one call
+            ramp_steps = list(range(current_int + direction * abs_step, target_int, direction * abs_step))
             # Ensure final target is included as the last step
             ramp_steps.append(target_int)
 
@@ -1784,34 +2614,35 @@ class AmptekMCA():
         parsed_config = OrderedDict()
         
         try:
-            with config_file_path.open('r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    # Skip empty lines or section headers like [Header]
-                    if not line or (line.startswith('[') and line.endswith(']')):
+            # Configuration files are small: read each one in a single call and split the lines in C
+            for line_num, line in enumerate(config_file_path.read_text(encoding='utf-8').splitlines(), 1):
+                line = line.strip()
+                # Skip empty lines or section headers like [Header]
+                if not line or (line.startswith('[') and line.endswith(']')):
+                    continue
+
+                # Process potentially multiple commands on one line
+                parts = line.split(';')
+                for part in parts:
+                    part = part.strip()
+                    if not part: # Skip empty parts
                         continue
 
-                    # Process potentially multiple commands on one line
-                    parts = line.split(';')
-                    for part in parts:
-                        part = part.strip()
-                        if not part: # Skip empty parts
-                            continue
-
-                        # Split only on the first '=', allow '=' in value
-                        key_value = part.split('=', 1)
-                        if len(key_value) == 2:
-                            key = key_value[0].strip().upper() # Use uppercase keys
-                            value = key_value[1].strip() # Get value
-                            if key and value: # Ensure key and value are not empty
-                                parsed_config[key] = value
-                            elif not key:
-                                self.logger.debug(f"{self.log_prefix} Skipping empty key in part '{part}' in file {config_file_path.name}, line {line_num}")
-                            elif not value:
-                                self.logger.debug(f"{self.log_prefix} Skipping empty value in part '{part}' in file {config_file_path.name}, line {line_num}")
-                        else:
-                            # Handle parts without '=' if necessary
-                            self.logger.warning(f"{self.log_prefix} Skipping malformed part '{part}' (no '=') in file {config_file_path.name}, line {line_num}")
+                    # Split only on the first '=', allow '=' in value
+                    key_value = part.split('=', 1)
+                    if len(key_value) == 2:
+                        # Use uppercase keys, interned so lookups in the parameter tables compare by identity
+                        key = sys.intern(key_value[0].strip().upper())
+                        value = key_value[1].strip() # Get value
+                        if key and value: # Ensure key and value are not empty
+                            parsed_config[key] = value
+                        elif not key:
+                            self.logger.debug(f"{self.log_prefix} Skipping empty key in part '{part}' in file {config_file_path.name}, line {line_num}")
+                        elif not value:
+                            self.logger.debug(f"{self.log_prefix} Skipping empty value in part '{part}' in file {config_file_path.name}, line {line_num}")
+                    else:
+                        # Handle parts without '=' if necessary
+                        self.logger.warning(f"{self.log_prefix} Skipping malformed part '{part}' (no '=') in file {config_file_path.name}, line {line_num}")
 
             # Fix RTDS (0 was an invalid value, according to the programmer's guide the correct minimum value is 2)
             if parsed_config and 'RTDS' in parsed_config:
@@ -1831,7 +2662,8 @@ class AmptekMCA():
             # Remove unsupported parameters
             if parsed_config and device_type:
                 self.logger.debug(f"{self.log_prefix} Removing unsupported parameters from config file '{config_file_path.name}' for device '{device_type}'...")
-                parsed_config = {k: v for k, v in parsed_config.items() if self.parameter_is_supported(k, device_type)}
+                unsupported = _unsupported_parameters(device_type)
+                parsed_config = {k: v for k, v in parsed_config.items() if k not in unsupported}
                     
         except IOError as e:
             self.logger.error(f"{self.log_prefix} Error reading config file {config_file_path}: {e}")
@@ -1842,7 +2674,7 @@ class AmptekMCA():
             
         return parsed_config
 
-    def _apply_configuration_dict(self, config_dict: OrderedDictType[str, Any], source_description: str, save_to_flash: bool = False, skip_hvse: bool = False, hvse_tolerance_v: float = 10.0, hvse_max_wait_sec: float = 15.0) -> None:
+    def _apply_configuration_dict(self, config_dict: OrderedDictType[str, Any], source_description: str, save_to_flash: bool = False, skip_hvse: bool = False, hvse_tolerance_v: float = 10.0, hvse_max_wait_sec: float = 15.0, skip_unchanged: bool = False) -> None:
         """
         Internal helper method to apply a configuration dictionary to the device.
         
@@ -1853,6 +2685,8 @@ class AmptekMCA():
             skip_hvse: If True, the HVSE parameter will be skipped
             hvse_tolerance_v: Acceptable absolute HV error for convergence (passed to set_HVSE)
             hvse_max_wait_sec: Max seconds to wait per HV ramp step for convergence
+            skip_unchanged: If True and save_to_flash is False, the main configuration is not sent
+                            when the device already reports the same values (see _configuration_matches_device)
             
         Raises:
             AmptekMCAError: If connection or communication fails during command execution
@@ -1862,11 +2696,20 @@ class AmptekMCA():
         # Make a copy to avoid modifying the original
         config_to_apply = config_dict.copy()
         
-        # 1. Separate HVSE command if present
+        # 1. Separate HVSE command if present, and validate it before anything is sent,
+        #    so an invalid value does not leave the device with only the main parameters applied
         target_hv_value = config_to_apply.pop('HVSE', None)
+        if target_hv_value is not None and not skip_hvse:
+            try:
+                target_hv_volts = self._parse_hv_target(target_hv_value)
+            except ValueError as e:
+                self.logger.error(f"{self.log_prefix} Invalid HVSE value '{target_hv_value}' in configuration {source_description}: {e}")
+                raise
 
         # 2. Send the rest of the configuration
-        if config_to_apply: # Check if there are other parameters left
+        if config_to_apply and skip_unchanged and not save_to_flash and self._configuration_matches_device(config_to_apply):
+            self.logger.info(f"{self.log_prefix} Device already holds the main configuration parameters ({len(config_to_apply)} items), not sending them.")
+        elif config_to_apply: # Check if there are other parameters left
             self.logger.info(f"{self.log_prefix} Sending main configuration parameters ({len(config_to_apply)} items)...")
             try:
                 self.send_configuration(config_to_apply, save_to_flash=save_to_flash)
@@ -1880,8 +2723,8 @@ class AmptekMCA():
         if target_hv_value is not None and not skip_hvse:
             self.logger.info(f"{self.log_prefix} Applying HVSE setting separately: {target_hv_value}")
             try:
-                # Call the ramping method - set_HVSE handles all parsing and validation
-                self.set_HVSE(target_hv_value, save_to_flash=save_to_flash, tolerance_v=hvse_tolerance_v, max_wait_sec=hvse_max_wait_sec) # Uses default step/delay
+                # Call the ramping method - set_HVSE handles the polarity checks and ramping
+                self.set_HVSE(target_hv_volts, save_to_flash=save_to_flash, tolerance_v=hvse_tolerance_v, max_wait_sec=hvse_max_wait_sec) # Uses default step/delay
             except (AmptekMCAError, AmptekMCAAckError, ValueError) as e:
                  self.logger.error(f"{self.log_prefix} Error applying HVSE setting '{target_hv_value}': {e}")
                  raise # Re-raise the exception
@@ -1892,6 +2735,45 @@ class AmptekMCA():
 
         self.logger.info(f"{self.log_prefix} Configuration {source_description} applied successfully.")
 
+    def _configuration_matches_device(self, config_dict: Dict[str, Any]) -> bool:
+        """
+        Checks whether the device already reports the values of a configuration.
+
+        All parameters are read back in as few readback requests as the 512-byte template
+        limit allows and compared as case-insensitive strings. A RESC (reset) entry is
+        not read back. Parameters not present in config_dict are not checked.
+
+        Args:
+            config_dict: Configuration dictionary (without HVSE) as passed to send_configuration.
+
+        Returns:
+            True if every parameter read back equals its configured value, False otherwise
+            (including when the readback fails).
+        """
+        expected = {str(key).upper(): str(value).strip().upper() for key, value in config_dict.items()}
+        expected.pop('RESC', None)
+
+        # Group the commands so that each readback template ("CMD1;CMD2;...") fits in 512 bytes
+        batches: List[List[str]] = [[]]
+        batch_len = 0
+        for command in expected:
+            if batch_len + len(command) + 1 > 512:
+                batches.append([])
+                batch_len = 0
+            batches[-1].append(command)
+            batch_len += len(command) + 1
+
+        try:
+            current: Dict[str, str] = {}
+            for batch in batches:
+                if batch:
+                    current.update(self.read_configuration(batch))
+        except (AmptekMCAError, AmptekMCAAckError, ValueError) as e:
+            self.logger.warning(f"{self.log_prefix} Could not read back the current configuration, it will be sent: {e}")
+            return False
+
+        return all(current.get(command, '').strip().upper() == value for command, value in expected.items())
+
     def get_available_default_configurations_with_content(self) -> Dict[str, Dict[str, OrderedDictType[str, str]]]:
         """
         Scans the 'default' directory in the library path for available default configuration files.
@@ -1931,7 +2813,21 @@ class AmptekMCA():
                     "standard": OrderedDict([...])
                 }
             }
+
+        Note:
+            Parsed files are cached at module level (shared by all instances) and only
+            re-parsed when a file in the 'default' directory is added, removed or modified.
         """
+        return _copy_configs(self._load_default_configurations())
+
+    def _load_default_configurations(self) -> Dict[str, Dict[str, OrderedDictType[str, str]]]:
+        """
+        Returns the parsed default configurations (see get_available_default_configurations_with_content),
+        scanning the 'default' directory only if a file changed since the last scan.
+
+        The returned mapping is the module-level cache itself, so callers must not modify it.
+        """
+        global _default_config_cache
         self.logger.info(f"{self.log_prefix} Searching for default configurations...")
         try:
             script_dir = Path(__file__).parent
@@ -1948,40 +2844,54 @@ class AmptekMCA():
             self.logger.warning(f"{self.log_prefix} 'default' directory not found at {default_dir}")
             return available_configs
 
-        # Iterate through subdirectories in the 'default' folder (Device Types)
-        for device_dir in default_dir.iterdir():
-            if device_dir.is_dir():
-                device_type = device_dir.name # e.g., "DP5", "PX5"
-                self.logger.debug(f"{self.log_prefix} Found device type folder: {device_type}")
-                device_configs: Dict[str, OrderedDictType[str, str]] = {}
-
-                # Iterate through .txt files in the device type subfolder
-                for config_file in device_dir.glob('*.txt'):
-                    if config_file.is_file():
-                        config_name = config_file.stem # Filename without extension
-                        try:
-                            # Use the common parsing method
-                            parsed_config = self._parse_configuration_file(config_file, device_type)
-                            
-                            if parsed_config:
-                                # Save
-                                device_configs[config_name] = parsed_config
-                            else:
-                                self.logger.warning(f"{self.log_prefix} No valid configuration pairs found in {config_file.name}")
-
-                        except (IOError, ValueError) as e:
-                             self.logger.error(f"{self.log_prefix} Error loading config file {config_file.name}: {e}")
-                        except Exception as e:
-                             self.logger.error(f"{self.log_prefix} Unexpected error processing config file {config_file.name}: {e}")
-
-                if device_configs:
-                    available_configs[device_type] = device_configs
+        # Single scan of <device type>/<config>.txt files, shared by the signature and the parsing below
+        config_files = sorted(default_dir.glob('*/*.txt'))
+        signature = _default_config_signature(config_files)
+        # Reuse the cached result if no file changed since it was parsed
+        with _default_config_lock:
+            cached = _default_config_cache
+        if cached is not None and cached[0] == signature:
+            self.logger.debug(f"{self.log_prefix} Using cached default configurations.")
+            return cached[1]
+
+        # Group the configuration files by device type (subfolder name, e.g. "DP5", "PX5")
+        files_by_device: Dict[str, List[Path]] = {}
+        for config_file in config_files:
+            if config_file.is_file():
+                files_by_device.setdefault(config_file.parent.name, []).append(config_file)
+
+        for device_type, device_files in files_by_device.items():
+            self.logger.debug(f"{self.log_prefix} Found device type folder: {device_type}")
+            device_configs: Dict[str, OrderedDictType[str, str]] = {}
+
+            for config_file in device_files:
+                config_name = config_file.stem # Filename without extension
+                try:
+                    # Use the common parsing method
+                    parsed_config = self._parse_configuration_file(config_file, device_type)
+
+                    if parsed_config:
+                        # Save
+                        device_configs[config_name] = parsed_config
+                    else:
+                        self.logger.warning(f"{self.log_prefix} No valid configuration pairs found in {config_file.name}")
+
+                except (IOError, ValueError) as e:
+                     self.logger.error(f"{self.log_prefix} Error loading config file {config_file.name}: {e}")
+                except Exception as e:
+                     self.logger.error(f"{self.log_prefix} Unexpected error processing config file {config_file.name}: {e}")
+
+            if device_configs:
+                available_configs[device_type] = device_configs
 
         if not available_configs:
              self.logger.info(f"{self.log_prefix} No default configurations found in 'default' directory structure.")
         else:
              self.logger.info(f"{self.log_prefix} Found default configurations for devices: {list(available_configs.keys())}")
 
+        with _default_config_lock:
+            _default_config_cache = (signature, available_configs)
+
         return available_configs
 
     def get_available_default_configurations(self) -> Dict[str, List[str]]:
@@ -2009,8 +2919,8 @@ class AmptekMCA():
         """
         simplified_configs: Dict[str, List[str]] = {}
         try:
-            # Call the method that reads the content
-            all_configs_with_content = self.get_available_default_configurations_with_content()
+            # Read the (cached) content; only the names are used, so the configs are not copied
+            all_configs_with_content = self._load_default_configurations()
 
             # Simplify the result: extract only keys (device types and config names)
             for device_type, device_configs in all_configs_with_content.items():
@@ -2142,8 +3052,8 @@ class AmptekMCA():
         """
         self.logger.info(f"{self.log_prefix} Getting default configuration '{config_name}' for device '{device_type}'...")
 
-        # Get all available default configurations
-        all_configs = self.get_available_default_configurations_with_content()
+        # Get all available default configurations (cached); only the requested one is copied below
+        all_configs = self._load_default_configurations()
 
         # Look up the specific device type
         device_configs = all_configs.get(device_type)
@@ -2158,9 +3068,9 @@ class AmptekMCA():
             return None
 
         self.logger.info(f"{self.log_prefix} Default configuration '{config_name}' for '{device_type}' retrieved.")
-        return specific_config
+        return specific_config.copy()
 
-    def apply_default_configuration(self, device_type: str, config_name: str, save_to_flash: bool = False, skip_hvse: bool = False, hvse_tolerance_v: float = 10.0, hvse_max_wait_sec: float = 15.0, warn_on_ack_errors: bool = True) -> None:
+    def apply_default_configuration(self, device_type: str, config_name: str, save_to_flash: bool = False, skip_hvse: bool = False, hvse_tolerance_v: float = 10.0, hvse_max_wait_sec: float = 15.0, warn_on_ack_errors: bool = True, skip_unchanged: bool = False) -> None:
         """
         Applies a specific default configuration to the device.
 
@@ -2179,6 +3089,10 @@ class AmptekMCA():
             hvse_max_wait_sec: Max seconds to wait per HV ramp step for convergence
             warn_on_ack_errors: If True, AmptekMCAAckError instances are logged as warnings
                                 instead of being raised (default: True).
+            skip_unchanged: If True (and save_to_flash is False), the configuration is read back
+                            first and the parameters are only sent if any of them differs from the
+                            device. HVSE is not ramped anyway when already within hvse_tolerance_v
+                            (default: False).
 
         Raises:
             AmptekMCAError: If connection or communication fails, if the default
@@ -2205,6 +3119,7 @@ class AmptekMCA():
                 skip_hvse,
                 hvse_tolerance_v,
                 hvse_max_wait_sec,
+                skip_unchanged,
             )
         except AmptekMCAAckError as ack_error:
             if warn_on_ack_errors:
@@ -2212,40 +3127,165 @@ class AmptekMCA():
             else:
                 raise
 
-    def wait_until_mca_is_closed(self, time_between_checks: float = 1) -> None:
+    def wait_until_mca_is_closed(self,
+                                 time_between_checks: float = 1,
+                                 poll_backoff_min: float = 0.05,
+                                 poll_backoff_base: float = 1.3,
+                                 poll_backoff_max: Optional[float] = None,
+                                 timeout_factor: Optional[float] = 1.2,
+                                 timeout_grace_sec: float = 5.0) -> None:
         """
         Waits until the MCA is closed.
 
         Checks relevant preset configurations (PRET, PRER, PREC, PREL) first.
         If no preset condition is active that would stop the MCA, it logs a
         warning and returns immediately to prevent an infinite wait.
-        User can interrupt the wait with Ctrl+C.
+        User can interrupt the wait with Ctrl+C, and another thread can cancel it
+        with stop_wait(); in that case it returns with the MCA still enabled.
+        A stop_wait() made while no wait is running has no effect on later waits.
+
+        The status is polled with an exponential backoff: the first check comes after
+        poll_backoff_min seconds and each following interval is poll_backoff_base times
+        longer, up to poll_backoff_max. Short acquisitions are thus detected quickly,
+        while long ones are polled no more often than every poll_backoff_max seconds.
+        When a time preset (PRET/PRER) is active, the interval is also shortened so that
+        a check happens right after the preset is due, based on the status timers; once
+        the preset is overdue, the plain backoff is used again.
 
         Args:
-            time_between_checks: The time interval in seconds between status checks.
-                               Defaults to 1 seconds.
+            time_between_checks: The maximum time interval in seconds between status checks,
+                               used when poll_backoff_max is None. Defaults to 1 seconds.
+            poll_backoff_min: Interval in seconds before the first status check. Defaults to 0.05.
+            poll_backoff_base: Growth factor of the interval after each check (>= 1).
+                               Use 1 together with poll_backoff_min=time_between_checks for a
+                               fixed interval. Defaults to 1.3.
+            poll_backoff_max: Upper bound in seconds of the interval. Defaults to time_between_checks.
+            timeout_factor: When the real time preset (PRER) is active, the wait is aborted if the
+                            MCA is still enabled after timeout_factor times the real time that was
+                            left when the wait started, plus timeout_grace_sec. None waits without
+                            a deadline. Defaults to 1.2.
+            timeout_grace_sec: Extra seconds added to the deadline. Defaults to 5.0.
 
         Raises:
             AmptekMCAError: If connection or communication fails during status checks
-                            or configuration readback.
+                            or configuration readback, or if the MCA does not close
+                            before the PRER deadline.
             AmptekMCAAckError: If the device returns an error ACK during checks.
-            ValueError: If time_between_checks is not positive or zero.
+            ValueError: If time_between_checks or the backoff parameters are out of range.
+        """
+        poll_backoff_max = self._check_wait_arguments(time_between_checks, poll_backoff_min, poll_backoff_base,
+                                                      poll_backoff_max, timeout_factor, timeout_grace_sec)
+
+        self.logger.info(f"{self.log_prefix} Waiting for MCA to close (polling every {poll_backoff_min}s up to {poll_backoff_max}s)...")
+        self._wait_stop.begin()
+        try:
+            # First, check if MCA is already closed
+            try:
+                initial_status = self.get_status(silent=True)
+                if not initial_status['status_flags']['mca_enabled']:
+                    self.logger.info(f"{self.log_prefix} MCA is already closed.")
+                    return
+            except (AmptekMCAError, AmptekMCAAckError) as e:
+                self.logger.exception(f"{self.log_prefix} Failed to get initial MCA status")
+                raise # Re-raise the error
+
+            prepared = self._prepare_wait(initial_status['real_time_sec'], timeout_factor, timeout_grace_sec)
+            if prepared is None:
+                return
+            time_presets, deadline = prepared
+
+            # Start polling loop only if at least one preset is active
+            self.logger.debug(f"{self.log_prefix} At least one preset condition is active. Starting polling loop...")
+            log_debug = self.logger.isEnabledFor(logging.DEBUG)
+            backoff = interval = poll_backoff_min
+            while True:
+                try:
+                    if self._wait_stop.wait(interval):
+                        self.logger.warning(f"{self.log_prefix} Wait stopped before the MCA closed.")
+                        break
+
+                    current_status = self.get_status(silent=True)
+                    if not current_status['status_flags']['mca_enabled']:
+                        self.logger.info(f"{self.log_prefix} MCA is now closed.")
+                        break # Exit the loop
+
+                    if deadline is not None and time.monotonic() > deadline:
+                        raise AmptekMCAError(f"MCA did not close within the real time preset deadline (PRER={time_presets['real_time_sec']}s).")
+
+                    backoff = min(backoff * poll_backoff_base, poll_backoff_max)
+                    interval = backoff
+                    if time_presets:
+                        # Wake up just after the earliest time preset is due instead of up to a full interval later.
+                        # Once it is overdue (e.g. gated acquisition or firmware lag) the plain backoff applies again.
+                        remaining = min(preset - current_status[status_key] for status_key, preset in time_presets.items())
+                        if remaining > 0:
+                            interval = min(backoff, remaining + poll_backoff_min)
+
+                    if log_debug:
+                        self.logger.debug(f"{self.log_prefix} MCA still enabled, waiting {interval:.2f}s...")
+
+                except (AmptekMCAError, AmptekMCAAckError) as e:
+                    self.logger.exception(f"{self.log_prefix} Error polling MCA status during wait")
+                    raise # Re-raise the error, interrupting the wait
+
+                except KeyboardInterrupt:
+                    self.logger.warning(f"{self.log_prefix} Wait interrupted by user.")
+                    raise # Allow interruption to propagate
+        finally:
+            # A stop request is consumed when the wait returns (not when it starts),
+            # so a stop_wait() issued while the wait was starting is not lost
+            self._wait_stop.end()
+
+    @staticmethod
+    def _check_wait_arguments(time_between_checks: float,
+                              poll_backoff_min: float,
+                              poll_backoff_base: float,
+                              poll_backoff_max: Optional[float],
+                              timeout_factor: Optional[float],
+                              timeout_grace_sec: float) -> float:
+        """
+        Validates the wait_until_mca_is_closed() polling arguments.
+
+        Returns:
+            The maximum polling interval (poll_backoff_max, or time_between_checks if it is None).
+
+        Raises:
+            ValueError: If an argument is out of range.
         """
         if time_between_checks <= 0:
             raise ValueError("time_between_checks must be positive and non-zero.")
+        if poll_backoff_max is None:
+            poll_backoff_max = time_between_checks
+        if poll_backoff_min <= 0 or poll_backoff_max < poll_backoff_min:
+            raise ValueError("poll_backoff_min must be positive and not greater than poll_backoff_max.")
+        if poll_backoff_base < 1:
+            raise ValueError("poll_backoff_base must be >= 1.")
+        if timeout_factor is not None and (timeout_factor <= 0 or timeout_grace_sec < 0):
+            raise ValueError("timeout_factor must be positive and timeout_grace_sec must be >= 0.")
+        return poll_backoff_max
 
-        self.logger.info(f"{self.log_prefix} Waiting for MCA to close (polling every {time_between_checks}s)...")
+    def _prepare_wait(self,
+                      real_time_sec: float,
+                      timeout_factor: Optional[float],
+                      timeout_grace_sec: float) -> Optional[Tuple[Dict[str, float], Optional[float]]]:
+        """
+        Reads and checks the presets before waiting for the MCA to close.
 
-        # First, check if MCA is already closed
-        try:
-            initial_status = self.get_status(silent=True)
-            if not initial_status['status_flags']['mca_enabled']:
-                self.logger.info(f"{self.log_prefix} MCA is already closed.")
-                return
-        except (AmptekMCAError, AmptekMCAAckError) as e:
-            self.logger.exception(f"{self.log_prefix} Failed to get initial MCA status")
-            raise # Re-raise the error
+        Shared by wait_until_mca_is_closed() and MultiAmptekMCA.wait_until_mca_is_closed().
+
+        Args:
+            real_time_sec: Real time of the status read when the wait started.
+            timeout_factor: See wait_until_mca_is_closed().
+            timeout_grace_sec: See wait_until_mca_is_closed().
 
+        Returns:
+            None if no preset would stop the MCA (the wait must not start). Otherwise a tuple
+            with the active time presets (status key -> preset value) and the time.monotonic()
+            deadline of the wait (None if there is none).
+
+        Raises:
+            AmptekMCAError: If the preset configuration cannot be read.
+        """
         # Check preset conditions
         device_model = self.get_model()
         presets_to_check = ['PRET', 'PRER', 'PREC']
@@ -2258,47 +3298,59 @@ class AmptekMCA():
             self.logger.exception(f"{self.log_prefix} Failed to read preset configuration")
             raise AmptekMCAError("Failed to read preset configuration before waiting")
 
+        # Parse each preset once: any non-zero preset makes the MCA stop by itself, and the
+        # time presets also give the expected close time (status timer that must reach each value)
         any_preset_active = False
+        time_presets: Dict[str, float] = {}
         for preset_cmd in presets_to_check:
             value_str = preset_config.get(preset_cmd, 'OFF') # Default to OFF if not found
-            if value_str.upper() != 'OFF':
-                try:
-                    # Try converting to float, check if non-zero
-                    if float(value_str) != 0.0:
-                        any_preset_active = True
-                        break # Found an active preset, no need to check others
-                except ValueError:
-                    # If it's not 'OFF' and not convertible to float (or is non-zero int), consider it active
-                    # This should not happen
-                    self.logger.warning(f"{self.log_prefix} Preset {preset_cmd} has non-numeric value '{value_str}', assuming it's active.")
-                    any_preset_active = True
-                    break
+            if value_str.upper() == 'OFF':
+                continue
+            try:
+                preset_value = float(value_str)
+            except ValueError:
+                # If it's not 'OFF' and not convertible to float, consider it active
+                # This should not happen
+                self.logger.warning(f"{self.log_prefix} Preset {preset_cmd} has non-numeric value '{value_str}', assuming it's active.")
+                any_preset_active = True
+                continue
+            if preset_value != 0.0:
+                any_preset_active = True
+                status_key = _TIME_PRESET_STATUS_KEYS.get(preset_cmd)
+                if status_key is not None and preset_value > 0:
+                    time_presets[status_key] = preset_value
 
         # If MCA is currently enabled but no presets are active, warn and return
         if not any_preset_active:
             self.logger.warning(f"{self.log_prefix} MCA is enabled, but no active preset condition (PRET/PRER/PREC/PREL) found.")
             self.logger.warning(f"{self.log_prefix} wait_until_mca_is_closed() will return immediately to avoid potential infinite loop.")
-            return
+            return None
 
-        # Start polling loop only if at least one preset is active
-        self.logger.debug(f"{self.log_prefix} At least one preset condition is active. Starting polling loop...")
-        while True:
-            try:
-                current_status = self.get_status(silent=True)
-                if not current_status['status_flags']['mca_enabled']:
-                    self.logger.info(f"{self.log_prefix} MCA is now closed.")
-                    break # Exit the loop
+        # Bound the wait by the real time preset: real time always advances while the MCA is enabled,
+        # unlike the accumulation time used by PRET, which stops while the gate is closed
+        deadline: Optional[float] = None
+        if timeout_factor is not None and 'real_time_sec' in time_presets:
+            real_time_left = max(time_presets['real_time_sec'] - real_time_sec, 0.0)
+            deadline = time.monotonic() + real_time_left * timeout_factor + timeout_grace_sec
 
-                self.logger.debug(f"{self.log_prefix} MCA still enabled, waiting...")
-                time.sleep(time_between_checks)
+        return time_presets, deadline
 
-            except (AmptekMCAError, AmptekMCAAckError) as e:
-                self.logger.exception(f"{self.log_prefix} Error polling MCA status during wait")
-                raise # Re-raise the error, interrupting the wait
+    def stop_wait(self) -> bool:
+        """
+        Cancel a wait_until_mca_is_closed() running on another thread.
+
+        The wait returns at its next sleep instead of after the current interval.
+        The MCA itself is not disabled. Only a running wait is cancelled (including one
+        still reading its presets): with no wait running the request is discarded, so
+        it does not cancel the next wait.
 
-            except KeyboardInterrupt:
-                self.logger.warning(f"{self.log_prefix} Wait interrupted by user.")
-                raise # Allow interruption to propagate
+        Returns:
+            True if a wait was running and has been asked to stop, False otherwise.
+        """
+        if self._wait_stop.request():
+            return True
+        self.logger.debug(f"{self.log_prefix} stop_wait() ignored: no wait is running.")
+        return False
 
     def configure_acquisition(self,
                               channels: Optional[int] = None,
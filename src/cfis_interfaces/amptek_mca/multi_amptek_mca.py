@@ -1,17 +1,21 @@
 # Standard libraries
+import array
+import asyncio
+import functools
 import logging
-from typing import Optional, Dict, List, Any, Union
-from collections import OrderedDict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from typing import Optional, Dict, List, Any, Union, Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
 # CFIS libraries
-from cfis_utils import UsbUtils, LoggerUtils, Spectrum
+from cfis_utils import LoggerUtils, Spectrum
 
 # Third-party libraries
 import usb.core
 
 # Local imports
-from .amptek_mca import AmptekMCA, AmptekMCAError
+from .amptek_mca import AmptekMCA, AmptekMCAError, AmptekStatus, _WaitStop, _find_amptek_devices, _decode_spectrum_into, _U32_TYPECODE
 
 # Logging prefix constant
 LOG_PREFIX = "[MultiAmptekMCA]"
@@ -28,7 +32,8 @@ class MultiAmptekMCA:
     def __init__(self, 
                  logger: Optional[logging.Logger] = None,
                  logger_name: str = "MultiAmptekMCA",
-                 logger_level: int = logging.INFO):
+                 logger_level: int = logging.INFO,
+                 device_paths: Optional[List[str]] = None):
         """
         Initialize MultiAmptekMCA by discovering all connected Amptek devices.
         
@@ -36,10 +41,25 @@ class MultiAmptekMCA:
             logger: Optional logger instance. If None, a new logger will be created.
             logger_name: Name for the new logger. Defaults to "MultiAmptekMCA".
             logger_level: Logging level for the new logger. Defaults to logging.INFO.
+            device_paths: Optional list of USB port paths ("<bus>-<port>[.<port>...]", e.g. "1-2.3",
+                          same format as Linux sysfs) selecting which devices to manage. They are
+                          picked from the shared, cached VID/PID scan and indexed in the given order;
+                          paths with no Amptek device are logged and skipped. If None, all connected
+                          Amptek devices are used, ordered by (bus, address).
         """
         self.logger = logger if logger else LoggerUtils.get_logger(logger_name, level=logger_level)
         self.mcas: List[AmptekMCA] = []
         self.device_count = 0
+        # (index, instance) pairs iterated by the broadcast methods, rebuilt when the device list changes
+        self._indexed_mcas: Tuple[Tuple[int, AmptekMCA], ...] = ()
+        self._device_paths = list(device_paths) if device_paths is not None else None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Reusable backing store for get_spectrum_stacked()
+        self._stacked: Optional[array.array] = None
+        # Unconnected AmptekMCA used for the configuration file helpers, created on first use
+        self._config_helper: Optional[AmptekMCA] = None
+        # Set by stop_wait() to cancel a running wait_until_mca_is_closed()
+        self._wait_stop = _WaitStop()
         
         # Discover available devices
         self._discover_devices()
@@ -48,28 +68,128 @@ class MultiAmptekMCA:
             self.logger.info(f"{LOG_PREFIX}  Initialized with {self.device_count} device(s)")
     
     def _discover_devices(self) -> None:
-        """Discover all connected Amptek MCA devices and create instances."""
+        """
+        Discover all connected Amptek MCA devices and create instances.
+
+        The bus is enumerated once and the matching devices are ordered deterministically
+        by (bus, address), which pyusb reports without any device I/O.
+        Each AmptekMCA instance is bound to its USB device, so connect() does not
+        scan the bus again.
+        """
         try:
-            backend = UsbUtils.get_libusb_backend()
-            devices = list(usb.core.find(
-                find_all=True, 
-                idVendor=AmptekMCA.VENDOR_ID,
-                idProduct=AmptekMCA.PRODUCT_ID, 
-                backend=backend
-            ))
-            
-            self.device_count = len(devices)
+            # Enumerate once (shared libusb backend)
+            devices = _find_amptek_devices()
+
+            if self._device_paths is not None:
+                # Known port paths: select and order directly
+                by_path = {self._device_path(dev): dev for dev in devices}
+                selected = []
+                for path in self._device_paths:
+                    dev = by_path.get(path)
+                    if dev is None:
+                        if self.logger:
+                            self.logger.warning(f"{LOG_PREFIX}  No Amptek device found at USB path '{path}'")
+                        continue
+                    selected.append(dev)
+            else:
+                selected = sorted(devices, key=lambda dev: (dev.bus or 0, dev.address or 0))
+
+            self.device_count = len(selected)
             
             # Create AmptekMCA instance for each device found
-            for i in range(self.device_count):
-                mca = AmptekMCA(logger=self.logger, device_index=i+1)
+            for i, dev in enumerate(selected):
+                mca = AmptekMCA(logger=self.logger, device_index=i+1, usb_device=dev)
                 self.mcas.append(mca)
+            self._indexed_mcas = tuple(enumerate(self.mcas))
                 
         except Exception as e:
             if self.logger:
                 self.logger.error(f"{LOG_PREFIX}  Error discovering devices: {e}")
             raise AmptekMCAError(f"Failed to discover Amptek devices: {e}")
+
+    @staticmethod
+    def _device_path(dev: usb.core.Device) -> str:
+        """
+        Build the USB port path of a device ("<bus>-<port>[.<port>...]").
+
+        Args:
+            dev: USB device returned by usb.core.find.
+
+        Returns:
+            Port path string, or "<bus>-" if the backend does not report port numbers.
+        """
+        ports = dev.port_numbers or ()
+        return f"{dev.bus}-{'.'.join(str(p) for p in ports)}"
     
+    def _create_pool(self) -> ThreadPoolExecutor:
+        """Create the worker pool used by parallel broadcasts (the caller thread serves device 0)."""
+        return ThreadPoolExecutor(max_workers=max(1, self.device_count - 1), thread_name_prefix="MultiAmptekMCA")
+
+    def _shutdown_pool(self) -> None:
+        """Shut down the broadcast worker pool, if any."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def refresh_devices(self) -> Dict[str, int]:
+        """
+        Update the device list after devices were plugged or unplugged.
+
+        Rescans the bus and updates the list incrementally: instances of devices that are
+        still present are kept as they are (including their connection), instances of
+        removed devices are disconnected and dropped, and new devices get new (unconnected)
+        instances appended after the existing ones. Device indices are renumbered to stay
+        contiguous. If the broadcast pool is running it is resized to the new device count.
+        When device_paths was given at construction, only those paths are considered.
+
+        Returns:
+            Dictionary with the number of 'added' and 'removed' devices.
+        """
+        devices = _find_amptek_devices(max_age_sec=0)
+        if self._device_paths is not None:
+            by_path = {self._device_path(dev): dev for dev in devices}
+            devices = [by_path[path] for path in self._device_paths if path in by_path]
+        present = {(dev.bus or 0, dev.address or 0): dev for dev in devices}
+
+        kept: List[AmptekMCA] = []
+        removed = 0
+        for mca in self.mcas:
+            dev = mca._usb_device
+            key = (dev.bus or 0, dev.address or 0) if dev is not None else None
+            if key in present:
+                kept.append(mca)
+                del present[key]
+            else:
+                removed += 1
+                try:
+                    mca.disconnect()
+                except Exception as e:
+                    if self.logger:
+                        self.logger.warning(f"{LOG_PREFIX}  Error disconnecting removed device: {e}")
+
+        added = 0
+        for key in (present if self._device_paths is not None else sorted(present)):
+            kept.append(AmptekMCA(logger=self.logger, device_index=len(kept) + 1, usb_device=present[key]))
+            added += 1
+
+        # Renumber so indices (and log prefixes) stay contiguous
+        for i, mca in enumerate(kept):
+            if mca.device_index != i + 1:
+                mca.device_index = i + 1
+                mca.log_prefix = f"[Amptek MCA {mca.device_index}]"
+
+        resized = self._pool is not None and len(kept) != self.device_count
+        self.mcas = kept
+        self._indexed_mcas = tuple(enumerate(kept))
+        self.device_count = len(kept)
+        if resized:
+            self._shutdown_pool()
+            self._pool = self._create_pool()
+
+        if self.logger:
+            self.logger.info(f"{LOG_PREFIX}  Device list refreshed: {added} added, {removed} removed, {self.device_count} total")
+        return {"added": added, "removed": removed}
+
     @property
     def count(self) -> int:
         """Get the number of discovered devices."""
@@ -96,31 +216,75 @@ class MultiAmptekMCA:
     def connect(self) -> Dict[int, bool]:
         """
         Connect to all discovered devices.
+
+        Also starts the worker pool used by parallel broadcasts; it lives until disconnect().
         
         Returns:
             Dictionary mapping device index to connection success (True/False)
         """
-        results = {}
-        for i, mca in enumerate(self.mcas):
+        if self._pool is None:
+            self._pool = self._create_pool()
+
+        # Each device is a distinct USB node, so the opens (interface claim, initial status) run concurrently
+        def _connect_single(idx: int, mca: AmptekMCA) -> bool:
             try:
-                mca.connect(device_index=i)
-                results[i] = True
+                mca.connect(device_index=idx)
+                return True
             except Exception as e:
                 if self.logger:
-                    self.logger.error(f"{LOG_PREFIX}  Failed to connect device {i}: {e}")
-                results[i] = False
-        return results
+                    self.logger.error(f"{LOG_PREFIX}  Failed to connect device {idx}: {e}")
+                return False
+
+        return self._dispatch(_connect_single, parallel=True)
     
     def disconnect(self) -> None:
-        """Disconnect from all devices."""
-        for mca in self.mcas:
+        """Disconnect from all devices and shut down the broadcast worker pool."""
+        def _disconnect_single(idx: int, mca: AmptekMCA) -> None:
             try:
                 mca.disconnect()
             except Exception as e:
                 if self.logger:
                     self.logger.warning(f"{LOG_PREFIX}  Error disconnecting device: {e}")
 
+        self._dispatch(_disconnect_single, parallel=self._pool is not None)
+        self._shutdown_pool()
+
     # Generic broadcast utility
+    def _call_device(self,
+                     idx: int,
+                     mca: AmptekMCA,
+                     method_name: str,
+                     args: tuple,
+                     kwargs: Dict[str, Any],
+                     device_type: Optional[str]) -> Dict[str, Any]:
+        """
+        Call an AmptekMCA method on a single device, capturing any exception.
+
+        Returns:
+            Result dict with keys 'ok', 'result' and 'error' (see broadcast()).
+        """
+        try:
+            # Filter by device type if requested
+            if device_type is not None and mca.get_model() != device_type:
+                if self.logger and self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"{LOG_PREFIX}  Skipping device {idx} (type: {mca.get_model()}, target: {device_type})")
+                return {"ok": None, "result": None, "error": None}
+
+            # Resolve and call method
+            target = getattr(mca, method_name, None)
+            if target is None or not callable(target):
+                msg = f"Method '{method_name}' not found or not callable on AmptekMCA"
+                if self.logger:
+                    self.logger.error(f"{LOG_PREFIX}  {msg}")
+                return {"ok": False, "result": None, "error": msg}
+
+            value = target(*args, **kwargs)
+            return {"ok": True, "result": value, "error": None}
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"{LOG_PREFIX}  Error calling '{method_name}' on device {idx}: {e}")
+            return {"ok": False, "result": None, "error": str(e)}
+
     def broadcast(self,
                   method_name: str,
                   *args,
@@ -134,49 +298,53 @@ class MultiAmptekMCA:
             method_name: Name of the AmptekMCA method to call (e.g., 'read_configuration', 'send_configuration').
             *args: Positional arguments to pass to the method.
             device_type: If provided, only devices whose model matches this string are targeted.
-            parallel: If True, execute calls in parallel using threads. If False, run sequentially.
+            parallel: If True, execute calls in parallel on the instance worker pool. If False, run sequentially.
+                      The pool exists between connect() (or entering the context manager) and disconnect();
+                      outside that window a temporary pool is used for the call.
             **kwargs: Keyword arguments to pass to the method.
 
         Returns:
-            Dict mapping device index to a result dict with keys:
+            Dict mapping device index (in ascending order) to a result dict with keys:
               - 'ok': True on success, False on error, None if skipped by filter
               - 'result': return value from the method (None if error/skip)
               - 'error': error message string if an exception occurred, else None
         """
 
         def _call_single(idx: int, mca: AmptekMCA) -> Dict[str, Any]:
-            try:
-                # Filter by device type if requested
-                if device_type is not None and mca.get_model() != device_type:
-                    if self.logger:
-                        self.logger.debug(f"{LOG_PREFIX}  Skipping device {idx} (type: {mca.get_model()}, target: {device_type})")
-                    return {"ok": None, "result": None, "error": None}
+            return self._call_device(idx, mca, method_name, args, kwargs, device_type)
 
-                # Resolve and call method
-                target = getattr(mca, method_name, None)
-                if target is None or not callable(target):
-                    msg = f"Method '{method_name}' not found or not callable on AmptekMCA"
-                    if self.logger:
-                        self.logger.error(f"{LOG_PREFIX}  {msg}")
-                    return {"ok": False, "result": None, "error": msg}
+        return self._dispatch(_call_single, parallel)
 
-                value = target(*args, **kwargs)
-                return {"ok": True, "result": value, "error": None}
-            except Exception as e:
-                if self.logger:
-                    self.logger.error(f"{LOG_PREFIX}  Error calling '{method_name}' on device {idx}: {e}")
-                return {"ok": False, "result": None, "error": str(e)}
+    def _dispatch(self, call: Callable[[int, AmptekMCA], Any], parallel: bool) -> Dict[int, Any]:
+        """
+        Run call(idx, mca) for every device, in parallel on the worker pool or sequentially.
+
+        Args:
+            call: Per-device callable (usually returning a result dict); it must not raise.
+            parallel: Execute in parallel when True, on the instance worker pool if it exists
+                      (between connect() and disconnect()), else on a temporary pool.
 
-        results: Dict[int, Dict[str, Any]] = {}
+        Returns:
+            Dict mapping device index (in ascending order) to the result of call.
+        """
+        results: Dict[int, Any] = {}
         if parallel and self.device_count > 1:
-            with ThreadPoolExecutor(max_workers=self.device_count) as executor:
-                future_map = {executor.submit(_call_single, i, mca): i for i, mca in enumerate(self.mcas)}
-                for fut in as_completed(future_map):
-                    i = future_map[fut]
+            pool = self._pool
+            temporary_pool = self._create_pool() if pool is None else None
+            try:
+                # Submit devices 1..N-1 to the pool, run device 0 on the calling thread,
+                # then wait for the rest. Exceptions are captured per device in _call_single.
+                indexed = self._indexed_mcas
+                futures = [(pool or temporary_pool).submit(call, i, mca) for i, mca in indexed[1:]]
+                results[0] = call(*indexed[0])
+                for i, fut in enumerate(futures, start=1):
                     results[i] = fut.result()
+            finally:
+                if temporary_pool is not None:
+                    temporary_pool.shutdown(wait=True)
         else:
-            for i, mca in enumerate(self.mcas):
-                results[i] = _call_single(i, mca)
+            for i, mca in self._indexed_mcas:
+                results[i] = call(i, mca)
 
         return results
     
@@ -193,6 +361,30 @@ class MultiAmptekMCA:
         """
         br = self.broadcast("get_status", silent=silent, parallel=True)
         return {i: (v["result"] if v["ok"] else None) for i, v in br.items()}
+
+    def get_status_record(self, silent: bool = False) -> Dict[int, Optional[AmptekStatus]]:
+        """
+        Get status records from all connected devices.
+
+        Cheaper than get_status() for frequent polling: each device returns an AmptekStatus
+        named tuple (see AmptekMCA.get_status_record()) and no per-device result or status
+        dictionary is built.
+
+        Args:
+            silent: If True, suppress info-level logging
+
+        Returns:
+            Dictionary mapping device index to AmptekStatus record (None on error)
+        """
+        def _status_single(idx: int, mca: AmptekMCA) -> Optional[AmptekStatus]:
+            try:
+                return mca.get_status_record(silent=silent)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"{LOG_PREFIX}  Error getting status of device {idx}: {e}")
+                return None
+
+        return self._dispatch(_status_single, parallel=True)
     
     def get_model(self) -> Dict[int, str]:
         """
@@ -201,7 +393,7 @@ class MultiAmptekMCA:
         Returns:
             Dictionary mapping device index to model string
         """
-        return {i: mca.get_model() for i, mca in enumerate(self.mcas)}
+        return {i: mca.get_model() for i, mca in self._indexed_mcas}
 
     def read_configuration(self, commands_to_read: List[str], device_type: Optional[str] = None, parallel: bool = True) -> Dict[int, Optional[Dict[str, str]]]:
         """
@@ -234,6 +426,51 @@ class MultiAmptekMCA:
         br = self.broadcast("get_spectrum", parallel=True)
         return {i: (v["result"] if v["ok"] else None) for i, v in br.items()}
     
+    def get_spectrum_stacked(self) -> memoryview:
+        """
+        Read the raw spectra of all devices into one 2D (n_devices x n_channels) uint32 block.
+
+        Only the counts are transferred (no status/configuration metadata as in get_spectrum()).
+        Rows follow device indices; n_channels is the largest channel count among the
+        devices, shorter spectra are zero-padded and rows of failed devices (or of devices
+        returning a payload that is not a whole number of 3-byte channels) are all zeros.
+        The backing buffer is reused between calls, so the returned view is only valid
+        until the next call (copy it, e.g. with .tolist(), to keep it).
+
+        Returns:
+            Read-only memoryview of format 'I' and shape (n_devices, n_channels);
+            it can be wrapped without copying, e.g. numpy.asarray(view). If there are
+            no devices or no device returned a spectrum, an empty 1D view (shape (0,))
+            is returned instead, as a memoryview cannot have a zero-length dimension.
+        """
+        br = self.broadcast("_get_spectrum_bytes", parallel=True)
+        payloads = []
+        for i, v in sorted(br.items()):
+            payload = v["result"] if v["ok"] else b''
+            if len(payload) % 3 != 0:
+                if self.logger:
+                    self.logger.error(f"{LOG_PREFIX}  Device {i} returned {len(payload)} spectrum bytes, not a multiple of 3; using a zero row")
+                payload = b''
+            payloads.append(payload)
+        n_channels = max((len(p) // 3 for p in payloads), default=0)
+        if n_channels == 0:
+            return memoryview(array.array(_U32_TYPECODE)).toreadonly()
+        size = len(payloads) * n_channels
+
+        if self._stacked is None or len(self._stacked) != size:
+            self._stacked = array.array(_U32_TYPECODE, bytes(4 * size))
+        stacked = memoryview(self._stacked).cast('B')
+
+        row_bytes = 4 * n_channels
+        for i, payload in enumerate(payloads):
+            row = stacked[i * row_bytes:(i + 1) * row_bytes]
+            used = 4 * (len(payload) // 3)
+            _decode_spectrum_into(payload, row[:used])
+            if used < row_bytes:
+                row[used:] = bytes(row_bytes - used)
+
+        return stacked.cast('I', (len(payloads), n_channels)).toreadonly()
+
     def clear_spectrum(self) -> Dict[int, bool]:
         """
         Clear spectrum on all connected devices.
@@ -308,7 +545,7 @@ class MultiAmptekMCA:
         return {i: (v["ok"] if v["ok"] is None else (v["ok"] is True)) for i, v in br.items()}
     
     # Configuration methods
-    def send_configuration(self, device_type: Optional[str] = None, config_dict: Dict[str, Any] = None, save_to_flash: bool = False) -> Dict[int, bool]:
+    def send_configuration(self, device_type: Optional[str] = None, config_dict: Dict[str, Any] = None, save_to_flash: bool = False, parallel: bool = True) -> Dict[int, bool]:
         """
         Send configuration to connected devices of specified type.
         
@@ -316,6 +553,7 @@ class MultiAmptekMCA:
             device_type: Device type to apply configuration to. If None, applies to all devices.
             config_dict: Configuration dictionary
             save_to_flash: Whether to save configuration to flash memory
+            parallel: Execute in parallel when True.
             
         Returns:
             Dictionary mapping device index to success status
@@ -325,12 +563,13 @@ class MultiAmptekMCA:
             config_dict,
             save_to_flash=save_to_flash,
             device_type=device_type,
-            parallel=False,
+            parallel=parallel,
         )
         return {i: (v["ok"] if v["ok"] is None else (v["ok"] is True)) for i, v in br.items()}
     
     def apply_default_configuration(self, device_type: str, config_name: str,
-                                  save_to_flash: bool = False, skip_hvse: bool = False, hvse_tolerance_v: float = 10.0, hvse_max_wait_sec: float = 15.0, warn_on_ack_errors: bool = True) -> Dict[int, bool]:
+                                  save_to_flash: bool = False, skip_hvse: bool = False, hvse_tolerance_v: float = 10.0, hvse_max_wait_sec: float = 15.0, warn_on_ack_errors: bool = True,
+                                  skip_unchanged: bool = False) -> Dict[int, bool]:
         """
         Apply default configuration to connected devices of specified type.
         
@@ -342,6 +581,7 @@ class MultiAmptekMCA:
             hvse_tolerance_v: Acceptable absolute HV error for convergence
             hvse_max_wait_sec: Max seconds to wait per HV ramp step for convergence
             warn_on_ack_errors: If True, Amptek ACK errors are treated as warnings
+            skip_unchanged: Whether to skip sending the parameters to devices that already hold them
             
         Returns:
             Dictionary mapping device index to success status (None = skipped)
@@ -355,6 +595,7 @@ class MultiAmptekMCA:
             hvse_tolerance_v=hvse_tolerance_v,
             hvse_max_wait_sec=hvse_max_wait_sec,
             warn_on_ack_errors=warn_on_ack_errors,
+            skip_unchanged=skip_unchanged,
             device_type=device_type,
             parallel=False,
         )
@@ -430,22 +671,179 @@ class MultiAmptekMCA:
         )
         return {i: (v["result"] if v["ok"] else None) for i, v in br.items()}
     
-    def wait_until_mca_is_closed(self, time_between_checks: float = 1.0) -> Dict[int, bool]:
+    def acquire(self, duration: float, clear: bool = True) -> Dict[int, Optional[Spectrum]]:
         """
-        Wait until MCA is closed on all devices in parallel.
-        
+        Run a timed acquisition on all devices: clear + enable, wait, then read + disable.
+
+        Each device runs its start commands (clear_spectrum, enable_mca) back to back in a
+        single worker dispatch, and likewise its stop commands (get_spectrum, disable_mca),
+        so a full cycle costs two parallel dispatches instead of four broadcasts.
+
         Args:
-            time_between_checks: Time in seconds between status checks
-            
+            duration: Acquisition time in seconds (host-timed).
+            clear: If True, clear the spectrum before enabling the MCA.
+
         Returns:
-            Dictionary mapping device index to success status
+            Dictionary mapping device index to Spectrum object (None if failed)
         """
-        br = self.broadcast(
-            "wait_until_mca_is_closed",
-            time_between_checks=time_between_checks,
-            parallel=True,
-        )
-        return {i: (v["ok"] is True) for i, v in br.items()}
+        def _start(idx: int, mca: AmptekMCA) -> Dict[str, Any]:
+            try:
+                if clear:
+                    mca.clear_spectrum()
+                mca.enable_mca()
+                return {"ok": True, "result": None, "error": None}
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"{LOG_PREFIX}  Error starting acquisition on device {idx}: {e}")
+                return {"ok": False, "result": None, "error": str(e)}
+
+        started = self._dispatch(_start, parallel=True)
+
+        time.sleep(duration)
+
+        def _finish(idx: int, mca: AmptekMCA) -> Dict[str, Any]:
+            if not started[idx]["ok"]:
+                return {"ok": False, "result": None, "error": started[idx]["error"]}
+            try:
+                spectrum = mca.get_spectrum()
+                mca.disable_mca()
+                return {"ok": True, "result": spectrum, "error": None}
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"{LOG_PREFIX}  Error finishing acquisition on device {idx}: {e}")
+                return {"ok": False, "result": None, "error": str(e)}
+
+        br = self._dispatch(_finish, parallel=True)
+        return {i: (v["result"] if v["ok"] else None) for i, v in br.items()}
+
+    def wait_until_mca_is_closed(self,
+                                 time_between_checks: float = 1.0,
+                                 poll_backoff_min: float = 0.05,
+                                 poll_backoff_base: float = 1.3,
+                                 poll_backoff_max: Optional[float] = None,
+                                 timeout_factor: Optional[float] = 1.2,
+                                 timeout_grace_sec: float = 5.0) -> Dict[int, bool]:
+        """
+        Wait until MCA is closed on all devices.
+
+        The presets of each device are checked as in AmptekMCA.wait_until_mca_is_closed().
+        The devices still open are then polled together, in parallel, on one shared
+        backoff schedule: each round reads the status of every pending device and drops
+        the ones that closed, so there is a single sleep per round instead of one per device.
+        The wait can be cancelled from another thread with stop_wait().
+
+        Args:
+            time_between_checks: Maximum time in seconds between status checks
+                                 (used when poll_backoff_max is None)
+            poll_backoff_min: Interval in seconds before the first status check
+            poll_backoff_base: Growth factor of the interval after each round (>= 1)
+            poll_backoff_max: Upper bound in seconds of the interval
+            timeout_factor: Real time preset (PRER) deadline factor; None disables the deadline
+            timeout_grace_sec: Extra seconds added to the deadline
+
+        Returns:
+            Dictionary mapping device index to success status (True if the MCA closed or
+            no wait was needed; False on error, deadline exceeded or stop_wait())
+
+        Raises:
+            ValueError: If the polling arguments are out of range.
+        """
+        poll_backoff_max = AmptekMCA._check_wait_arguments(time_between_checks, poll_backoff_min, poll_backoff_base,
+                                                           poll_backoff_max, timeout_factor, timeout_grace_sec)
+        self._wait_stop.begin()
+        try:
+            def _prepare_single(idx: int, mca: AmptekMCA) -> Any:
+                # True: nothing to wait for; (time_presets, deadline): pending; None: error
+                try:
+                    status = mca.get_status_record(silent=True)
+                    if not status.status_flags['mca_enabled']:
+                        return True
+                    prepared = mca._prepare_wait(status.real_time_sec, timeout_factor, timeout_grace_sec)
+                    return True if prepared is None else prepared
+                except Exception as e:
+                    if self.logger:
+                        self.logger.error(f"{LOG_PREFIX}  Error preparing wait on device {idx}: {e}")
+                    return None
+
+            results: Dict[int, bool] = {}
+            pending: Dict[int, Any] = {}
+            for i, prepared in self._dispatch(_prepare_single, parallel=True).items():
+                if isinstance(prepared, tuple):
+                    pending[i] = prepared
+                else:
+                    results[i] = prepared is True
+
+            def _status_single(idx: int) -> Any:
+                try:
+                    return self.mcas[idx].get_status_record(silent=True)
+                except Exception as e:
+                    if self.logger:
+                        self.logger.error(f"{LOG_PREFIX}  Error polling status of device {idx}: {e}")
+                    return None
+
+            backoff = interval = poll_backoff_min
+            while pending:
+                if self._wait_stop.wait(interval):
+                    if self.logger:
+                        self.logger.warning(f"{LOG_PREFIX}  Wait stopped with {len(pending)} device(s) still open")
+                    break
+
+                indices = list(pending)
+                if len(indices) > 1 and self._pool is not None:
+                    statuses = list(self._pool.map(_status_single, indices))
+                else:
+                    statuses = [_status_single(i) for i in indices]
+
+                now = time.monotonic()
+                remaining = None
+                for i, status in zip(indices, statuses):
+                    time_presets, deadline = pending[i]
+                    if status is None or not status.status_flags['mca_enabled']:
+                        results[i] = status is not None
+                        del pending[i]
+                    elif deadline is not None and now > deadline:
+                        if self.logger:
+                            self.logger.error(f"{LOG_PREFIX}  Device {i} did not close within the real time preset deadline (PRER={time_presets['real_time_sec']}s)")
+                        results[i] = False
+                        del pending[i]
+                    else:
+                        for status_key, preset in time_presets.items():
+                            left = preset - getattr(status, status_key)
+                            # Overdue presets (still enabled) fall back to the plain backoff
+                            if left > 0 and (remaining is None or left < remaining):
+                                remaining = left
+
+                backoff = min(backoff * poll_backoff_base, poll_backoff_max)
+                interval = backoff
+                if remaining is not None:
+                    # Wake up just after the earliest upcoming time preset is due
+                    interval = min(backoff, remaining + poll_backoff_min)
+
+            for i in pending:
+                results[i] = False
+            return {i: results[i] for i, _ in self._indexed_mcas}
+        finally:
+            # A stop request is consumed when the wait returns (not when it starts),
+            # so a stop_wait() issued while the wait was starting is not lost
+            self._wait_stop.end()
+
+    def stop_wait(self) -> bool:
+        """
+        Cancel a wait_until_mca_is_closed() running on all devices (e.g. from another thread).
+
+        Stops the wait of this instance and any AmptekMCA.wait_until_mca_is_closed()
+        running on a device (e.g. started with broadcast()). The devices are called
+        directly rather than through the worker pool, whose threads may be the ones
+        blocked in a device wait. As with AmptekMCA.stop_wait(), only running waits are
+        cancelled: with no wait running the request is discarded.
+
+        Returns:
+            True if at least one wait was running and has been asked to stop.
+        """
+        stopped = self._wait_stop.request()
+        for mca in self.mcas:
+            stopped = mca.stop_wait() or stopped
+        return stopped
 
     # Autoset helpers
     def autoset_input_offset(
@@ -504,21 +902,82 @@ class MultiAmptekMCA:
         )
         return {i: (v["ok"] if v["ok"] is None else (v["ok"] is True)) for i, v in br.items()}
     
+    def _get_config_helper(self) -> AmptekMCA:
+        """Return the (unconnected) AmptekMCA used to read configuration files, creating it once."""
+        if self._config_helper is None:
+            self._config_helper = AmptekMCA(logger=self.logger, logger_name="TempAmptekMCA")
+        return self._config_helper
+
     def get_available_default_configurations(self) -> Dict[str, List[str]]:
         """Get available default configurations. Delegates to AmptekMCA."""
-        temp_mca = AmptekMCA(logger=self.logger, logger_name="TempAmptekMCA")
-        return temp_mca.get_available_default_configurations()
+        return self._get_config_helper().get_available_default_configurations()
     
     def get_default_configuration(self, device_type: str, config_name: str):
         """Get default configuration. Delegates to AmptekMCA."""
-        temp_mca = AmptekMCA(logger=self.logger, logger_name="TempAmptekMCA")
-        return temp_mca.get_default_configuration(device_type, config_name)
+        return self._get_config_helper().get_default_configuration(device_type, config_name)
     
     def get_configuration_from_file(self, config_file_path: str, device_type: Optional[str] = None):
         """Get configuration from file. Delegates to AmptekMCA."""
-        temp_mca = AmptekMCA(logger=self.logger, logger_name="TempAmptekMCA")
-        return temp_mca.get_configuration_from_file(config_file_path, device_type=device_type)
+        return self._get_config_helper().get_configuration_from_file(config_file_path, device_type=device_type)
     
+    # Asyncio API (each device call runs in the event loop's default executor)
+    async def abroadcast(self,
+                         method_name: str,
+                         *args,
+                         device_type: Optional[str] = None,
+                         **kwargs) -> Dict[int, Dict[str, Any]]:
+        """
+        Asyncio version of broadcast(): calls an AmptekMCA method on all (or filtered)
+        devices concurrently and awaits all results.
+
+        Args:
+            method_name: Name of the AmptekMCA method to call.
+            *args: Positional arguments to pass to the method.
+            device_type: If provided, only devices whose model matches this string are targeted.
+            **kwargs: Keyword arguments to pass to the method.
+
+        Returns:
+            Same structure as broadcast().
+        """
+        loop = asyncio.get_running_loop()
+        calls = [
+            loop.run_in_executor(None, functools.partial(self._call_device, i, mca, method_name, args, kwargs, device_type))
+            for i, mca in self._indexed_mcas
+        ]
+        values = await asyncio.gather(*calls)
+        return dict(enumerate(values))
+
+    async def aget_status(self, silent: bool = False) -> Dict[int, Dict[str, Any]]:
+        """Asyncio version of get_status()."""
+        br = await self.abroadcast("get_status", silent=silent)
+        return {i: (v["result"] if v["ok"] else None) for i, v in br.items()}
+
+    async def aget_spectrum(self) -> Dict[int, Optional[Spectrum]]:
+        """Asyncio version of get_spectrum()."""
+        br = await self.abroadcast("get_spectrum")
+        return {i: (v["result"] if v["ok"] else None) for i, v in br.items()}
+
+    async def aclear_spectrum(self) -> Dict[int, bool]:
+        """Asyncio version of clear_spectrum()."""
+        br = await self.abroadcast("clear_spectrum")
+        return {i: (v["ok"] is True) for i, v in br.items()}
+
+    async def aenable_mca(self) -> Dict[int, bool]:
+        """Asyncio version of enable_mca()."""
+        br = await self.abroadcast("enable_mca")
+        return {i: (v["ok"] is True) for i, v in br.items()}
+
+    async def adisable_mca(self) -> Dict[int, bool]:
+        """Asyncio version of disable_mca()."""
+        br = await self.abroadcast("disable_mca")
+        return {i: (v["ok"] is True) for i, v in br.items()}
+
+    async def await_until_mca_is_closed(self, time_between_checks: float = 1.0, **kwargs) -> Dict[int, bool]:
+        """Asyncio version of wait_until_mca_is_closed(); the shared polling loop runs in the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.wait_until_mca_is_closed, time_between_checks, **kwargs))
+
     # Static methods (delegated to AmptekMCA)
     @staticmethod
     def install_libusb(logger: Optional[logging.Logger] = None) -> None:
@@ -539,6 +998,15 @@ class MultiAmptekMCA:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.disconnect()
+
+    async def __aenter__(self):
+        """Async context manager entry (connects in the default executor)."""
+        await asyncio.get_running_loop().run_in_executor(None, self.connect)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit (disconnects in the default executor)."""
+        await asyncio.get_running_loop().run_in_executor(None, self.disconnect)
     
     def __len__(self):
         """Return number of devices."""
@@ -0,0 +1,652 @@
+import array
+import collections
+import ctypes
+import logging
+import random
+import struct
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+try:
+    import usb.core
+    import cfis_utils  # noqa: F401
+except ImportError:
+    raise unittest.SkipTest("pyusb and cfis-utils are required")
+
+from cfis_interfaces.amptek_mca import amptek_mca
+from cfis_interfaces.amptek_mca.amptek_mca import (
+    AmptekMCA, AmptekMCAError, AmptekStatus, DEVICE_LIST_TTL_SEC, REQ_STATUS, REQ_SPECTRUM,
+    REQ_TEXT_CONFIG, REQ_TEXT_CONFIG_NO_SAVE,
+    _U32_TYPECODE, _byte_sum, _decode_spectrum, _find_amptek_devices, _invalidate_device_list_cache, _pad_spectrum,
+)
+
+
+def _make_mca():
+    logger = logging.getLogger("test_amptek_mca")
+    logger.setLevel(logging.CRITICAL)
+    return AmptekMCA(logger=logger)
+
+
+def _status_record(mca_enabled=True, acquisition_time_sec=0.0, real_time_sec=0.0):
+    return AmptekStatus(
+        fast_count=0, slow_count=0, gp_counter=0,
+        acquisition_time_sec=acquisition_time_sec, real_time_sec=real_time_sec,
+        firmware_version="6.01", fpga_version="6.01", serial_number=1, hv=0.0,
+        detector_temp_k=0.0, board_temp_c=0, device_id="PX5",
+        status_flags={"mca_enabled": mca_enabled}, bootloader_version="Unknown",
+    )
+
+
+def _open_mca(presets=None):
+    """AmptekMCA whose MCA stays enabled, with a 100 s accumulation time preset."""
+    mca = _make_mca()
+    mca.model = "PX5"
+    mca.get_status_record = mock.Mock(return_value=_status_record())
+    mca.read_configuration = mock.Mock(return_value=presets or {"PRET": "100", "PRER": "OFF", "PREC": "OFF"})
+    return mca
+
+
+def _reference_request_packet(pid1, pid2, data=None):
+    """Request packet built the straightforward way (header + data + two's complement checksum)."""
+    data = data or b''
+    packet = struct.pack('>BBBBH', 0xF5, 0xFA, pid1, pid2, len(data)) + data
+    return packet + struct.pack('>H', (~sum(packet) + 1) & 0xFFFF)
+
+
+def _reference_configuration_payloads(config):
+    """Configuration payloads built the straightforward way (RESC=Y first, then CMD=VAL; packed up to 512 bytes)."""
+    config = dict(config)
+    parts = []
+    resc_key = next((key for key in config if str(key).upper() == 'RESC'), None)
+    if resc_key is not None and str(config[resc_key]).upper() in ('Y', 'YES', 'TRUE', '1'):
+        parts.append(f"RESC={str(config.pop(resc_key)).upper()};".encode('ascii'))
+    parts += [f"{str(key).upper()}={value};".encode('ascii') for key, value in config.items()]
+    payloads = []
+    for part in parts:
+        if payloads and len(payloads[-1]) + len(part) <= 512:
+            payloads[-1] += part
+        else:
+            payloads.append(part)
+    return tuple(payloads)
+
+
+class DeviceListCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        _invalidate_device_list_cache()
+        self.addCleanup(_invalidate_device_list_cache)
+        scans = [("dev-a",), ("dev-a", "dev-b"), ("dev-c",)]
+        patches = (
+            mock.patch.object(amptek_mca, "time"),
+            mock.patch.object(amptek_mca.usb.core, "find", side_effect=lambda **kwargs: iter(scans.pop(0))),
+            mock.patch.object(amptek_mca, "_get_usb_backend", return_value=mock.sentinel.backend),
+        )
+        self.time, self.find, _ = (patch.start() for patch in patches)
+        for patch in patches:
+            self.addCleanup(patch.stop)
+        self.time.monotonic.return_value = 100.0
+
+    def test_cache_hit_within_ttl(self):
+        first = _find_amptek_devices()
+        self.time.monotonic.return_value = 100.0 + DEVICE_LIST_TTL_SEC - 0.1
+        self.assertIs(_find_amptek_devices(), first)
+        self.assertEqual(first, ("dev-a",))
+        self.find.assert_called_once_with(find_all=True, idVendor=AmptekMCA.VENDOR_ID,
+                                          idProduct=AmptekMCA.PRODUCT_ID, backend=mock.sentinel.backend)
+
+    def test_expired_cache_rescans(self):
+        _find_amptek_devices()
+        self.time.monotonic.return_value = 100.0 + DEVICE_LIST_TTL_SEC
+        self.assertEqual(_find_amptek_devices(), ("dev-a", "dev-b"))
+        # max_age_sec=0 always rescans
+        self.assertEqual(_find_amptek_devices(max_age_sec=0), ("dev-c",))
+        self.assertEqual(self.find.call_count, 3)
+
+    def test_invalidate_forces_rescan(self):
+        _find_amptek_devices()
+        _invalidate_device_list_cache()
+        self.assertEqual(_find_amptek_devices(), ("dev-a", "dev-b"))
+        self.assertEqual(self.find.call_count, 2)
+
+
+class ChecksumTest(unittest.TestCase):
+
+    def test_byte_sum_matches_sum(self):
+        rng = random.Random(0)
+        for size in (0, 1, 7, 8, 63, 64, 65, 255, 256, 257, 512, 1000, 4096, 32775):
+            for data in (bytes(rng.randrange(256) for _ in range(size)), b'\xff' * size):
+                self.assertEqual(_byte_sum(data), sum(data), size)
+                self.assertEqual(_byte_sum(memoryview(bytearray(data))), sum(data), size)
+
+    def test_byte_sum_around_small_buffer_threshold(self):
+        # Both sides of the sum()/zlib switch, on views that do not start at offset 0
+        data = bytes(range(256)) * 2
+        for size in range(120, 137):
+            for buf in (data[3:3 + size], bytearray(data[3:3 + size]), memoryview(data)[3:3 + size]):
+                self.assertEqual(_byte_sum(buf), sum(data[3:3 + size]), size)
+
+    def test_calculate_checksum(self):
+        mca = _make_mca()
+        rng = random.Random(1)
+        for size in (0, 6, 100, 3000):
+            data = bytes(rng.randrange(256) for _ in range(size))
+            checksum = mca._calculate_checksum(data)
+            self.assertEqual(checksum, (~sum(data) + 1) & 0xFFFF)
+            self.assertEqual((sum(data) + checksum) & 0xFFFF, 0)
+
+
+class RequestPacketTest(unittest.TestCase):
+
+    def test_matches_reference_builder(self):
+        mca = _make_mca()
+        rng = random.Random(2)
+        for pid1, pid2 in (REQ_STATUS, REQ_SPECTRUM, (0x20, 0x02), (0xF0, 0x02), (0x7E, 0x33)):
+            for data in (None, b'', b'X', b'MCAC=1024;', bytes(rng.randrange(256) for _ in range(512))):
+                expected = _reference_request_packet(pid1, pid2, data)
+                self.assertEqual(mca._build_request_packet_into(pid1, pid2, data).tobytes(), expected)
+                self.assertEqual(mca._build_request_packet(pid1, pid2, data), expected)
+
+    def test_rejects_oversized_data(self):
+        with self.assertRaises(ValueError):
+            _make_mca()._build_request_packet(0x20, 0x02, b'x' * 513)
+
+    def test_into_reuses_transmit_buffer(self):
+        mca = _make_mca()
+        first = mca._build_request_packet_into(*REQ_STATUS)
+        second = mca._build_request_packet_into(*REQ_SPECTRUM)
+        self.assertIs(first, second)
+        self.assertEqual(second.tobytes(), _reference_request_packet(*REQ_SPECTRUM))
+
+
+class FakeEndpointIn:
+    """
+    Bulk IN endpoint serving the given device transfers in order. A read asking for more
+    bytes than the current transfer has left times out if that transfer ended on a full
+    64-byte packet, as no zero-length packet follows it; otherwise it returns the short rest.
+    """
+
+    PACKET_SIZE = 64
+
+    def __init__(self, *transfers):
+        self.transfers = [bytes(t) for t in transfers]
+        self.requested = []
+
+    def read(self, buf, timeout=None):
+        self.requested.append(len(buf))
+        if not self.transfers:
+            raise usb.core.USBTimeoutError("Operation timed out")
+        transfer = self.transfers[0]
+        if len(buf) > len(transfer) and len(transfer) % self.PACKET_SIZE == 0:
+            raise usb.core.USBTimeoutError("Operation timed out")
+        chunk, self.transfers[0] = transfer[:len(buf)], transfer[len(buf):]
+        if not self.transfers[0]:
+            self.transfers.pop(0)
+        buf[:len(chunk)] = array.array('B', chunk)
+        return len(chunk)
+
+
+class ReadResponseTest(unittest.TestCase):
+
+    @staticmethod
+    def _mca_reading(*transfers):
+        mca = _make_mca()
+        mca.dev = mock.Mock()
+        mca.ep_in = FakeEndpointIn(*transfers)
+        return mca
+
+    def test_packet_aligned_to_endpoint_size(self):
+        # 6 + 120 + 2 = 128 bytes, two full 64-byte USB packets and no zero-length packet after them
+        data = bytes(range(120))
+        packet = _reference_request_packet(0x81, 0x01, data)
+        mca = self._mca_reading(packet)
+        self.assertEqual(mca._read_response(), (0x81, 0x01, data))
+        self.assertEqual(mca.ep_in.requested, [6, 122])
+
+    def test_header_in_its_own_transfer(self):
+        data = b'MCAC=1024;'
+        packet = _reference_request_packet(0x82, 0x07, data)
+        mca = self._mca_reading(packet[:6], packet[6:])
+        pid1, pid2, payload = mca._read_response(copy=False)
+        self.assertEqual((pid1, pid2, payload.tobytes()), (0x82, 0x07, data))
+        self.assertTrue(payload.readonly)
+
+    def test_empty_payload(self):
+        mca = self._mca_reading(_reference_request_packet(0xFF, 0x00))
+        self.assertEqual(mca._read_response(), (0xFF, 0x00, None))
+
+    def test_short_remainder_and_bad_checksum(self):
+        packet = _reference_request_packet(0x81, 0x01, b'\x01\x02\x03')
+        with self.assertRaisesRegex(AmptekMCAError, "data\\+checksum"):
+            self._mca_reading(packet[:6], packet[6:-1])._read_response()
+        corrupt = packet[:-1] + bytes(((packet[-1] + 1) & 0xFF,))
+        with self.assertRaisesRegex(AmptekMCAError, "Checksum mismatch"):
+            self._mca_reading(corrupt)._read_response()
+
+
+class DecodeSpectrumTest(unittest.TestCase):
+
+    def test_decode_widths(self):
+        rng = random.Random(3)
+        for width in (2, 3, 4):
+            counts = [rng.randrange(256 ** width) for _ in range(1024)] + [0, 256 ** width - 1]
+            payload = b''.join(c.to_bytes(width, 'little') for c in counts)
+            self.assertEqual(_decode_spectrum(payload, len(counts), width).tolist(), counts)
+            # Extra trailing bytes are ignored
+            self.assertEqual(_decode_spectrum(payload + b'\x01' * width, len(counts), width).tolist(), counts)
+
+    def test_decode_errors(self):
+        with self.assertRaises(ValueError):
+            _decode_spectrum(b'\x00' * 5, 2, 3)
+        with self.assertRaises(ValueError):
+            _decode_spectrum(b'\x00' * 8, 2, 5)
+
+    def test_pad_spectrum_leaves_high_bytes_zero(self):
+        for width in (2, 3):
+            counts = [0, 1, 0x1234, 256 ** width - 1]
+            payload = b''.join(c.to_bytes(width, 'little') for c in counts)
+            for buf in (payload, bytearray(payload), memoryview(payload)):
+                padded = _pad_spectrum(buf, len(counts), width)
+                self.assertEqual(len(padded), 4 * len(counts))
+                self.assertEqual(array.array(_U32_TYPECODE, padded).tolist(), counts)
+
+
+class ParseStatusTest(unittest.TestCase):
+
+    @staticmethod
+    def _status_packet():
+        packet = bytearray(64)
+        struct.pack_into('<III', packet, 0, 1234, 567, 89)
+        packet[12:16] = bytes((7, 0x10, 0x02, 0x00))   # 7 ms + 0x210 * 100 ms
+        struct.pack_into('<I', packet, 20, 1500)       # real time, 1 ms/count
+        packet[24] = 0x61                              # firmware 6.01
+        packet[25] = 0x62                              # FPGA 6.02
+        struct.pack_into('<I', packet, 26, 12345)      # serial number
+        struct.pack_into('>h', packet, 30, -220)       # HV, 0.5 V/count
+        packet[32:34] = bytes((0x0B, 0xB8))            # detector temp 3000 * 0.1 K
+        packet[34] = 0xF6                              # board temp -10 C
+        packet[35] = 0x20 | 0x40 | 0x02                # MCA enabled, fast threshold locked, configured
+        packet[36] = 0x02                              # 80 MHz clock, input offset locked
+        packet[37] = 0x03                              # firmware build 03
+        packet[38] = 0xC0                              # HV jumper OK, positive HV polarity
+        packet[39] = 1                                 # PX5
+        packet[48] = 0x80                              # bootloader 7.00.00
+        return bytes(packet)
+
+    @staticmethod
+    def _mca_returning(packet):
+        mca = _make_mca()
+        mca._get_status_bytes = mock.Mock(return_value=packet)
+        return mca
+
+    def test_known_packet(self):
+        status = self._mca_returning(self._status_packet()).get_status(silent=True)
+        expected_floats = {'acquisition_time_sec': 52.807, 'real_time_sec': 1.5, 'hv': -110.0, 'detector_temp_k': 300.0}
+        for key, value in expected_floats.items():
+            self.assertAlmostEqual(status.pop(key), value, places=9, msg=key)
+        self.assertEqual(status, {
+            'fast_count': 1234,
+            'slow_count': 567,
+            'gp_counter': 89,
+            'firmware_version': '6.01.03',
+            'fpga_version': '6.02',
+            'serial_number': 12345,
+            'board_temp_c': -10,
+            'device_id': 'PX5',
+            'status_flags': {
+                'auto_input_offset_locked': True,
+                'mcs_finished': False,
+                'is_first_packet_since_reboot': False,
+                'fpga_clock_80mhz': True,
+                'fpga_clock_auto_selected': False,
+                'preset_real_time_reached': False,
+                'mca_enabled': True,
+                'preset_counts_reached': False,
+                'gate_active': False,
+                'scope_data_ready': False,
+                'unit_configured': True,
+                'hv_jumper_ok': True,
+                'hv_polarity_positive': True,
+                'preamp_supply_8_5v': False,
+                'auto_fast_thresh_locked': True,
+            },
+            'bootloader_version': '7.00.00',
+        })
+
+    def test_device_specific_flags(self):
+        common = [
+            'auto_input_offset_locked', 'mcs_finished', 'is_first_packet_since_reboot', 'fpga_clock_80mhz',
+            'fpga_clock_auto_selected', 'preset_real_time_reached', 'mca_enabled', 'preset_counts_reached',
+            'gate_active', 'scope_data_ready', 'unit_configured',
+        ]
+        device_flags = {
+            0: ('DP5', ['pc5_detected', 'hv_polarity_positive', 'preamp_supply_8_5v', 'auto_fast_thresh_locked']),
+            1: ('PX5', ['hv_jumper_ok', 'hv_polarity_positive', 'preamp_supply_8_5v', 'auto_fast_thresh_locked']),
+            2: ('DP5G', ['pc5_detected', 'auto_fast_thresh_locked']),
+            3: ('MCA8000D', ['preset_livetime_reached']),
+            4: ('TB5', ['pc5_detected', 'auto_fast_thresh_locked']),
+            5: ('DP5-X', ['hv_polarity_positive', 'auto_fast_thresh_locked']),
+        }
+        for device_byte, (device_id, extra) in device_flags.items():
+            packet = bytearray(self._status_packet())
+            packet[39] = device_byte
+            status = self._mca_returning(bytes(packet)).get_status(silent=True)
+            self.assertEqual(status['device_id'], device_id)
+            flags = status['status_flags']
+            self.assertEqual(list(flags), common + extra, device_id)
+            # Byte 38 is 0xC0 and bit 6 of byte 35 is set in the test packet
+            for name in ('pc5_detected', 'hv_polarity_positive', 'auto_fast_thresh_locked', 'preset_livetime_reached'):
+                if name in flags:
+                    self.assertTrue(flags[name], (device_id, name))
+            if 'preamp_supply_8_5v' in flags:
+                self.assertFalse(flags['preamp_supply_8_5v'], device_id)
+
+    def test_status_record(self):
+        mca = self._mca_returning(self._status_packet())
+        record = mca.get_status_record(silent=True)
+        self.assertIsInstance(record, AmptekStatus)
+        self.assertEqual((record.fast_count, record.serial_number, record.device_id), (1234, 12345, 'PX5'))
+        self.assertTrue(record.status_flags['mca_enabled'])
+        self.assertEqual(mca.last_status, {})
+        status = mca.get_status(silent=True)
+        self.assertEqual(status, record.asdict())
+        self.assertEqual(mca.last_status, status)
+
+    def test_hv_sign_and_bootloader_version(self):
+        mca = _make_mca()
+        for raw, volts in ((0, 0.0), (1, 0.5), (0x7FFF, 16383.5), (-1, -0.5), (-0x8000, -16384.0)):
+            packet = bytearray(self._status_packet())
+            struct.pack_into('>h', packet, 30, raw)
+            self.assertEqual(mca._parse_status(bytes(packet)).hv, volts)
+        for byte, version in ((0xFF, 'Original'), (0x80, '7.00.00'), (0x7F, '7.00.01'), (0x12, 'Unknown (0x12)')):
+            packet = bytearray(self._status_packet())
+            packet[48] = byte
+            self.assertEqual(mca._parse_status(bytes(packet)).bootloader_version, version)
+
+
+class StopWaitTest(unittest.TestCase):
+
+    WAIT_KWARGS = dict(time_between_checks=5, poll_backoff_min=5, poll_backoff_base=1, timeout_factor=None)
+
+    def test_stop_from_another_thread(self):
+        mca = _open_mca()
+        timer = threading.Timer(0.2, mca.stop_wait)
+        timer.start()
+        start = time.monotonic()
+        mca.wait_until_mca_is_closed(**self.WAIT_KWARGS)
+        timer.join()
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertFalse(mca._wait_stop.is_set())
+
+    def test_stop_while_reading_presets_is_not_lost(self):
+        mca = _open_mca()
+        started = threading.Event()
+        read_configuration = mca.read_configuration
+
+        def _slow_read(commands):
+            # stop_wait() arrives while the wait is still reading the presets
+            started.set()
+            time.sleep(0.2)
+            return read_configuration(commands)
+
+        mca.read_configuration = _slow_read
+        thread = threading.Thread(target=mca.wait_until_mca_is_closed, kwargs=self.WAIT_KWARGS)
+        start = time.monotonic()
+        thread.start()
+        started.wait(1)
+        mca.stop_wait()
+        thread.join(3)
+        self.assertFalse(thread.is_alive())
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertFalse(mca._wait_stop.is_set())
+
+    def test_stop_without_running_wait_is_discarded(self):
+        mca = _open_mca()
+        self.assertFalse(mca.stop_wait())
+        self.assertFalse(mca._wait_stop.is_set())
+        # The next wait runs until the MCA closes on the third status read
+        mca.get_status_record.side_effect = [_status_record(), _status_record(), _status_record(mca_enabled=False)]
+        mca.wait_until_mca_is_closed(time_between_checks=0.01, poll_backoff_min=0.01, poll_backoff_base=1)
+        self.assertEqual(mca.get_status_record.call_count, 3)
+
+
+class PollScheduleTest(unittest.TestCase):
+
+    def test_overdue_time_preset_uses_backoff(self):
+        # PRET reached but the MCA still reports enabled (e.g. gated acquisition)
+        mca = _open_mca()
+        mca.get_status_record.return_value = _status_record(acquisition_time_sec=200.0)
+        timer = threading.Timer(0.5, mca.stop_wait)
+        timer.start()
+        mca.wait_until_mca_is_closed(time_between_checks=0.4, poll_backoff_min=0.05, poll_backoff_base=2)
+        timer.join()
+        # Initial status + polls at about 0.05, 0.15 and 0.35 s, instead of one every 0.05 s
+        self.assertLessEqual(mca.get_status_record.call_count, 5)
+
+
+class GetSpectrumIntoTest(unittest.TestCase):
+
+    @staticmethod
+    def _mca_with_spectrum(counts):
+        mca = _make_mca()
+        mca._get_spectrum_bytes = mock.Mock(return_value=b''.join(c.to_bytes(3, 'little') for c in counts))
+        return mca
+
+    def test_decodes_into_native_uint32_buffers(self):
+        counts = [1, 0xFFFFFF, 0x123456]
+        buffers = [array.array(_U32_TYPECODE, [0xDEADBEEF] * 4), memoryview(bytearray(16)).cast('I')]
+        if sys.byteorder == 'little':
+            buffers.append((ctypes.c_uint32 * 4)())  # format '<I'
+        for out in buffers:
+            mca = self._mca_with_spectrum(counts)
+            self.assertEqual(mca.get_spectrum_into(out), 3)
+            self.assertEqual(list(out[:3]), counts)
+        # Items beyond the number of channels are left untouched
+        self.assertEqual(buffers[0][3], 0xDEADBEEF)
+
+    def test_rejects_unsuitable_buffers(self):
+        rejected = {
+            "read-only": bytes(16),
+            "signed": array.array('i', [0] * 4),
+            "float": array.array('f', [0.0] * 4),
+            "16-bit": array.array('H', [0] * 8),
+            "non-contiguous": memoryview(array.array(_U32_TYPECODE, [0] * 8))[::2],
+        }
+        if sys.byteorder == 'little':
+            rejected["big-endian"] = (ctypes.c_uint32.__ctype_be__ * 4)()
+        for name, out in rejected.items():
+            mca = self._mca_with_spectrum([1, 2, 3])
+            with self.assertRaises(ValueError, msg=name):
+                mca.get_spectrum_into(out)
+            mca._get_spectrum_bytes.assert_not_called()
+
+    def test_rejects_buffer_too_small(self):
+        mca = self._mca_with_spectrum([1, 2, 3])
+        with self.assertRaisesRegex(ValueError, "too small"):
+            mca.get_spectrum_into(array.array(_U32_TYPECODE, [0, 0]))
+
+
+class ConfigurationPayloadsTest(unittest.TestCase):
+
+    CONFIGS = (
+        {},
+        {"MCAC": 1024},
+        {"mcac": "1024", "Gain": 20.5, "RESC": "y", "pure": "ON"},
+        {"RESC": "N", "MCAC": "512"},
+        {f"P{i:03d}": "X" * (i % 40) for i in range(120)},
+        {"THSL": "1.5", "resc": "true", **{f"S{i:03d}": str(i) * 20 for i in range(60)}},
+    )
+
+    def test_matches_reference_builder(self):
+        mca = _make_mca()
+        for config in self.CONFIGS:
+            with self.subTest(keys=list(config)[:4]):
+                payloads = mca._build_configuration_payloads(config)
+                self.assertEqual(payloads, _reference_configuration_payloads(config))
+                self.assertTrue(all(len(payload) <= 512 for payload in payloads))
+
+    def test_send_configuration_sends_payloads_unchanged(self):
+        config = self.CONFIGS[-1]
+        for save_to_flash in (False, True):
+            with self.subTest(save_to_flash=save_to_flash):
+                mca = _make_mca()
+                mca._transaction = mock.Mock()
+                with mock.patch.object(amptek_mca.time, "sleep"):
+                    mca.send_configuration(config, save_to_flash=save_to_flash)
+                sent = [(c.args[0], c.args[1], c.args[2]) for c in mca._transaction.call_args_list]
+                expected = _reference_configuration_payloads(config)
+                self.assertEqual([payload for _, _, payload in sent], list(expected))
+                last_pids = REQ_TEXT_CONFIG if save_to_flash else REQ_TEXT_CONFIG_NO_SAVE
+                self.assertEqual([pids[:2] for pids in sent], [REQ_TEXT_CONFIG_NO_SAVE] * (len(expected) - 1) + [last_pids])
+
+    def test_rejects_invalid_commands(self):
+        mca = _make_mca()
+        for config in ({"MCAC": "1" * 512}, {"MCAC": "\u00b5"}):
+            with self.subTest(config=config):
+                with self.assertRaises(ValueError):
+                    mca._build_configuration_payloads(config)
+
+
+class ApplyConfigurationTest(unittest.TestCase):
+
+    @staticmethod
+    def _mca(device_config=None):
+        mca = _make_mca()
+        mca.model = "PX5"
+        device_config = device_config or {}
+        mca.read_configuration = mock.Mock(side_effect=lambda commands: {c: device_config[c] for c in commands if c in device_config})
+        mca.send_configuration = mock.Mock()
+        mca.set_HVSE = mock.Mock()
+        return mca
+
+    @staticmethod
+    def _apply(mca, config, **kwargs):
+        mca._apply_configuration_dict(collections.OrderedDict(config), "'test'", **kwargs)
+
+    def test_skip_unchanged_sends_nothing_when_all_values_match(self):
+        mca = self._mca({"MCAC": "1024", "GAIN": "20.5", "PURE": "ON"})
+        self._apply(mca, {"MCAC": 1024, "GAIN": "20.5", "PURE": "on", "RESC": "Y"}, skip_unchanged=True)
+        # RESC is not read back, values compare as case-insensitive strings
+        mca.read_configuration.assert_called_once_with(["MCAC", "GAIN", "PURE"])
+        mca.send_configuration.assert_not_called()
+
+    def test_skip_unchanged_sends_everything_when_one_value_differs(self):
+        mca = self._mca({"MCAC": "1024", "GAIN": "10.0", "PURE": "ON"})
+        config = {"MCAC": "1024", "GAIN": "20.5", "PURE": "ON", "RESC": "Y"}
+        self._apply(mca, config, skip_unchanged=True)
+        mca.send_configuration.assert_called_once_with(collections.OrderedDict(config), save_to_flash=False)
+
+    def test_skip_unchanged_sends_when_readback_fails(self):
+        mca = self._mca()
+        mca.read_configuration.side_effect = AmptekMCAError("readback failed")
+        self._apply(mca, {"MCAC": "1024"}, skip_unchanged=True)
+        mca.send_configuration.assert_called_once()
+
+    def test_skip_unchanged_is_ignored_when_saving_to_flash(self):
+        mca = self._mca({"MCAC": "1024"})
+        self._apply(mca, {"MCAC": "1024"}, skip_unchanged=True, save_to_flash=True)
+        mca.read_configuration.assert_not_called()
+        mca.send_configuration.assert_called_once_with(collections.OrderedDict({"MCAC": "1024"}), save_to_flash=True)
+
+    def test_readback_templates_fit_in_512_bytes(self):
+        config = {f"P{i:03d}": str(i) for i in range(150)}  # 150 * len("Pnnn;") = 750 bytes
+        mca = self._mca(config)
+        self.assertTrue(mca._configuration_matches_device(config))
+        batches = [c.args[0] for c in mca.read_configuration.call_args_list]
+        self.assertEqual(len(batches), 2)
+        self.assertTrue(all(sum(len(command) + 1 for command in batch) <= 512 for batch in batches))
+        self.assertEqual([command for batch in batches for command in batch], list(config))
+
+    def test_invalid_hvse_is_rejected_before_anything_is_sent(self):
+        for hvse in ("abc", "1e400", "nan", float("inf"), [1000]):
+            with self.subTest(hvse=hvse):
+                mca = self._mca()
+                with self.assertRaises(ValueError):
+                    self._apply(mca, {"MCAC": "1024", "HVSE": hvse})
+                mca.send_configuration.assert_not_called()
+                mca.set_HVSE.assert_not_called()
+
+    def test_hvse_off_and_zero_set_zero_volts_after_the_main_configuration(self):
+        for hvse in ("OFF", " off ", 0, "0", "-0.0"):
+            with self.subTest(hvse=hvse):
+                mca = self._mca()
+                calls = mock.Mock()
+                calls.attach_mock(mca.send_configuration, "send_configuration")
+                calls.attach_mock(mca.set_HVSE, "set_HVSE")
+                self._apply(mca, {"MCAC": "1024", "HVSE": hvse})
+                self.assertEqual([c[0] for c in calls.mock_calls], ["send_configuration", "set_HVSE"])
+                mca.send_configuration.assert_called_once_with(collections.OrderedDict({"MCAC": "1024"}), save_to_flash=False)
+                self.assertEqual(mca.set_HVSE.call_args.args, (0.0,))
+
+    def test_skip_hvse_does_not_validate_or_set_it(self):
+        mca = self._mca()
+        self._apply(mca, {"MCAC": "1024", "HVSE": "abc"}, skip_hvse=True)
+        mca.send_configuration.assert_called_once()
+        mca.set_HVSE.assert_not_called()
+
+
+class SubmitTest(unittest.TestCase):
+
+    @staticmethod
+    def _mca_with_slow_status(connected):
+        mca = _make_mca()
+        mca.dev = mock.Mock() if connected else None
+        seen = []
+
+        def _get_status(silent=False):
+            time.sleep(0.05)
+            seen.append(mca.dev is not None)
+            return len(seen)
+
+        mca.get_status = _get_status
+        return mca, seen
+
+    def test_disconnect_completes_submitted_commands(self):
+        mca, seen = self._mca_with_slow_status(connected=True)
+        futures = [mca.submit("get_status", silent=True) for _ in range(5)]
+        with mock.patch("usb.util.dispose_resources") as dispose:
+            mca.disconnect()
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual([future.result() for future in futures], [1, 2, 3, 4, 5])
+        # Every command ran before the device was released
+        self.assertEqual(seen, [True] * 5)
+        dispose.assert_called_once()
+        self.assertIsNone(mca.dev)
+        self.assertIsNone(mca._executor)
+
+    def test_disconnect_when_not_connected_stops_the_worker(self):
+        mca, seen = self._mca_with_slow_status(connected=False)
+        futures = [mca.submit("get_status") for _ in range(3)]
+        mca.disconnect()
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(len(seen), 3)
+        self.assertIsNone(mca._executor)
+
+
+class IterSpectrumCountsTest(unittest.TestCase):
+
+    def test_close_does_not_wait_for_a_blocked_read(self):
+        mca = _make_mca()
+        mca.READER_STOP_TIMEOUT_SEC = 0.2
+        release = threading.Event()
+        calls = []
+
+        def _get_spectrum_bytes(copy=True):
+            calls.append(copy)
+            if len(calls) > 1:
+                release.wait(5)  # simulates a read blocked up to LONG_TIMEOUT
+            return bytes([1, 0, 0, 2, 0, 0])
+
+        mca._get_spectrum_bytes = _get_spectrum_bytes
+        spectra = mca.iter_spectrum_counts()
+        self.assertEqual(next(spectra).tolist(), [1, 2])
+        start = time.monotonic()
+        spectra.close()
+        self.assertLess(time.monotonic() - start, 2)
+        release.set()
+
+
+if __name__ == "__main__":
+    unittest.main()
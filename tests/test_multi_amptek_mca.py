@@ -0,0 +1,382 @@
+import asyncio
+import logging
+import threading
+import time
+import unittest
+from unittest import mock
+
+try:
+    import usb  # noqa: F401
+    import cfis_utils  # noqa: F401
+except ImportError:
+    raise unittest.SkipTest("pyusb and cfis-utils are required")
+
+from cfis_interfaces.amptek_mca import multi_amptek_mca
+from cfis_interfaces.amptek_mca.amptek_mca import AmptekMCA, AmptekMCAError, AmptekStatus
+from cfis_interfaces.amptek_mca.multi_amptek_mca import MultiAmptekMCA
+
+
+def _counts_bytes(counts):
+    return b''.join(c.to_bytes(3, 'little') for c in counts)
+
+
+class FakeMCA:
+    """Stands in for a connected AmptekMCA; no USB access."""
+
+    def __init__(self, model="PX5", spectrum=b'', error=None):
+        self.model = model
+        self.spectrum = spectrum
+        self.error = error
+        self.connected = False
+
+    def connect(self, device_index=0):
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def get_model(self):
+        return self.model
+
+    def clear_spectrum(self):
+        if self.error is not None:
+            raise self.error
+
+    def echo(self, value, delay=0.0):
+        time.sleep(delay)
+        if self.error is not None:
+            raise self.error
+        return value
+
+    def _get_spectrum_bytes(self):
+        if self.error is not None:
+            raise self.error
+        return self.spectrum
+
+
+def _make_multi(devices, connect=False):
+    logger = logging.getLogger("test_multi_amptek_mca")
+    logger.setLevel(logging.CRITICAL)
+    with mock.patch.object(multi_amptek_mca, "_find_amptek_devices", return_value=[]):
+        multi = MultiAmptekMCA(logger=logger)
+    multi.mcas = list(devices)
+    multi.device_count = len(devices)
+    multi._indexed_mcas = tuple(enumerate(multi.mcas))
+    if connect:
+        multi._pool = multi._create_pool()
+    return multi
+
+
+def _open_mca():
+    """AmptekMCA whose MCA stays enabled, with a 100 s accumulation time preset."""
+    mca = AmptekMCA(logger=logging.getLogger("test_multi_amptek_mca"))
+    mca.model = "PX5"
+    mca.get_status_record = mock.Mock(return_value=AmptekStatus(
+        fast_count=0, slow_count=0, gp_counter=0, acquisition_time_sec=0.0, real_time_sec=0.0,
+        firmware_version="6.01", fpga_version="6.01", serial_number=1, hv=0.0,
+        detector_temp_k=0.0, board_temp_c=0, device_id="PX5",
+        status_flags={"mca_enabled": True}, bootloader_version="Unknown"))
+    mca.read_configuration = mock.Mock(return_value={"PRET": "100", "PRER": "OFF", "PREC": "OFF"})
+    return mca
+
+
+def _usb_device(bus, address, ports):
+    return mock.Mock(bus=bus, address=address, port_numbers=ports)
+
+
+class _FakeBusTestCase(unittest.TestCase):
+    """Three Amptek devices on the bus, discovered without USB access."""
+
+    def setUp(self):
+        self.logger = logging.getLogger("test_multi_amptek_mca.discover")
+        self.logger.setLevel(logging.INFO)
+        self.devices = (
+            _usb_device(2, 4, (4,)),
+            _usb_device(1, 7, (2, 3)),
+            _usb_device(1, 5, (1,)),
+        )
+
+    def _discover(self, device_paths=None):
+        with mock.patch.object(multi_amptek_mca, "_find_amptek_devices", return_value=self.devices) as find:
+            multi = MultiAmptekMCA(logger=self.logger, device_paths=device_paths)
+        find.assert_called_once_with()
+        return multi
+
+
+class DiscoverDevicesTest(_FakeBusTestCase):
+
+    def test_all_devices_ordered_by_bus_and_address(self):
+        multi = self._discover()
+        self.assertEqual([mca._usb_device for mca in multi.mcas], [self.devices[2], self.devices[1], self.devices[0]])
+        self.assertEqual([mca.device_index for mca in multi.mcas], [1, 2, 3])
+        self.assertEqual(multi._indexed_mcas, tuple(enumerate(multi.mcas)))
+
+    def test_device_paths_select_and_order(self):
+        multi = self._discover(["2-4", "1-2.3"])
+        self.assertEqual(multi.device_count, 2)
+        self.assertEqual([mca._usb_device for mca in multi.mcas], [self.devices[0], self.devices[1]])
+        self.assertEqual([mca.device_index for mca in multi.mcas], [1, 2])
+
+    def test_unmatched_device_path_is_logged_and_skipped(self):
+        with self.assertLogs(self.logger, level="WARNING") as logs:
+            multi = self._discover(["1-9", "1-1"])
+        self.assertEqual([mca._usb_device for mca in multi.mcas], [self.devices[2]])
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("No Amptek device found at USB path '1-9'", logs.output[0])
+
+
+class RefreshDevicesTest(_FakeBusTestCase):
+
+    def _refresh(self, multi, devices):
+        for mca in multi.mcas:
+            mca.disconnect = mock.Mock()
+        with mock.patch.object(multi_amptek_mca, "_find_amptek_devices", return_value=devices) as find:
+            changes = multi.refresh_devices()
+        find.assert_called_once_with(max_age_sec=0)
+        return changes
+
+    def test_rescan_rebuilds_device_lists_together(self):
+        multi = self._discover()
+        kept, removed = multi.mcas[2], multi.mcas[:2]
+        new_device = _usb_device(3, 1, (5,))
+        changes = self._refresh(multi, (self.devices[0], new_device))
+        self.assertEqual(changes, {"added": 1, "removed": 2})
+        self.assertIs(multi.mcas[0], kept)
+        self.assertEqual([mca._usb_device for mca in multi.mcas], [self.devices[0], new_device])
+        self.assertEqual([mca.device_index for mca in multi.mcas], [1, 2])
+        self.assertEqual(kept.log_prefix, "[Amptek MCA 1]")
+        self.assertEqual(multi.device_count, 2)
+        self.assertEqual(multi._indexed_mcas, tuple(enumerate(multi.mcas)))
+        self.assertEqual(multi._dispatch(lambda i, mca: mca._usb_device, parallel=False), {0: self.devices[0], 1: new_device})
+        for mca in removed:
+            mca.disconnect.assert_called_once_with()
+        kept.disconnect.assert_not_called()
+
+    def test_rescan_resizes_running_pool(self):
+        multi = self._discover()
+        multi._pool = old_pool = multi._create_pool()
+        self.addCleanup(multi._shutdown_pool)
+        self._refresh(multi, self.devices + (_usb_device(3, 1, (5,)),))
+        self.assertIsNot(multi._pool, old_pool)
+        self.assertEqual(multi._pool._max_workers, 3)
+        self.assertEqual(multi._dispatch(lambda i, mca: mca.device_index, parallel=True), {0: 1, 1: 2, 2: 3, 3: 4})
+
+    def test_device_paths_limit_rescan(self):
+        multi = self._discover(["2-4"])
+        changes = self._refresh(multi, self.devices + (_usb_device(3, 1, (5,)),))
+        self.assertEqual(changes, {"added": 0, "removed": 0})
+        self.assertEqual([mca._usb_device for mca in multi.mcas], [self.devices[0]])
+
+
+class DispatchTest(unittest.TestCase):
+
+    def _check_broadcast(self, multi, parallel):
+        br = multi.broadcast("echo", "x", parallel=parallel)
+        self.assertEqual(list(br), [0, 1, 2, 3])
+        self.assertEqual(br[0], {"ok": True, "result": "x", "error": None})
+        self.assertEqual(br[1], {"ok": False, "result": None, "error": "device failed"})
+        self.assertEqual(br[2], {"ok": True, "result": "x", "error": None})
+        self.assertEqual(br[3], {"ok": True, "result": "x", "error": None})
+
+        filtered = multi.broadcast("echo", "y", device_type="DP5", parallel=parallel)
+        self.assertEqual([v["ok"] for v in filtered.values()], [None, None, True, None])
+
+        missing = multi.broadcast("no_such_method", parallel=parallel)
+        self.assertTrue(all(v["ok"] is False and "no_such_method" in v["error"] for v in missing.values()))
+
+    def _devices(self):
+        return [FakeMCA(), FakeMCA(error=AmptekMCAError("device failed")), FakeMCA(model="DP5"), FakeMCA()]
+
+    def test_sequential(self):
+        self._check_broadcast(_make_multi(self._devices()), parallel=False)
+
+    def test_parallel_on_pool(self):
+        multi = _make_multi(self._devices(), connect=True)
+        try:
+            self._check_broadcast(multi, parallel=True)
+        finally:
+            multi._shutdown_pool()
+
+    def test_parallel_without_pool(self):
+        multi = _make_multi(self._devices())
+        self._check_broadcast(multi, parallel=True)
+        self.assertIsNone(multi._pool)
+
+    def test_parallel_order_with_uneven_durations(self):
+        multi = _make_multi([FakeMCA() for _ in range(4)], connect=True)
+        try:
+            delays = {0: 0.0, 1: 0.15, 2: 0.1, 3: 0.0}
+            results = multi._dispatch(lambda i, mca: (i, mca.echo(i, delays[i])), parallel=True)
+        finally:
+            multi._shutdown_pool()
+        self.assertEqual(list(results.items()), [(i, (i, i)) for i in range(4)])
+
+
+class AsyncApiTest(unittest.TestCase):
+
+    def test_abroadcast_gathers_results_and_errors(self):
+        multi = _make_multi([FakeMCA(), FakeMCA(error=AmptekMCAError("device failed")), FakeMCA(model="DP5")])
+        br = asyncio.run(multi.abroadcast("echo", "x"))
+        self.assertEqual(br, {
+            0: {"ok": True, "result": "x", "error": None},
+            1: {"ok": False, "result": None, "error": "device failed"},
+            2: {"ok": True, "result": "x", "error": None},
+        })
+        filtered = asyncio.run(multi.abroadcast("echo", "y", device_type="DP5"))
+        self.assertEqual([v["ok"] for v in filtered.values()], [None, None, True])
+        self.assertEqual(asyncio.run(multi.aclear_spectrum()), {0: True, 1: False, 2: True})
+
+    def test_abroadcast_runs_devices_concurrently(self):
+        multi = _make_multi([FakeMCA() for _ in range(4)])
+        start = time.monotonic()
+        br = asyncio.run(multi.abroadcast("echo", "x", delay=0.2))
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertTrue(all(v["ok"] for v in br.values()))
+
+    def test_async_with_connects_and_disconnects(self):
+        devices = [FakeMCA(), FakeMCA()]
+        multi = _make_multi(devices)
+
+        async def _session():
+            async with multi as entered:
+                self.assertIs(entered, multi)
+                self.assertIsNotNone(multi._pool)
+                return [mca.connected for mca in devices]
+
+        self.assertEqual(asyncio.run(_session()), [True, True])
+        self.assertEqual([mca.connected for mca in devices], [False, False])
+        self.assertIsNone(multi._pool)
+
+    def test_await_until_mca_is_closed(self):
+        devices = [_open_mca(), _open_mca()]
+        for mca in devices:
+            enabled = mca.get_status_record.return_value
+            mca.get_status_record.side_effect = [enabled, enabled._replace(status_flags={"mca_enabled": False})]
+        multi = _make_multi(devices)
+        results = asyncio.run(multi.await_until_mca_is_closed(0.01, poll_backoff_min=0.01, poll_backoff_base=1))
+        self.assertEqual(results, {0: True, 1: True})
+
+
+class GetSpectrumStackedTest(unittest.TestCase):
+
+    def test_rows_are_zero_padded(self):
+        multi = _make_multi([
+            FakeMCA(spectrum=_counts_bytes([1, 2, 3, 4])),
+            FakeMCA(spectrum=_counts_bytes([0xFFFFFF, 5])),
+            FakeMCA(error=AmptekMCAError("failed")),
+        ])
+        view = multi.get_spectrum_stacked()
+        self.assertEqual(view.shape, (3, 4))
+        self.assertEqual(view.tolist(), [[1, 2, 3, 4], [0xFFFFFF, 5, 0, 0], [0, 0, 0, 0]])
+
+    def test_no_channels_returns_empty_view(self):
+        for devices in ([], [FakeMCA(error=AmptekMCAError("failed")), FakeMCA(spectrum=b'')]):
+            view = _make_multi(devices).get_spectrum_stacked()
+            self.assertEqual(view.format, 'I')
+            self.assertEqual(view.shape, (0,))
+
+    def test_truncated_payload_gives_zero_row(self):
+        multi = _make_multi([
+            FakeMCA(spectrum=_counts_bytes([7, 8]) + b'\x01\x02'),
+            FakeMCA(spectrum=_counts_bytes([9, 10, 11])),
+        ])
+        view = multi.get_spectrum_stacked()
+        self.assertEqual(view.tolist(), [[0, 0, 0], [9, 10, 11]])
+
+
+class AcquireTest(unittest.TestCase):
+
+    class Device:
+        """Records its acquisition calls in a shared list; raises AmptekMCAError from the method named by fail."""
+
+        def __init__(self, idx, calls, fail=None):
+            self.idx, self.calls, self.fail = idx, calls, fail
+
+        def _call(self, name, result=None):
+            self.calls.append((name, self.idx))
+            if name == self.fail:
+                raise AmptekMCAError(f"{name} failed")
+            return result
+
+        def clear_spectrum(self):
+            self._call("clear_spectrum")
+
+        def enable_mca(self):
+            self._call("enable_mca")
+
+        def get_spectrum(self):
+            return self._call("get_spectrum", f"spectrum {self.idx}")
+
+        def disable_mca(self):
+            self._call("disable_mca")
+
+    def setUp(self):
+        self.calls = []
+        patch = mock.patch.object(multi_amptek_mca.time, "sleep", side_effect=lambda sec: self.calls.append(("sleep", sec)))
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def _multi(self, failures):
+        multi = _make_multi([self.Device(idx, self.calls, fail) for idx, fail in enumerate(failures)], connect=True)
+        self.addCleanup(multi._shutdown_pool)
+        return multi
+
+    def test_call_order(self):
+        for clear in (True, False):
+            with self.subTest(clear=clear):
+                del self.calls[:]
+                results = self._multi([None, None, None]).acquire(2.5, clear=clear)
+                self.assertEqual(results, {0: "spectrum 0", 1: "spectrum 1", 2: "spectrum 2"})
+                self.assertEqual(self.calls.count(("sleep", 2.5)), 1)
+                sleep = self.calls.index(("sleep", 2.5))
+                start = ["clear_spectrum", "enable_mca"] if clear else ["enable_mca"]
+                for idx in range(3):
+                    self.assertEqual([name for name, i in self.calls[:sleep] if i == idx], start)
+                    self.assertEqual([name for name, i in self.calls[sleep + 1:] if i == idx], ["get_spectrum", "disable_mca"])
+
+    def test_per_device_failures(self):
+        multi = self._multi([None, "enable_mca", "get_spectrum", None])
+        with self.assertLogs(multi.logger, logging.ERROR) as logs:
+            results = multi.acquire(2.5)
+        self.assertEqual(results, {0: "spectrum 0", 1: None, 2: None, 3: "spectrum 3"})
+        # A device that failed to start is not read back; the others are unaffected
+        self.assertNotIn(("get_spectrum", 1), self.calls)
+        self.assertIn(("disable_mca", 3), self.calls)
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn("starting acquisition on device 1: enable_mca failed", logs.output[0])
+        self.assertIn("finishing acquisition on device 2: get_spectrum failed", logs.output[1])
+
+
+class WaitUntilMcaIsClosedTest(unittest.TestCase):
+
+    def test_stop_from_another_thread(self):
+        multi = _make_multi([_open_mca(), _open_mca()], connect=True)
+        try:
+            timer = threading.Timer(0.2, multi.stop_wait)
+            timer.start()
+            start = time.monotonic()
+            results = multi.wait_until_mca_is_closed(
+                time_between_checks=5, poll_backoff_min=5, poll_backoff_base=1, timeout_factor=None)
+            timer.join()
+        finally:
+            multi._shutdown_pool()
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(results, {0: False, 1: False})
+        self.assertFalse(multi._wait_stop.is_set())
+        self.assertFalse(any(mca._wait_stop.is_set() for mca in multi.mcas))
+
+    def test_stop_without_running_wait_is_discarded(self):
+        devices = [_open_mca(), _open_mca()]
+        multi = _make_multi(devices)
+        self.assertFalse(multi.stop_wait())
+        self.assertFalse(multi._wait_stop.is_set())
+        for mca in devices:
+            enabled = mca.get_status_record.return_value
+            mca.get_status_record.side_effect = [enabled, enabled, enabled._replace(status_flags={"mca_enabled": False})]
+        results = multi.wait_until_mca_is_closed(time_between_checks=0.01, poll_backoff_min=0.01, poll_backoff_base=1)
+        self.assertEqual(results, {0: True, 1: True})
+        self.assertEqual([mca.get_status_record.call_count for mca in devices], [3, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()